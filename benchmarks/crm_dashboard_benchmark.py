@@ -0,0 +1,142 @@
+"""Benchmark: resumen del dashboard CRM con seis queries secuenciales, un solo SELECT y `crm_counters`.
+
+Requiere PostgreSQL con las migraciones aplicadas (usa la configuración de `.env`). Los datos se generan dentro de
+una transacción que se revierte al final, así que no deja filas en la base.
+
+Uso: python -m benchmarks.crm_dashboard_benchmark [--rows 10000 100000 1000000] [--repeat 20] [--scope ORGANIZATION]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import func, select, text
+
+from server.db.session import engine
+from server.models.orm.opportunity_orm import OpportunityORM
+from server.repositories.crm_counter_repository import CRMCounterRepository
+from server.repositories.crm_dashboard_repository import CLOSED_STAGES, CRMDashboardRepository
+
+# Columnas obligatorias de cada tabla; `id`, organización, equipo, dueño y timestamps se agregan al generar
+GENERATED_COLUMNS = {
+    "crm_companies": "name",
+    "crm_contacts": "name, lastname",
+    "crm_leads": "name",
+    "crm_opportunities": "name, value, stage",
+    "crm_activities": "activity_type, subject",
+}
+GENERATED_VALUES = {
+    "crm_companies": "'company ' || n",
+    "crm_contacts": "'contact', 'n' || n",
+    "crm_leads": "'lead ' || n",
+    "crm_opportunities": "'deal ' || n, (n % 1000)::numeric, (ARRAY['qualified','proposal','won','lost'])[1 + n % 4]",
+    "crm_activities": "'call', 'activity ' || n",
+}
+
+
+async def seed(conn, organization_id, team_ids, owner_id, start: int, stop: int) -> None:
+    for table, columns in GENERATED_COLUMNS.items():
+        await conn.execute(
+            text(f"""
+                INSERT INTO {table} (id, organization_id, team_id, owner_id, {columns}, created_at, updated_at)
+                SELECT gen_random_uuid(), CAST(:organization_id AS uuid), (CAST(:team_ids AS uuid[]))[1 + n % 4],
+                       CASE WHEN n % 10 = 0 THEN CAST(:owner_id AS uuid) END, {GENERATED_VALUES[table]}, now(), now()
+                FROM generate_series(:start, :stop - 1) AS n
+            """),
+            {
+                "organization_id": organization_id,
+                "team_ids": team_ids,
+                "owner_id": owner_id,
+                "start": start,
+                "stop": stop,
+            },
+        )
+        await conn.execute(text(f"ANALYZE {table}"))
+
+
+async def legacy_summarize(conn, repository, organization_id, access) -> dict:
+    """Implementación anterior: un COUNT por modelo más la suma del pipeline, en viajes separados."""
+    result = {}
+    for key, model in repository.models.items():
+        stmt = select(func.count(model.id)).where(model.organization_id == organization_id)
+        result[key] = (await conn.execute(repository.apply_scope(stmt, model, access))).scalar_one()
+    pipeline = select(func.coalesce(func.sum(OpportunityORM.value), 0)).where(
+        OpportunityORM.organization_id == organization_id, OpportunityORM.stage.notin_(CLOSED_STAGES)
+    )
+    pipeline = repository.apply_scope(pipeline, OpportunityORM, access)
+    result["pipelineValue"] = str((await conn.execute(pipeline)).scalar_one())
+    return result
+
+
+async def single_summarize(conn, repository, organization_id, access) -> dict:
+    row = (await conn.execute(repository.summary_statement(organization_id, access))).mappings().one()
+    return {**{key: row[key] for key in repository.models}, "pipelineValue": str(row["pipelineValue"])}
+
+
+async def counter_summarize(conn, repository, organization_id, access) -> dict:
+    rows = (await conn.execute(repository.counters_statement(organization_id, access))).all()
+    return repository.counters_summary(rows)
+
+
+async def measure(summarize, repeat: int, *args) -> tuple[float, dict]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        result = await summarize(*args)
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings), result
+
+
+async def main(rows: list[int], repeat: int, scope: str) -> None:
+    repository = CRMDashboardRepository()
+    organization_id = uuid.uuid4()
+    team_ids = [uuid.uuid4() for _ in range(4)]
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            owner_id = (await conn.execute(text("SELECT id FROM users LIMIT 1"))).scalar()
+            await conn.execute(
+                text("INSERT INTO crm_organizations VALUES (:id, 'benchmark', :slug, now(), now())"),
+                {"id": organization_id, "slug": f"benchmark-{organization_id}"},
+            )
+            for team_id in team_ids:
+                await conn.execute(
+                    text(
+                        "INSERT INTO crm_teams (id, organization_id, name, created_at, updated_at) "
+                        "VALUES (:id, :organization_id, :name, now(), now())"
+                    ),
+                    {"id": team_id, "organization_id": organization_id, "name": f"team-{team_id}"},
+                )
+            access = {"scope": scope, "user_id": owner_id, "team_id": team_ids[0]}
+            print(f"alcance: {scope}, repeticiones: {repeat}")
+            seeded = 0
+            for target in sorted(rows):
+                await seed(conn, organization_id, team_ids, owner_id, seeded, target)
+                seeded = target
+                await CRMCounterRepository().rebuild(organization_id, conn)
+                args = (conn, repository, organization_id, access)
+                legacy, legacy_result = await measure(legacy_summarize, repeat, *args)
+                single, single_result = await measure(single_summarize, repeat, *args)
+                counters, counters_result = await measure(counter_summarize, repeat, *args)
+                results = (legacy_result, single_result, counters_result)
+                assert legacy_result == single_result == counters_result, results
+                print(
+                    f"{target:>9} filas/tabla  secuencial: {legacy * 1000:8.2f} ms  "
+                    f"un SELECT: {single * 1000:8.2f} ms  contadores: {counters * 1000:8.2f} ms  "
+                    f"mejora: x{legacy / single:.2f} / x{legacy / counters:.2f}"
+                )
+        finally:
+            await transaction.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--scope", choices=["OWN", "TEAM", "ORGANIZATION"], default="ORGANIZATION")
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.repeat, arguments.scope))
@@ -0,0 +1,39 @@
+"""Micro-benchmark: verificación de permisos normalizando en cada llamada vs. con el set compilado.
+
+Uso: python -m benchmarks.permission_checks_benchmark
+"""
+
+import timeit
+
+from server.utils.permission_utils import compile_permissions, has_permission, permission_set
+
+MODULES = ["users", "roles", "permissions", "projects", "tasks", "companies", "contacts", "deals", "activities"]
+ACTIONS = ["create", "read", "update", "delete", "assign"]
+PERMISSIONS = [{"type": module.title(), "action": action.upper()} for module in MODULES for action in ACTIONS]
+CHECKS = [("deals", "update"), ("roles", "read"), ("audit_logs", "read")]
+NUMBER = 20_000
+
+
+def legacy_check() -> None:
+    for module, action in CHECKS:
+        (module, action) in permission_set(PERMISSIONS)
+
+
+def compiled_check() -> None:
+    for module, action in CHECKS:
+        has_permission(PERMISSIONS, module, action)
+
+
+def main() -> None:
+    compile_permissions(PERMISSIONS)
+    legacy = min(timeit.repeat(legacy_check, number=NUMBER, repeat=3))
+    compiled = min(timeit.repeat(compiled_check, number=NUMBER, repeat=3))
+    per_check = NUMBER * len(CHECKS)
+    print(f"permisos por principal: {len(PERMISSIONS)}, verificaciones: {per_check}")
+    print(f"normalizando por llamada: {legacy / per_check * 1e6:.3f} µs/verificación")
+    print(f"set compilado:           {compiled / per_check * 1e6:.3f} µs/verificación")
+    print(f"mejora: x{legacy / compiled:.1f}")
+
+
+if __name__ == "__main__":
+    main()
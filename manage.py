@@ -1,5 +1,6 @@
 import argparse
 import asyncio
+import json
 
 from server.config.settings import settings
 from server.helpers.logger_helper import LoggerHelper
@@ -63,6 +64,65 @@ async def _run_seed_all():
     await seed_all()
 
 
+async def _run_rebuild_crm_counters(organization_id: str | None):
+    from server.repositories.crm_counter_repository import CRMCounterRepository
+
+    rebuilt = await CRMCounterRepository().rebuild(organization_id)
+    target = f"organización {organization_id}" if organization_id else "todas las organizaciones"
+    LoggerHelper.info(f"Contadores CRM reconstruidos ({target}): {rebuilt} filas.")
+
+
+async def _run_index_advisor(min_rows: int):
+    from server.db.session import engine
+    from server.repositories.index_advisor import run_index_advisor
+
+    async with engine.connect() as conn:
+        reports = await run_index_advisor(conn, min_rows)
+    await engine.dispose()
+    for report in reports:
+        LoggerHelper.info(
+            f"{report.name}: {report.execution_ms:.2f} ms, "
+            f"buffers hit={report.shared_hit_blocks} read={report.shared_read_blocks}"
+        )
+        for finding in report.findings:
+            relation = f" en {finding.relation}" if finding.relation else ""
+            LoggerHelper.warning(f"  {finding.node}{relation}: {finding.detail}")
+    flagged = sum(1 for report in reports if report.findings)
+    LoggerHelper.info(f"Consultas analizadas: {len(reports)}, con Seq Scan o Sort: {flagged}")
+
+
+async def _run_slow_queries(limit: int):
+    from server.helpers.redis_helper import RedisHelper
+    from server.helpers.slow_query_log_helper import SlowQueryLogHelper
+
+    entries = await SlowQueryLogHelper().recent(limit)
+    await RedisHelper().close()
+    for entry in entries:
+        operation = entry["operation"] or "sin operación"
+        LoggerHelper.warning(f"{entry['capturedAt']} {entry['durationMs']} ms {operation}: {entry['statement']}")
+        if entry.get("parameters"):
+            LoggerHelper.info(f"  parámetros: {entry['parameters']}")
+        if entry.get("plan"):
+            LoggerHelper.info(f"  plan: {json.dumps(entry['plan'], indent=2)}")
+    LoggerHelper.info(f"Consultas lentas registradas: {len(entries)}")
+
+
+async def _run_audit_partitions(drop: bool):
+    from server.db.session import engine
+    from server.repositories.audit_partitions import manage_partitions, partition_name
+
+    async with engine.begin() as conn:
+        plan = await manage_partitions(
+            conn, settings.AUDIT_PARTITION_MONTHS_AHEAD, settings.AUDIT_RETENTION_MONTHS, drop=drop
+        )
+    await engine.dispose()
+    for month in plan.create:
+        LoggerHelper.info(f"Partición creada: {partition_name(month)}")
+    for month in plan.expire:
+        LoggerHelper.warning(f"Partición {'eliminada' if drop else 'separada'}: {partition_name(month)}")
+    LoggerHelper.info(f"Particiones de audit_logs: {len(plan.create)} creadas, {len(plan.expire)} vencidas")
+
+
 async def _run_status():
     from sqlalchemy import text
 
@@ -107,9 +167,21 @@ def main():
             "seed-users",
             "seed-all",
             "status",
+            "rebuild-crm-counters",
+            "index-advisor",
+            "slow-queries",
+            "audit-partitions",
         ],
         help="Comando a ejecutar",
     )
+    parser.add_argument("--organization-id", help="Limita rebuild-crm-counters a una organización")
+    parser.add_argument(
+        "--min-rows", type=int, default=1000, help="index-advisor: ignora los Seq Scan que leen menos filas"
+    )
+    parser.add_argument("--limit", type=int, default=20, help="slow-queries: cantidad de entradas a mostrar")
+    parser.add_argument(
+        "--drop", action="store_true", help="audit-partitions: elimina las particiones vencidas en lugar de separarlas"
+    )
     args = parser.parse_args()
 
     if args.command == "migrate":
@@ -135,6 +207,14 @@ def main():
         asyncio.run(_run_seed_all())
     elif args.command == "status":
         asyncio.run(_run_status())
+    elif args.command == "rebuild-crm-counters":
+        asyncio.run(_run_rebuild_crm_counters(args.organization_id))
+    elif args.command == "index-advisor":
+        asyncio.run(_run_index_advisor(args.min_rows))
+    elif args.command == "slow-queries":
+        asyncio.run(_run_slow_queries(args.limit))
+    elif args.command == "audit-partitions":
+        asyncio.run(_run_audit_partitions(args.drop))
 
 
 if __name__ == "__main__":
@@ -8,7 +8,7 @@ from ariadne.types import ExecutionResult
 from fastapi import FastAPI, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse, JSONResponse
-from graphql import parse
+from graphql import GraphQLError, OperationType
 from graphql import subscribe as graphql_subscribe
 from starlette.background import BackgroundTasks
 
@@ -30,10 +30,26 @@ def _parse_ws_cookies(websocket: WebSocket) -> dict[str, str]:
     return {key: morsel.value for key, morsel in cookie.items()}
 
 
+def _parse_graphql_query_params(query_params) -> dict:
+    from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+
+    data = {"query": query_params.get("query"), "operationName": query_params.get("operationName")}
+    for key in ("variables", "extensions"):
+        raw_value = query_params.get(key)
+        if not raw_value:
+            continue
+        try:
+            data[key] = json.loads(raw_value)
+        except ValueError as exc:
+            raise CustomGraphQLExceptionHelper(f"El parámetro {key} debe ser JSON válido") from exc
+    return {key: value for key, value in data.items() if value is not None}
+
+
 async def _build_ws_auth_context(websocket: WebSocket, payload: dict | None = None) -> dict:
     from server.config.settings import settings
     from server.services.user_service import UserService
     from server.utils.auth_utils import verify_token
+    from server.utils.principal_utils import resolve_principal_once
 
     payload = payload or {}
     connection_headers = payload.get("headers") or {}
@@ -72,12 +88,15 @@ async def _build_ws_auth_context(websocket: WebSocket, payload: dict | None = No
     if not access_token:
         return context
 
-    token_payload = verify_token(access_token)
-    user_id = token_payload.get("id")
-    if not user_id:
-        raise ValueError("Token inválido: no contiene id de usuario")
+    async def load_user():
+        token_payload = verify_token(access_token)
+        user_id = token_payload.get("id")
+        if not user_id:
+            raise ValueError("Token inválido: no contiene id de usuario")
+        return await UserService().get_user(user_id)
 
-    user = await UserService().get_user(user_id)
+    # El memo queda en el contexto de la conexión y lo reutiliza @require_token en cada operación
+    user = await resolve_principal_once(context, access_token, load_user)
     if not user:
         raise ValueError("Usuario no encontrado para la conexión WebSocket")
 
@@ -89,17 +108,25 @@ def create_app() -> FastAPI:
     from server.api import api_v1_router
     from server.config.settings import settings
     from server.core.lifespan import lifespan
+    from server.db.operation_deadline import operation_deadline
+    from server.db.query_stats import track_queries
+    from server.db.session import unit_of_work
     from server.enums.http_error_code_enum import HTTPErrorCode
     from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+    from server.helpers.graphql_document_cache_helper import GraphQLDocumentCacheHelper
     from server.helpers.logger_helper import LoggerHelper
     from server.helpers.mail_helper import MailHelper
+    from server.helpers.persisted_query_helper import PERSISTED_QUERY_NOT_FOUND, PersistedQueryHelper
     from server.helpers.template_helper import TemplateHelper
     from server.middlewares.cookie_logging_middleware import CookieLoggingMiddleware
+    from server.middlewares.query_stats_middleware import QueryStatsMiddleware, report_query_stats
     from server.middlewares.ws_logger_middleware import WSLoggerMiddleware
     from server.schema import schema
     from server.utils.custom_error_formatter_utils import custom_format_error
 
     app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, lifespan=lifespan)
+    document_cache = GraphQLDocumentCacheHelper()
+    persisted_queries = PersistedQueryHelper()
 
     @app.exception_handler(CustomGraphQLExceptionHelper)
     async def rest_exception_handler(_request: Request, exc: CustomGraphQLExceptionHelper):
@@ -116,6 +143,7 @@ def create_app() -> FastAPI:
     # Middleware de logging de cookies
     app.add_middleware(CookieLoggingMiddleware)
     app.add_middleware(WSLoggerMiddleware)
+    app.add_middleware(QueryStatsMiddleware)
 
     # CORS
     app.add_middleware(
@@ -137,29 +165,59 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "Ok", "message": "Pong"}
 
-    @app.get("/graphql")
-    async def graphql_explorer():
-        return HTMLResponse(explorer_html)
+    async def execute_graphql(
+        data: dict,
+        request: Request,
+        response: Response,
+        background_tasks: BackgroundTasks,
+        require_query: bool = False,
+    ) -> Response:
+        try:
+            data = await persisted_queries.resolve(data)
+        except CustomGraphQLExceptionHelper as exc:
+            response.status_code = 200 if exc.code == PERSISTED_QUERY_NOT_FOUND else exc.status_code
+            response.body = json.dumps({"errors": [exc.to_dict()]}).encode()
+            return response
 
-    # GraphQL endpoint
-    @app.post("/graphql")
-    async def graphql_server(request: Request, response: Response, background_tasks: BackgroundTasks):
-        data = await request.json()
         operation_name = data.get("operationName", "unnamed")
 
         LoggerHelper.info(f"GraphQL operation: {operation_name}")
 
-        success, result = await graphql(
-            schema,
-            data,
-            context_value={
-                "request": request,
-                "response": response,
-                "background_tasks": background_tasks,  # 👈 aquí
-            },
-            debug=app.debug,
-            error_formatter=custom_format_error,
+        # Una sola sesión por operación: las mutations hacen un commit al final, las queries son de solo lectura
+        query = data.get("query")
+        operation_type = (
+            document_cache.operation_type(schema, query, data.get("operationName")) if isinstance(query, str) else None
         )
+        label = f"graphql {operation_name}"
+        with track_queries(label) as query_stats:
+            try:
+                async with unit_of_work(read_only=operation_type is not OperationType.MUTATION) as uow:
+                    # El deadline cancela el árbol de resolvers; el unit of work hace rollback y libera la conexión
+                    async with operation_deadline(label):
+                        success, result = await graphql(
+                            schema,
+                            data,
+                            context_value={
+                                "request": request,
+                                "response": response,
+                                "background_tasks": background_tasks,  # 👈 aquí
+                            },
+                            query_parser=document_cache.query_parser(schema),
+                            query_validator=document_cache.query_validator,
+                            require_query=require_query,
+                            debug=app.debug,
+                            error_formatter=custom_format_error,
+                        )
+                    if not success or result.get("errors"):
+                        uow.mark_rollback()
+            except CustomGraphQLExceptionHelper as exc:
+                if exc.code != HTTPErrorCode.OPERATION_TIMEOUT.code_name:
+                    raise
+                success = False
+                result = {"data": None, "errors": [custom_format_error(GraphQLError(exc.message, original_error=exc))]}
+        report_query_stats(query_stats)
+        if settings.SQL_QUERY_STATS_EXTENSION:
+            result.setdefault("extensions", {})["sqlQueries"] = query_stats.to_dict()
 
         status_code = 200 if success else HTTPErrorCode.BAD_REQUEST.status_code
 
@@ -177,6 +235,27 @@ def create_app() -> FastAPI:
         response.body = json.dumps(result).encode()
         return response
 
+    @app.get("/graphql")
+    async def graphql_get(request: Request, response: Response, background_tasks: BackgroundTasks):
+        if "query" not in request.query_params and "extensions" not in request.query_params:
+            return HTMLResponse(explorer_html)
+
+        data = _parse_graphql_query_params(request.query_params)
+        response = await execute_graphql(data, request, response, background_tasks, require_query=True)
+
+        response.headers["Vary"] = "Authorization, Cookie"
+        if settings.GRAPHQL_GET_CACHE_MAX_AGE > 0 and response.status_code == 200:
+            has_credentials = "authorization" in request.headers or settings.ACCESS_COOKIE_NAME in request.cookies
+            visibility = "private" if has_credentials else "public"
+            response.headers["Cache-Control"] = f"{visibility}, max-age={settings.GRAPHQL_GET_CACHE_MAX_AGE}"
+        return response
+
+    # GraphQL endpoint
+    @app.post("/graphql")
+    async def graphql_server(request: Request, response: Response, background_tasks: BackgroundTasks):
+        data = await request.json()
+        return await execute_graphql(data, request, response, background_tasks)
+
     @app.websocket("/graphql")
     async def graphql_websocket(websocket: WebSocket):
         """GraphQL WebSocket subscriptions (graphql-transport-ws protocol)"""
@@ -185,7 +264,8 @@ def create_app() -> FastAPI:
         ws_context = None
 
         try:
-            ws_context = await _build_ws_auth_context(websocket)
+            async with unit_of_work(read_only=True):
+                ws_context = await _build_ws_auth_context(websocket)
 
             while True:
                 data = await websocket.receive_json()
@@ -194,7 +274,8 @@ def create_app() -> FastAPI:
 
                 if msg_type == "connection_init":
                     try:
-                        ws_context = await _build_ws_auth_context(websocket, data.get("payload"))
+                        async with unit_of_work(read_only=True):
+                            ws_context = await _build_ws_auth_context(websocket, data.get("payload"))
                         await websocket.send_json({"type": "connection_ack"})
                         LoggerHelper.info("Sent connection_ack")
                     except Exception as auth_error:
@@ -212,16 +293,26 @@ def create_app() -> FastAPI:
                         variables = payload.get("variables", {})
                         operation_name = payload.get("operationName")
 
-                        document = parse(query_string)
+                        cached_document = document_cache.get(schema, query_string)
+                        if cached_document.errors:
+                            await websocket.send_json(
+                                {
+                                    "id": sub_id,
+                                    "type": "error",
+                                    "payload": [{"message": err.message} for err in cached_document.errors],
+                                }
+                            )
+                            continue
 
                         # 🔥 FIX: primero await
-                        result = await graphql_subscribe(
-                            schema,
-                            document,
-                            variable_values=variables,
-                            operation_name=operation_name,
-                            context_value=ws_context,
-                        )
+                        async with unit_of_work(read_only=True):
+                            result = await graphql_subscribe(
+                                schema,
+                                cached_document.document,
+                                variable_values=variables,
+                                operation_name=operation_name,
+                                context_value=ws_context,
+                            )
 
                         # 🔥 Si hay error inmediato (no subscription válida)
                         if isinstance(result, ExecutionResult):
@@ -235,7 +326,13 @@ def create_app() -> FastAPI:
                             continue
 
                         # 🔥 Ahora sí es async iterable
-                        async for item in result:
+                        # Cada evento resuelve sus campos dentro de su propio unit of work de solo lectura
+                        while True:
+                            async with unit_of_work(read_only=True):
+                                try:
+                                    item = await anext(result)
+                                except StopAsyncIteration:
+                                    break
                             await websocket.send_json(
                                 {
                                     "id": sub_id,
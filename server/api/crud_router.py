@@ -3,8 +3,14 @@ import uuid
 from fastapi import APIRouter, Depends, status
 from pydantic import create_model as create_pydantic_model
 
-from server.api.dependencies import require_rest_permission
-from server.api.responses import api_response
+from server.api.dependencies import (
+    ensure_rest_permission,
+    get_current_user,
+    list_query_params,
+    require_rest_permission,
+)
+from server.api.responses import api_page_response, api_response
+from server.models.dto.list_query_dto import ListQueryModel
 from server.services.authorization_service import AuthorizationService
 
 
@@ -16,14 +22,24 @@ def build_scoped_crud_router(module, service, create_dto, update_dto) -> APIRout
         __base__=update_dto,
         id=(uuid.UUID | None, None),
     )
+    bulk_body_model = create_pydantic_model(
+        f"Bulk{module.title()}Body",
+        create=(list[create_dto], []),
+        update=(list[update_dto], []),
+        delete=(list[uuid.UUID], []),
+    )
 
     @router.get("")
     async def list_resources(
         organization_id: str,
+        limit: int | None = None,
+        cursor: str | None = None,
+        list_query: ListQueryModel | None = Depends(list_query_params),
         user: dict = Depends(require_rest_permission(module, "read")),
     ):
         access = await authorization.resolve_access(user, organization_id)
-        return api_response(await service.get_all(organization_id, access), f"{module} fetched")
+        connection = await service.get_page(organization_id, access, first=limit, after=cursor, list_query=list_query)
+        return api_page_response(connection, f"{module} fetched")
 
     @router.get("/{resource_id}")
     async def get_resource(resource_id: str, user: dict = Depends(require_rest_permission(module, "read"))):
@@ -43,6 +59,41 @@ def build_scoped_crud_router(module, service, create_dto, update_dto) -> APIRout
         await authorization.authorize_or_raise(user, module, "create", resource_context)
         return api_response(await service.create(payload), f"{module} resource created", 201)
 
+    @router.post("/bulk")
+    async def bulk_resources(payload: bulk_body_model, user: dict = Depends(get_current_user)):
+        """Crea, actualiza y elimina en lote dentro de una sola transacción; autoriza una vez por alcance."""
+        for action in ("create", "update", "delete"):
+            if getattr(payload, action):
+                ensure_rest_permission(user, module, action)
+        result = {"created": [], "updated": [], "deleted": []}
+        if payload.create:
+            service.check_bulk_size(payload.create)
+            accesses = {}
+            for item in payload.create:
+                if item.organization_id not in accesses:
+                    accesses[item.organization_id] = await authorization.resolve_access(user, item.organization_id)
+                access = accesses[item.organization_id]
+                if item.owner_id is None:
+                    item.owner_id = uuid.UUID(str(user["id"]))
+                if item.team_id is None and access.get("team_id"):
+                    item.team_id = uuid.UUID(str(access["team_id"]))
+            resources = [item.model_dump(by_alias=True, mode="json", exclude_none=True) for item in payload.create]
+            await authorization.authorize_scopes_or_raise(user, module, "create", resources)
+            result["created"] = await service.create_many(payload.create)
+        for action, ids in (("update", [item.id for item in payload.update]), ("delete", payload.delete)):
+            if not ids:
+                continue
+            service.check_bulk_size(ids)
+            resources = await service.get_many(ids)
+            if any(resource is None for resource in resources):
+                service.raise_not_found()
+            await authorization.authorize_scopes_or_raise(user, module, action, resources)
+        if payload.update:
+            result["updated"] = await service.update_many(payload.update)
+        if payload.delete:
+            result["deleted"] = await service.delete_many(payload.delete)
+        return api_response(result, f"{module} bulk operation applied")
+
     @router.patch("/{resource_id}")
     async def update_resource(
         resource_id: str,
@@ -1,13 +1,34 @@
-from collections.abc import Callable
+import json
+from collections.abc import AsyncGenerator, Callable
 
 from fastapi import Depends, Request
+from pydantic import ValidationError
 
 from server.config.settings import settings
+from server.db.operation_deadline import operation_deadline
+from server.db.session import unit_of_work
+from server.db.unit_of_work import UnitOfWork
 from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.list_query_dto import ListQueryModel, ListSortModel
 from server.services.user_service import UserService
 from server.utils.auth_utils import verify_token
 from server.utils.permission_utils import has_permission
+from server.utils.principal_utils import resolve_principal_once
+
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def request_unit_of_work(request: Request) -> AsyncGenerator[UnitOfWork, None]:
+    """Una sesión por request: commit único al terminar las escrituras, solo lectura en GET/HEAD/OPTIONS.
+
+    El endpoint corre dentro del deadline de su ruta (`GET /api/v1/tasks/{task_id}`).
+    """
+    route = request.scope.get("route")
+    label = f"{request.method} {route.path if route is not None else request.url.path}"
+    async with unit_of_work(read_only=request.method in READ_ONLY_METHODS) as uow:
+        async with operation_deadline(label):
+            yield uow
 
 
 async def get_current_user(request: Request) -> dict:
@@ -16,8 +37,12 @@ async def get_current_user(request: Request) -> dict:
     token = token or request.cookies.get(settings.ACCESS_COOKIE_NAME)
     if not token:
         raise CustomGraphQLExceptionHelper("Token no proporcionado", HTTPErrorCode.UNAUTHORIZED)
-    payload = verify_token(token)
-    user = await UserService().get_user(payload.get("id")) if payload.get("id") else None
+
+    async def load_user():
+        payload = verify_token(token)
+        return await UserService().get_user(payload.get("id")) if payload.get("id") else None
+
+    user = await resolve_principal_once(request, token, load_user)
     if not user:
         raise CustomGraphQLExceptionHelper("Usuario no encontrado", HTTPErrorCode.UNAUTHORIZED)
     return user
@@ -25,11 +50,26 @@ async def get_current_user(request: Request) -> dict:
 
 def require_rest_permission(module: str, action: str) -> Callable:
     async def dependency(current_user: dict = Depends(get_current_user)) -> dict:
-        permissions = current_user.get("role", {}).get("permissions", [])
-        if not has_permission(permissions, module, action):
-            raise CustomGraphQLExceptionHelper(
-                f"Permiso denegado: se requiere {module}:{action}", HTTPErrorCode.FORBIDDEN
-            )
+        ensure_rest_permission(current_user, module, action)
         return current_user
 
     return dependency
+
+
+def ensure_rest_permission(user: dict, module: str, action: str) -> None:
+    permissions = user.get("role", {}).get("permissions", [])
+    if not has_permission(permissions, module, action):
+        raise CustomGraphQLExceptionHelper(f"Permiso denegado: se requiere {module}:{action}", HTTPErrorCode.FORBIDDEN)
+
+
+def list_query_params(filter: str | None = None, sort: str | None = None) -> ListQueryModel | None:
+    """`?filter={"status":{"eq":"active"}}&sort=-createdAt`: mismos filtros que GraphQL, `-campo` ordena descendente."""
+    if not filter and not sort:
+        return None
+    try:
+        filters = json.loads(filter) if filter else {}
+        if not isinstance(filters, dict):
+            raise ValueError("filter debe ser un objeto JSON")
+        return ListQueryModel(filter=filters, sort=ListSortModel.parse(sort) if sort else None)
+    except (ValueError, ValidationError) as exc:
+        raise CustomGraphQLExceptionHelper(f"Parámetros de lista inválidos: {exc}") from exc
@@ -1,2 +1,6 @@
 def api_response(data=None, message: str = "OK", status: int = 200):
     return {"status": status, "message": message, "data": data}
+
+
+def api_page_response(connection: dict, message: str = "OK", status: int = 200):
+    return {**api_response(connection["nodes"], message, status), "pageInfo": connection["pageInfo"]}
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, Query
 
 from server.api.dependencies import require_rest_permission
@@ -11,6 +13,8 @@ service = AuditLogService()
 @router.get("")
 async def list_audit_logs(
     limit: int = Query(default=100, ge=1, le=500),
+    since: datetime | None = Query(default=None),
+    until: datetime | None = Query(default=None),
     user: dict = Depends(require_rest_permission("activity", "read")),
 ):
-    return api_response(await service.list_logs(limit), "Audit logs fetched")
+    return api_response(await service.list_logs(limit, since=since, until=until), "Audit logs fetched")
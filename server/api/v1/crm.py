@@ -1,17 +1,19 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
 
-from server.api.dependencies import require_rest_permission
-from server.api.responses import api_response
+from server.api.dependencies import get_current_user, require_rest_permission
+from server.api.responses import api_page_response, api_response
 from server.services.authorization_service import AuthorizationService
 from server.services.crm_dashboard_service import CRMDashboardService
 from server.services.crm_organization_service import CRMOrganizationService
+from server.services.crm_search_service import CRMSearchService
 from server.services.crm_team_service import CRMTeamService
 
 router = APIRouter(prefix="/crm", tags=["CRM Administration"])
 authorization = AuthorizationService()
 dashboard_service = CRMDashboardService()
 organization_service = CRMOrganizationService()
+search_service = CRMSearchService()
 team_service = CRMTeamService()
 
 
@@ -40,6 +42,21 @@ async def dashboard(
     return api_response(await dashboard_service.get(organization_id, access), "CRM dashboard fetched")
 
 
+@router.get("/search")
+async def search(
+    organization_id: str,
+    query: str,
+    types: list[str] | None = Query(default=None),
+    limit: int | None = None,
+    cursor: str | None = None,
+    user: dict = Depends(get_current_user),
+):
+    types = search_service.searchable_types(user, types)
+    access = await authorization.resolve_access(user, organization_id)
+    connection = await search_service.search(organization_id, access, query, types, first=limit, after=cursor)
+    return api_page_response(connection, "CRM search results fetched")
+
+
 @router.post("/organizations", status_code=201)
 async def create_organization(
     payload: CreateOrganizationBody,
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from server.api.dependencies import request_unit_of_work
 from server.api.v1 import (
     actions,
     activities,
@@ -19,7 +20,7 @@ from server.api.v1 import (
     users,
 )
 
-api_v1_router = APIRouter(prefix="/api/v1")
+api_v1_router = APIRouter(prefix="/api/v1", dependencies=[Depends(request_unit_of_work)])
 for router in (
     auth.router,
     users.router,
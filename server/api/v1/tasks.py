@@ -3,8 +3,9 @@ import uuid
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel
 
-from server.api.dependencies import require_rest_permission
+from server.api.dependencies import list_query_params, require_rest_permission
 from server.api.responses import api_response
+from server.models.dto.list_query_dto import ListQueryModel
 from server.models.dto.task_dto import CreateTaskModel, UpdateTaskModel
 from server.services.authorization_service import AuthorizationService
 from server.services.task_service import TaskService
@@ -23,10 +24,14 @@ class UpdateTaskBody(UpdateTaskModel):
 
 
 @router.get("")
-async def list_tasks(project_id: str | None = None, user: dict = Depends(require_rest_permission("tasks", "read"))):
+async def list_tasks(
+    project_id: str | None = None,
+    list_query: ListQueryModel | None = Depends(list_query_params),
+    user: dict = Depends(require_rest_permission("tasks", "read")),
+):
     if project_id:
         await authorization.authorize_or_raise(user, "tasks", "read", context={"project_id": project_id})
-    return api_response(await service.get_all(project_id), "Tasks fetched")
+    return api_response(await service.get_all(project_id, list_query), "Tasks fetched")
 
 
 @router.get("/{task_id}")
@@ -53,6 +53,87 @@ class Settings(BaseSettings):
     # ======================
     REDIS_URL: str = "redis://redis:6379/0"
 
+    # ======================
+    # AUTH CACHE
+    # ======================
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+    AUTHORIZATION_CACHE_MAX_SIZE: int = 50000
+    AUTHORIZATION_CACHE_LOCAL_TTL_SECONDS: int = 30
+    AUTHORIZATION_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # ======================
+    # PASSWORD HASHING
+    # ======================
+    PASSWORD_HASH_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
+    # ======================
+    # GRAPHQL
+    # ======================
+    GRAPHQL_DOCUMENT_CACHE_SIZE: int = 512
+    PERSISTED_QUERY_CACHE_SIZE: int = 1024
+    PERSISTED_QUERY_TTL_SECONDS: int = 60 * 60 * 24 * 7
+    GRAPHQL_GET_CACHE_MAX_AGE: int = 0
+
+    # ======================
+    # PAGINATION
+    # ======================
+    PAGINATION_DEFAULT_LIMIT: int = 50
+    PAGINATION_MAX_LIMIT: int = 200
+
+    # ======================
+    # BULK OPERATIONS
+    # ======================
+    BULK_MAX_ITEMS: int = 1000
+
+    # ======================
+    # SQL QUERY STATS
+    # ======================
+    SQL_QUERY_STATS_EXTENSION: bool = False
+    SQL_QUERY_BUDGET_WARNING: int = 0
+
+    # ======================
+    # SLOW QUERY LOG
+    # ======================
+    SLOW_QUERY_THRESHOLD_MS: int = 500
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
+    SLOW_QUERY_BUFFER_SIZE: int = 200
+
+    # ======================
+    # OPERATION DEADLINES
+    # ======================
+    OPERATION_TIMEOUT_MS: int = 10000
+    # {"graphql companies": 3000, "GET /api/v1/companies": 3000}: mismas etiquetas que SQL_QUERY_STATS
+    OPERATION_TIMEOUTS: dict[str, int] = {}
+
+    # ======================
+    # AUDIT LOG SINK
+    # ======================
+    AUDIT_SINK_ENABLED: bool = True
+    AUDIT_SINK_QUEUE_SIZE: int = 10000
+    AUDIT_SINK_BATCH_SIZE: int = 500
+    AUDIT_SINK_FLUSH_INTERVAL_MS: int = 200
+    AUDIT_SINK_OVERFLOW_POLICY: str = "drop_allowed"
+    AUDIT_SINK_SPILL_PATH: str = "var/audit_spill.jsonl"
+
+    # ======================
+    # AUDIT POLICIES
+    # ======================
+    # Se aplica la primera regla que coincida por module/action/status ("*" = cualquiera); sin regla se registra todo
+    AUDIT_POLICIES: list[dict] = [
+        {"status": "denied"},
+        {"action": "read", "status": "success", "aggregateWindowSeconds": 60},
+    ]
+
+    # ======================
+    # AUDIT PARTITIONS
+    # ======================
+    AUDIT_PARTITION_MONTHS_AHEAD: int = 3
+    AUDIT_RETENTION_MONTHS: int = 12
+
     # ======================
     # MAIL
     # ======================
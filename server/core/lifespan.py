@@ -1,20 +1,43 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 
+from server.config.settings import settings
 from server.db.session import engine
+from server.helpers.audit_log_sink_helper import AuditLogSinkHelper
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper
+from server.helpers.graphql_document_cache_helper import GraphQLDocumentCacheHelper
 from server.helpers.logger_helper import LoggerHelper
+from server.helpers.password_hasher_helper import PasswordHasherHelper
+from server.helpers.principal_cache_helper import PrincipalCacheHelper
 from server.helpers.redis_helper import RedisHelper
+from server.services.audit_log_service import AuditLogService
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     LoggerHelper.info("Starting application...")
     LoggerHelper.success("PostgreSQL engine ready")
+    principal_invalidations = asyncio.create_task(PrincipalCacheHelper().listen_invalidations())
+    authorization_invalidations = asyncio.create_task(AuthorizationCacheHelper().listen_invalidations())
+    if settings.AUDIT_SINK_ENABLED:
+        AuditLogService().start_sink()
 
     yield
 
     LoggerHelper.info("Shutting down application...")
+    for listener in (principal_invalidations, authorization_invalidations):
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+    LoggerHelper.info(f"Authorization cache: {AuthorizationCacheHelper().stats()}")
+    # Antes de cerrar el engine: los audit logs pendientes se escriben (o van al spill) al apagar
+    await AuditLogService().stop_sink()
+    LoggerHelper.info(f"Audit log sink: {AuditLogSinkHelper().stats()}")
+    LoggerHelper.info(f"GraphQL document cache: {GraphQLDocumentCacheHelper().stats()}")
+    LoggerHelper.info(f"Password hasher: {PasswordHasherHelper().stats()}")
+    PasswordHasherHelper().shutdown()
     await RedisHelper().close()
     await engine.dispose()
     LoggerHelper.info("Application shutdown complete.")
@@ -1,3 +1,10 @@
-from server.db.session import AsyncSessionLocal, Base, engine, get_async_session_context, get_db_session
+from server.db.session import (
+    AsyncSessionLocal,
+    Base,
+    engine,
+    get_async_session_context,
+    get_db_session,
+    unit_of_work,
+)
 
-__all__ = ["Base", "engine", "AsyncSessionLocal", "get_db_session", "get_async_session_context"]
+__all__ = ["Base", "engine", "AsyncSessionLocal", "get_db_session", "get_async_session_context", "unit_of_work"]
@@ -0,0 +1,77 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy.exc import DBAPIError
+
+from server.config.settings import settings
+from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.logger_helper import LoggerHelper
+
+# SQLSTATE de Postgres al cancelar un statement por `statement_timeout`
+QUERY_CANCELED_SQLSTATE = "57014"
+
+# Instante límite (reloj del event loop) de la operación en curso
+_current_deadline: ContextVar[float | None] = ContextVar("operation_deadline", default=None)
+
+
+def operation_timeout_ms(label: str) -> int:
+    """Presupuesto de `label` (`graphql companies`, `GET /api/v1/companies`); `0` desactiva el límite."""
+    return settings.OPERATION_TIMEOUTS.get(label, settings.OPERATION_TIMEOUT_MS)
+
+
+def remaining_ms() -> int | None:
+    """Milisegundos que le quedan a la operación en curso (mínimo 1: en Postgres `0` significa sin límite)."""
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return None
+    return max(int((deadline - asyncio.get_running_loop().time()) * 1000), 1)
+
+
+def is_statement_timeout(error: BaseException | None) -> bool:
+    if not isinstance(error, DBAPIError):
+        return False
+    orig = error.orig
+    return QUERY_CANCELED_SQLSTATE in (getattr(orig, "sqlstate", None), getattr(orig, "pgcode", None))
+
+
+def operation_timeout_error(label: str, timeout_ms: int) -> CustomGraphQLExceptionHelper:
+    return CustomGraphQLExceptionHelper(
+        f"La operación excedió su tiempo límite de {timeout_ms} ms",
+        HTTPErrorCode.OPERATION_TIMEOUT,
+        details={"operation": label, "timeoutMs": timeout_ms},
+    )
+
+
+@asynccontextmanager
+async def operation_deadline(label: str) -> AsyncGenerator[None, None]:
+    """Cancela el bloque al agotar el presupuesto de la operación y lo informa como `OPERATION_TIMEOUT`.
+
+    El unit of work lee el tiempo restante al abrir la sesión y lo aplica con `SET LOCAL statement_timeout`, así
+    Postgres también corta el statement en curso; por eso este bloque debe quedar dentro del unit of work, que hace
+    el rollback y devuelve la conexión al pool cuando la cancelación lo atraviesa.
+    """
+    timeout_ms = operation_timeout_ms(label)
+    if timeout_ms <= 0:
+        yield
+        return
+
+    deadline = asyncio.get_running_loop().time() + timeout_ms / 1000
+    token = _current_deadline.set(deadline)
+    try:
+        async with asyncio.timeout_at(deadline) as timeout:
+            yield
+    except TimeoutError as exc:
+        if not timeout.expired():
+            raise
+        LoggerHelper.warning(f"Operación {label} cancelada al superar {timeout_ms} ms")
+        raise operation_timeout_error(label, timeout_ms) from exc
+    except DBAPIError as exc:
+        if not is_statement_timeout(exc):
+            raise
+        LoggerHelper.warning(f"Postgres canceló un statement de {label} por statement_timeout")
+        raise operation_timeout_error(label, timeout_ms) from exc
+    finally:
+        _current_deadline.reset(token)
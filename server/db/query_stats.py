@@ -0,0 +1,96 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_current_query_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+# (statement, parameters, elapsed_ms, executemany): p.ej. el log de consultas lentas
+StatementObserver = Callable[[str, object, float, bool], None]
+_statement_observers: list[StatementObserver] = []
+
+
+@dataclass
+class QueryStats:
+    """Statements, filas y tiempo de base de datos de una operación GraphQL o ruta REST."""
+
+    label: str
+    statements: int = 0
+    rows: int = 0
+    elapsed_ms: float = 0.0
+    # Solo se guarda el SQL cuando se pide (tests y depuración); en producción basta con los contadores
+    capture_sql: bool = False
+    sql: list[str] = field(default_factory=list)
+
+    def record(self, statement: str, rows: int, elapsed_ms: float) -> None:
+        self.statements += 1
+        self.rows += max(rows, 0)
+        self.elapsed_ms += elapsed_ms
+        if self.capture_sql:
+            self.sql.append(statement)
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "statements": self.statements,
+            "rows": self.rows,
+            "elapsedMs": round(self.elapsed_ms, 3),
+        }
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.elapsed_ms:.3f};desc="{self.statements} statements, {self.rows} rows"'
+
+
+@contextmanager
+def track_queries(label: str, capture_sql: bool = False) -> Iterator[QueryStats]:
+    """Acumula en un `QueryStats` los statements ejecutados dentro del bloque (incluidas las tasks hijas)."""
+    stats = QueryStats(label, capture_sql=capture_sql)
+    token = _current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_query_stats.get()
+
+
+def record_statement(statement: str, rows: int = 0, elapsed_ms: float = 0.0) -> None:
+    stats = _current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, rows, elapsed_ms)
+
+
+def add_statement_observer(observer: StatementObserver) -> None:
+    if observer not in _statement_observers:
+        _statement_observers.append(observer)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Registra cada statement del engine en el `QueryStats` activo.
+
+    Los eventos corren en el greenlet de SQLAlchemy, que hereda el contexto de la task: el `ContextVar` apunta al
+    mismo objeto que abrió `track_queries`.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+        record_statement(statement, cursor.rowcount, elapsed_ms)
+        for observer in _statement_observers:
+            observer(statement, parameters, elapsed_ms, executemany)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        # Un statement fallido no llega a after_cursor_execute: se descarta su marca de inicio
+        started = exception_context.connection.info.get("query_started_at") if exception_context.connection else None
+        if started:
+            started.pop()
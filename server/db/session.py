@@ -1,10 +1,13 @@
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
 from server.config.settings import settings
+from server.db.query_stats import instrument_engine
+from server.db.unit_of_work import UnitOfWork, UnitOfWorkSessionFactory
+from server.helpers.slow_query_log_helper import SlowQueryLogHelper
 
 engine = create_async_engine(
     settings.async_database_url,
@@ -14,12 +17,17 @@ engine = create_async_engine(
     pool_size=10,
     max_overflow=20,
 )
-
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
+instrument_engine(engine)
+SlowQueryLogHelper().attach(engine)
+
+# Dentro de un unit of work (operación GraphQL / request REST) devuelve la sesión compartida de la operación
+AsyncSessionLocal = UnitOfWorkSessionFactory(
+    async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
 )
 
 
@@ -27,6 +35,10 @@ class Base(DeclarativeBase):
     pass
 
 
+def unit_of_work(read_only: bool = False) -> AbstractAsyncContextManager[UnitOfWork]:
+    return AsyncSessionLocal.unit_of_work(read_only=read_only)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
@@ -0,0 +1,185 @@
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from server.db.operation_deadline import remaining_ms
+from server.helpers.logger_helper import LoggerHelper
+
+AfterCommitCallback = Callable[[], Awaitable[object]]
+
+_current_unit_of_work: ContextVar["UnitOfWork | None"] = ContextVar("unit_of_work", default=None)
+
+
+class _TaskReentrantLock:
+    """Lock reentrante por task: los resolvers concurrentes de una operación se turnan la sesión compartida."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task | None = None
+        self._depth = 0
+
+    async def acquire(self) -> None:
+        task = asyncio.current_task()
+        if self._owner is task:
+            self._depth += 1
+            return
+        await self._lock.acquire()
+        self._owner = task
+        self._depth = 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+
+class UnitOfWork:
+    """Sesión única de una operación GraphQL o request REST.
+
+    La sesión se abre en el primer acceso a la base de datos; al terminar se hace un solo commit
+    (o rollback si hubo errores o es de solo lectura). Lo registrado con `after_commit` (invalidar caches, publicar
+    eventos) corre recién después del commit real y se descarta si hubo rollback.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, read_only: bool = False):
+        self.read_only = read_only
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._lock = _TaskReentrantLock()
+        self.rollback_only = False
+        self.committed = False
+        self._after_commit: list[AfterCommitCallback] = []
+
+    @property
+    def session(self) -> AsyncSession | None:
+        return self._session
+
+    def mark_rollback(self) -> None:
+        self.rollback_only = True
+
+    def after_commit(self, callback: AfterCommitCallback) -> None:
+        self._after_commit.append(callback)
+
+    async def _ensure_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+            if self.read_only:
+                await self._session.execute(text("SET TRANSACTION READ ONLY"))
+            # Con un deadline activo, Postgres corta por su cuenta el statement que lo agote
+            timeout_ms = remaining_ms()
+            if timeout_ms is not None:
+                await self._session.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+        return self._session
+
+    async def complete(self) -> None:
+        if self._session is None:
+            return
+        try:
+            if self.read_only or self.rollback_only:
+                await self._session.rollback()
+            else:
+                await self._session.commit()
+                self.committed = True
+        finally:
+            await self._session.close()
+            self._session = None
+        if self.committed:
+            await self._run_after_commit()
+
+    async def _run_after_commit(self) -> None:
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as exc:
+                # Los datos ya están confirmados: un cache o evento fallido no debe convertir la operación en error
+                LoggerHelper.warning(f"Falló un callback posterior al commit: {exc}")
+
+
+class _UnitOfWorkSession:
+    """Vista de la sesión compartida: `commit` solo hace flush y `close` no cierra; el UoW decide al final."""
+
+    def __init__(self, unit_of_work: UnitOfWork, session: AsyncSession):
+        self._unit_of_work = unit_of_work
+        self._session = session
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    async def commit(self) -> None:
+        await self._session.flush()
+
+    async def rollback(self) -> None:
+        self._unit_of_work.mark_rollback()
+        await self._session.rollback()
+
+    async def close(self) -> None:
+        return None
+
+
+class _UnitOfWorkSessionContext:
+    def __init__(self, unit_of_work: UnitOfWork):
+        self._unit_of_work = unit_of_work
+
+    async def __aenter__(self) -> _UnitOfWorkSession:
+        await self._unit_of_work._lock.acquire()
+        try:
+            session = await self._unit_of_work._ensure_session()
+        except BaseException:
+            self._unit_of_work._lock.release()
+            raise
+        return _UnitOfWorkSession(self._unit_of_work, session)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            # Un flush fallido deja la sesión inutilizable: la operación completa termina en rollback
+            self._unit_of_work.mark_rollback()
+        self._unit_of_work._lock.release()
+
+
+class UnitOfWorkSessionFactory:
+    """Reemplazo de `async_sessionmaker`: dentro de un UoW entrega la sesión compartida de la operación."""
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self._session_factory = session_factory
+
+    def __call__(self):
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is None:
+            return self._session_factory()
+        return _UnitOfWorkSessionContext(unit_of_work)
+
+    def independent(self) -> AsyncSession:
+        """Sesión propia fuera del UoW (p.ej. auditoría que debe persistir aunque la operación haga rollback)."""
+        return self._session_factory()
+
+    @asynccontextmanager
+    async def unit_of_work(self, read_only: bool = False) -> AsyncGenerator[UnitOfWork, None]:
+        unit_of_work = UnitOfWork(self._session_factory, read_only=read_only)
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+        except BaseException:
+            unit_of_work.mark_rollback()
+            raise
+        finally:
+            _current_unit_of_work.reset(token)
+            await unit_of_work.complete()
+
+
+def current_unit_of_work() -> UnitOfWork | None:
+    return _current_unit_of_work.get()
+
+
+async def after_commit(callback: AfterCommitCallback) -> None:
+    """Difiere `callback` al commit del unit of work activo; sin UoW el commit ya ocurrió y se ejecuta en el acto."""
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is None:
+        await callback()
+        return
+    unit_of_work.after_commit(callback)
@@ -4,7 +4,7 @@ from typing import List, Union
 from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.strategies.permission_check_strategy import PermissionCheckMode, PermissionCheckStrategyFactory
-from server.utils.permission_utils import has_permission
+from server.utils.permission_utils import compile_permissions, permission_key
 
 
 def require_permission(type: str, action: str):
@@ -20,6 +20,8 @@ def require_permission(type: str, action: str):
             ...
     """
 
+    required_permission = permission_key(type, action)
+
     def decorator(resolver):
         @wraps(resolver)
         async def wrapper(self, parent, info, *args, **kwargs):
@@ -39,7 +41,7 @@ def require_permission(type: str, action: str):
 
             permissions = role.get("permissions", [])
 
-            if not has_permission(permissions, type, action):
+            if required_permission not in compile_permissions(permissions):
                 raise CustomGraphQLExceptionHelper(
                     f"Permiso denegado: se requiere {type}:{action}",
                     HTTPErrorCode.FORBIDDEN,
@@ -78,6 +80,9 @@ def require_permissions(
 
     strategy = PermissionCheckStrategyFactory.create(mode)
     normalized_mode = PermissionCheckMode(mode)
+    required_permissions = compile_permissions(permissions)
+    separator = " o " if normalized_mode == PermissionCheckMode.ANY else " y "
+    perm_description = separator.join([f"{p['type']}:{p['action']}" for p in permissions])
 
     def decorator(resolver):
         @wraps(resolver)
@@ -98,12 +103,7 @@ def require_permissions(
                 )
 
             user_permissions = role.get("permissions", [])
-            is_allowed = strategy.is_allowed(user_permissions, permissions)
-
-            if normalized_mode == PermissionCheckMode.ANY:
-                perm_description = " o ".join([f"{p['type']}:{p['action']}" for p in permissions])
-            else:
-                perm_description = " y ".join([f"{p['type']}:{p['action']}" for p in permissions])
+            is_allowed = strategy.is_allowed(user_permissions, required_permissions)
 
             if not is_allowed:
                 raise CustomGraphQLExceptionHelper(
@@ -5,6 +5,7 @@ from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.services.user_service import UserService
 from server.utils.auth_utils import verify_token
+from server.utils.principal_utils import resolve_principal_once
 
 
 def require_token(resolver):
@@ -38,17 +39,21 @@ def require_token(resolver):
                 HTTPErrorCode.UNAUTHORIZED,
             )
 
-        # Verificar access token
-        payload = verify_token(token)
-        user_id = payload.get("id")
-        if not user_id:
-            raise CustomGraphQLExceptionHelper(
-                "Token inválido",
-                HTTPErrorCode.UNAUTHORIZED,
-            )
+        async def load_user():
+            # Verificar access token
+            payload = verify_token(token)
+            user_id = payload.get("id")
+            if not user_id:
+                raise CustomGraphQLExceptionHelper(
+                    "Token inválido",
+                    HTTPErrorCode.UNAUTHORIZED,
+                )
+
+            user_service = UserService()
+            return await user_service.get_user(user_id)
 
-        user_service = UserService()
-        user = await user_service.get_user(user_id)
+        # El principal se resuelve una vez por operación y se comparte entre resolvers
+        user = await resolve_principal_once(info.context, token, load_user)
 
         if not user:
             raise CustomGraphQLExceptionHelper(
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class AuditOverflowPolicy(str, Enum):
+    """Qué hace el sink de auditoría cuando su cola está llena."""
+
+    # Espera a que el flush libere espacio (backpressure sobre la request)
+    BLOCK = "block"
+    # Descarta decisiones permitidas para conservar las denegadas; si solo hay denegadas, las escribe a disco
+    DROP_ALLOWED = "drop_allowed"
+    # Escribe la entrada a disco; se reinserta al iniciar el siguiente proceso
+    SPILL = "spill"
@@ -10,6 +10,7 @@ class HTTPErrorCode(Enum):
     CONFLICT = (409, "CONFLICT")
     INTERNAL_SERVER_ERROR = (500, "INTERNAL_SERVER_ERROR")
     SERVICE_UNAVAILABLE = (503, "SERVICE_UNAVAILABLE")
+    OPERATION_TIMEOUT = (504, "OPERATION_TIMEOUT")
 
     def __init__(self, status_code, code_name):
         self.status_code = status_code
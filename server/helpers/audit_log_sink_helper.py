@@ -0,0 +1,269 @@
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from datetime import datetime
+from pathlib import Path
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.enums.audit_overflow_policy_enum import AuditOverflowPolicy
+from server.helpers.logger_helper import LoggerHelper
+
+AuditBatchWriter = Callable[[list[dict]], Awaitable[object]]
+TIMESTAMP_FIELDS = ("created_at", "first_seen_at", "last_seen_at")
+
+
+@singleton
+class AuditLogSinkHelper:
+    """Cola acotada en proceso para los audit logs no estrictos, escrita por una task en INSERTs multi-fila.
+
+    Se vacía cada `AUDIT_SINK_FLUSH_INTERVAL_MS` o al juntar `AUDIT_SINK_BATCH_SIZE` entradas. Con la cola llena
+    aplica `AUDIT_SINK_OVERFLOW_POLICY`; los lotes que no se pueden escribir van al archivo de spill, que se reinserta
+    al iniciar. Las entradas con ventana de agregación se colapsan con sus idénticas y pasan a la cola como una sola
+    fila (`count`, `first_seen_at`, `last_seen_at`) al cerrar la ventana.
+    """
+
+    def __init__(self):
+        self.max_size = max(settings.AUDIT_SINK_QUEUE_SIZE, 1)
+        self.batch_size = max(settings.AUDIT_SINK_BATCH_SIZE, 1)
+        self.flush_interval_seconds = settings.AUDIT_SINK_FLUSH_INTERVAL_MS / 1000
+        self.overflow_policy = AuditOverflowPolicy(settings.AUDIT_SINK_OVERFLOW_POLICY)
+        self.spill_path = Path(settings.AUDIT_SINK_SPILL_PATH)
+        self._buffer: deque[dict] = deque()
+        self._aggregates: dict[tuple, tuple[float, dict]] = {}
+        self._writer: AuditBatchWriter | None = None
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self._space = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._stopping = False
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.blocked = 0
+        self.aggregated = 0
+        self.rejected = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self, writer: AuditBatchWriter) -> None:
+        if self.running:
+            return
+        self._writer = writer
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Detiene la task y escribe lo pendiente (se llama desde el lifespan al apagar).
+
+        No se cancela la task: se le pide salir y se espera, para no cortar un lote a mitad de escritura. Si la task
+        ya había terminado con error se registra y se escribe igual lo pendiente.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            self._stopping = True
+            self._wake.set()
+            try:
+                await task
+            except Exception as exc:
+                LoggerHelper.error(f"La task del sink de audit logs terminó con error: {exc}")
+        await self.flush(release_all=True)
+
+    async def submit(self, entry: dict, aggregate_window_seconds: float = 0) -> None:
+        if aggregate_window_seconds > 0 and self._aggregate(entry, aggregate_window_seconds):
+            return
+        while len(self._buffer) >= self.max_size:
+            if self.overflow_policy is AuditOverflowPolicy.BLOCK:
+                self.blocked += 1
+                self._space.clear()
+                self._wake.set()
+                await self._space.wait()
+                continue
+            if self.overflow_policy is AuditOverflowPolicy.DROP_ALLOWED:
+                if self._is_allowed(entry):
+                    self.dropped += 1
+                    return
+                if self._drop_oldest_allowed():
+                    break
+            await self._spill([entry])
+            return
+        self._buffer.append(entry)
+        self.enqueued += 1
+        if len(self._buffer) >= self.batch_size:
+            self._wake.set()
+
+    async def flush(self, release_all: bool = False) -> None:
+        async with self._flush_lock:
+            self._release_aggregates(release_all)
+            while self._buffer and self._writer is not None:
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                self._space.set()
+                try:
+                    await self._write(batch)
+                except asyncio.CancelledError:
+                    # Cancelación externa (p.ej. cierre del loop): el lote vuelve a la cola en vez de perderse
+                    self._buffer.extendleft(reversed(batch))
+                    raise
+
+    async def _run(self) -> None:
+        try:
+            await self._replay_spill()
+        except Exception as exc:
+            # Un spill ilegible no puede dejar al sink sin vaciar la cola: se conserva en disco para revisarlo
+            LoggerHelper.error(f"No se pudo reinsertar el spill de audit logs {self.spill_path}: {exc}")
+        while not self._stopping:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval_seconds)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as exc:
+                LoggerHelper.error(f"Falló el vaciado de la cola de audit logs: {exc}")
+
+    async def _write(self, batch: list[dict]) -> None:
+        try:
+            await self._writer(batch)
+            self.written += len(batch)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo escribir un lote de {len(batch)} audit logs: {exc}")
+            await self._spill(batch)
+
+    def _aggregate(self, entry: dict, window_seconds: float) -> bool:
+        """Suma la entrada a su ventana abierta o abre una; False si no hay lugar y debe encolarse sola."""
+        key = self._aggregate_key(entry)
+        now = time.monotonic()
+        pending = self._aggregates.get(key)
+        if pending is not None:
+            closes_at, aggregate = pending
+            if closes_at > now:
+                aggregate["count"] += 1
+                aggregate["last_seen_at"] = entry.get("created_at")
+                self.aggregated += 1
+                return True
+            self._release(key)
+        elif len(self._aggregates) >= self.max_size:
+            return False
+        seen_at = entry.get("created_at")
+        aggregate = {**entry, "count": 1, "first_seen_at": seen_at, "last_seen_at": seen_at}
+        self._aggregates[key] = (now + window_seconds, aggregate)
+        return True
+
+    def _aggregate_key(self, entry: dict) -> tuple:
+        return (
+            str(entry.get("user_id")),
+            entry.get("module"),
+            entry.get("action"),
+            entry.get("status"),
+            entry.get("resource_type"),
+            entry.get("resource_id"),
+            json.dumps(entry.get("metadata_json"), sort_keys=True, default=str),
+        )
+
+    def _release_aggregates(self, release_all: bool = False) -> None:
+        now = time.monotonic()
+        for key in [key for key, (closes_at, _) in self._aggregates.items() if release_all or closes_at <= now]:
+            self._release(key)
+
+    def _release(self, key: tuple) -> None:
+        # Sin pasar por la política de desborde: ya ocupaban lugar (acotado por `max_size`) mientras se agregaban
+        _, aggregate = self._aggregates.pop(key)
+        self._buffer.append(aggregate)
+        self.enqueued += 1
+
+    def _is_allowed(self, entry: dict) -> bool:
+        return entry.get("status") == "success"
+
+    def _drop_oldest_allowed(self) -> bool:
+        for index, queued in enumerate(self._buffer):
+            if self._is_allowed(queued):
+                del self._buffer[index]
+                self.dropped += 1
+                return True
+        return False
+
+    async def _spill(self, entries: list[dict]) -> None:
+        lines = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+        try:
+            await asyncio.to_thread(self._append_spill, lines)
+            self.spilled += len(entries)
+        except OSError as exc:
+            self.dropped += len(entries)
+            LoggerHelper.error(f"No se pudieron guardar {len(entries)} audit logs en {self.spill_path}: {exc}")
+
+    def _append_spill(self, lines: str) -> None:
+        self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.spill_path.open("a", encoding="utf-8") as spill_file:
+            spill_file.write(lines)
+
+    async def _replay_spill(self) -> None:
+        """Reinserta las entradas que quedaron en disco (cola llena o base de datos caída).
+
+        Un `.replay` que sobrevivió a una reinserción interrumpida se conserva: el spill nuevo se le agrega al final.
+        Las líneas ilegibles (p.ej. la última, truncada por una caída a mitad de escritura) se apartan al `.rejected`.
+        """
+        replay_path = self.spill_path.with_suffix(".replay")
+        if self.spill_path.exists():
+            if replay_path.exists():
+                self._append_to_replay(replay_path)
+            else:
+                self.spill_path.replace(replay_path)
+        if not replay_path.exists():
+            return
+        entries, rejected = [], []
+        for line in replay_path.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                entry = self._parse_spill_line(line)
+                if entry is None:
+                    rejected.append(line)
+                else:
+                    entries.append(entry)
+        if rejected:
+            self._reject(rejected)
+        LoggerHelper.info(f"Reinsertando {len(entries)} audit logs desde {self.spill_path}")
+        for start in range(0, len(entries), self.batch_size):
+            await self._write(entries[start : start + self.batch_size])
+        replay_path.unlink()
+
+    def _parse_spill_line(self, line: str) -> dict | None:
+        try:
+            entry = json.loads(line)
+            for field in TIMESTAMP_FIELDS:
+                if entry.get(field):
+                    entry[field] = datetime.fromisoformat(entry[field])
+        except (ValueError, TypeError, AttributeError):
+            return None
+        return entry
+
+    def _reject(self, lines: list[str]) -> None:
+        rejected_path = self.spill_path.with_suffix(".rejected")
+        with rejected_path.open("a", encoding="utf-8") as rejected_file:
+            rejected_file.write("".join(line + "\n" for line in lines))
+        self.rejected += len(lines)
+        LoggerHelper.error(f"{len(lines)} líneas ilegibles del spill de audit logs se apartaron en {rejected_path}")
+
+    def _append_to_replay(self, replay_path: Path) -> None:
+        with replay_path.open("a+", encoding="utf-8") as replay_file:
+            # Si el `.replay` terminó en una línea truncada, el spill nuevo no debe quedar pegado a ella
+            if replay_file.tell() and not replay_path.read_bytes().endswith(b"\n"):
+                replay_file.write("\n")
+            replay_file.write(self.spill_path.read_text(encoding="utf-8"))
+        self.spill_path.unlink()
+
+    def stats(self) -> dict:
+        return {
+            "queued": len(self._buffer),
+            "aggregating": len(self._aggregates),
+            "aggregated": self.aggregated,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "blocked": self.blocked,
+            "rejected": self.rejected,
+        }
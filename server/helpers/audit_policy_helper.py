@@ -0,0 +1,25 @@
+import random
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.models.dto.audit_log_dto import AuditPolicyModel
+
+RECORD_ALL = AuditPolicyModel()
+
+
+@singleton
+class AuditPolicyHelper:
+    """Reglas de `AUDIT_POLICIES` para los audit logs no estrictos: muestreo y ventana de agregación por evento."""
+
+    def __init__(self):
+        self.policies = [AuditPolicyModel.model_validate(policy) for policy in settings.AUDIT_POLICIES]
+        self.sampled_out = 0
+
+    def match(self, module: str, action: str, status: str) -> AuditPolicyModel:
+        return next((policy for policy in self.policies if policy.matches(module, action, status)), RECORD_ALL)
+
+    def sampled(self, policy: AuditPolicyModel) -> bool:
+        if policy.sample_rate >= 1 or random.random() < policy.sample_rate:
+            return True
+        self.sampled_out += 1
+        return False
@@ -0,0 +1,57 @@
+import json
+import time
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.helpers.logger_helper import LoggerHelper
+from server.helpers.two_tier_cache_helper import TwoTierCacheHelper
+
+AUTHORIZATION_INVALIDATION_CHANNEL = "authorization_invalidated"
+
+
+@singleton
+class AuthorizationCacheHelper(TwoTierCacheHelper):
+    """Cache de dos niveles (TTL en proceso + Redis) de las decisiones de autorización de cada usuario.
+
+    En Redis cada usuario tiene un hash (`authz:<user_id>`) con un campo por decisión, así invalidar a un usuario es
+    un solo `DEL` sin recorrer claves. El `EXPIRE` del hash se renueva con cada escritura, así que cada campo guarda
+    su propio `expiresAt` y los vencidos se descartan (y borran) al leerlos.
+    """
+
+    key_prefix = "authz:"
+    channel = AUTHORIZATION_INVALIDATION_CHANNEL
+    label = "decisiones de autorización"
+
+    def __init__(self):
+        super().__init__(
+            settings.AUTHORIZATION_CACHE_MAX_SIZE,
+            settings.AUTHORIZATION_CACHE_LOCAL_TTL_SECONDS,
+            settings.AUTHORIZATION_CACHE_REDIS_TTL_SECONDS,
+        )
+
+    async def get(self, user_id, field: str) -> dict | None:
+        return await self._lookup(user_id, field)
+
+    async def set(self, user_id, field: str, payload: dict) -> None:
+        await self._store(user_id, field, payload)
+
+    async def _read(self, user_id: str, field: str) -> dict | None:
+        raw_entry = await self._redis.hash_get(self.redis_key(user_id), field)
+        entry = json.loads(raw_entry) if raw_entry is not None else None
+        if entry is None or entry.get("expiresAt", 0) <= time.time():
+            if entry is not None:
+                await self._delete_field(self.redis_key(user_id), field)
+            return None
+        return entry["value"]
+
+    async def _write(self, user_id: str, field: str, payload: dict) -> None:
+        entry = {"expiresAt": time.time() + self.redis_ttl_seconds, "value": payload}
+        await self._redis.hash_set(
+            self.redis_key(user_id), field, json.dumps(entry), ttl_seconds=self.redis_ttl_seconds
+        )
+
+    async def _delete_field(self, redis_key: str, field: str) -> None:
+        try:
+            await self._redis.hash_delete(redis_key, field)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo borrar una decisión de autorización vencida en Redis: {exc}")
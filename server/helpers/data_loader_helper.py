@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any, Generic, TypeVar
+
+from server.utils.request_scope_utils import get_request_memo
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+DATA_LOADERS_KEY = "data_loaders"
+
+BatchLoadFn = Callable[[list[KeyT]], Awaitable[Sequence[ValueT | None]]]
+
+
+class DataLoader(Generic[KeyT, ValueT]):
+    """Agrupa las llaves pedidas en el mismo tick del event loop y las resuelve con una sola llamada batch.
+
+    `batch_load_fn` recibe llaves únicas y debe devolver los valores en el mismo orden (``None`` si no existe).
+    Los resultados quedan cacheados mientras viva el loader, que es una request u operación GraphQL.
+    """
+
+    def __init__(self, batch_load_fn: BatchLoadFn, max_batch_size: int | None = None):
+        self._batch_load_fn = batch_load_fn
+        self._max_batch_size = max_batch_size
+        self._cache: dict[KeyT, asyncio.Future] = {}
+        self._queue: list[KeyT] = []
+        self.batches = 0
+
+    def load(self, key: KeyT) -> asyncio.Future:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[KeyT]) -> list[ValueT | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: KeyT, value: ValueT | None) -> None:
+        if key in self._cache:
+            return
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: KeyT | None = None) -> None:
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        size = self._max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            asyncio.ensure_future(self._load_batch(queue[start : start + size]))
+
+    async def _load_batch(self, keys: list[KeyT]) -> None:
+        self.batches += 1
+        try:
+            values = await self._batch_load_fn(keys)
+            if len(values) != len(keys):
+                raise ValueError("El batch debe devolver un valor por cada llave solicitada")
+        except Exception as exc:
+            for key in keys:
+                future = self._cache.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, value in zip(keys, values):
+            future = self._cache.get(key)
+            if future is not None and not future.done():
+                future.set_result(value)
+
+
+def get_data_loader(scope: Any, name: str, batch_load_fn: BatchLoadFn) -> DataLoader:
+    """Obtiene (o crea) el loader `name` de la request actual."""
+    loaders = get_request_memo(scope, DATA_LOADERS_KEY)
+    loader = loaders.get(name)
+    if loader is None:
+        loader = DataLoader(batch_load_fn)
+        loaders[name] = loader
+    return loader
@@ -0,0 +1,127 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from graphql import (
+    DocumentNode,
+    GraphQLError,
+    GraphQLSchema,
+    OperationType,
+    get_operation_ast,
+    parse,
+    print_schema,
+    specified_rules,
+    validate,
+)
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    key: str
+    document: DocumentNode
+    errors: tuple[GraphQLError, ...]
+
+
+@singleton
+class GraphQLDocumentCacheHelper:
+    """LRU de documentos GraphQL ya parseados y validados contra el esquema."""
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size if max_size is not None else settings.GRAPHQL_DOCUMENT_CACHE_SIZE
+        self._entries: OrderedDict[str, CachedDocument] = OrderedDict()
+        self._keys_by_document: dict[int, str] = {}
+        self._schema_versions: dict[int, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_seconds = 0.0
+
+    def schema_version(self, schema: GraphQLSchema) -> str:
+        version = self._schema_versions.get(id(schema))
+        if version is None:
+            version = hashlib.sha256(print_schema(schema).encode()).hexdigest()
+            self._schema_versions[id(schema)] = version
+        return version
+
+    def cache_key(self, schema: GraphQLSchema, query: str) -> str:
+        return hashlib.sha256(f"{self.schema_version(schema)}:{query}".encode()).hexdigest()
+
+    def get(self, schema: GraphQLSchema, query: str) -> CachedDocument:
+        key = self.cache_key(schema, query)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        started_at = time.perf_counter()
+        document = parse(query)
+        errors = tuple(validate(schema, document, specified_rules))
+        self.compile_seconds += time.perf_counter() - started_at
+
+        entry = CachedDocument(key=key, document=document, errors=errors)
+        self._store(entry)
+        return entry
+
+    def operation_type(self, schema: GraphQLSchema, query: str, operation_name: str | None) -> OperationType | None:
+        """Tipo de la operación a ejecutar; ``None`` si el documento no parsea o la operación no existe."""
+        try:
+            operation = get_operation_ast(self.get(schema, query).document, operation_name)
+        except GraphQLError:
+            return None
+        return operation.operation if operation else None
+
+    def _store(self, entry: CachedDocument) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[entry.key] = entry
+        self._keys_by_document[id(entry.document)] = entry.key
+        while len(self._entries) > self.max_size:
+            _, evicted = self._entries.popitem(last=False)
+            self._keys_by_document.pop(id(evicted.document), None)
+            self.evictions += 1
+
+    def query_parser(self, schema: GraphQLSchema):
+        """`QueryParser` de ariadne que resuelve el documento desde el cache."""
+
+        def parser(_context_value, data: dict) -> DocumentNode:
+            return self.get(schema, data["query"]).document
+
+        return parser
+
+    def query_validator(
+        self, schema: GraphQLSchema, document_ast: DocumentNode, rules=None, max_errors=None, type_info=None
+    ):
+        """`QueryValidator` de ariadne: reutiliza el resultado si el documento proviene del cache."""
+        key = self._keys_by_document.get(id(document_ast))
+        entry = self._entries.get(key) if key else None
+        if entry is not None and entry.document is document_ast and rules is specified_rules:
+            return list(entry.errors)
+        return validate(schema, document_ast, rules, max_errors=max_errors, type_info=type_info)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        average_compile = self.compile_seconds / self.misses if self.misses else 0.0
+        return {
+            "size": len(self._entries),
+            "maxSize": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "compileSeconds": round(self.compile_seconds, 6),
+            "estimatedSavedSeconds": round(average_compile * self.hits, 6),
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_document.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_seconds = 0.0
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.logger_helper import LoggerHelper
+from server.utils.auth_utils import hash_password, verify_password
+
+
+@singleton
+class PasswordHasherHelper:
+    """Ejecuta bcrypt en un pool acotado para no bloquear el event loop.
+
+    Si hay más de ``max_workers + max_queue`` operaciones pendientes se rechaza de inmediato con 503.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_queue: int | None = None, rounds: int | None = None):
+        self.max_workers = max_workers if max_workers is not None else settings.PASSWORD_HASH_WORKERS
+        self.max_queue = max_queue if max_queue is not None else settings.PASSWORD_HASH_MAX_QUEUE
+        self.rounds = rounds if rounds is not None else settings.PASSWORD_HASH_ROUNDS
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hasher")
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_seconds = 0.0
+        self.max_queue_wait_seconds = 0.0
+        self.hash_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password, password, hashed)
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            LoggerHelper.warning(f"Pool de hashing saturado ({self.pending} operaciones pendientes)")
+            raise CustomGraphQLExceptionHelper(
+                "Servicio de autenticación saturado, intenta de nuevo más tarde",
+                HTTPErrorCode.SERVICE_UNAVAILABLE,
+            )
+
+        self.pending += 1
+        submitted_at = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            result, started_at, finished_at = await loop.run_in_executor(self._executor, self._timed, func, args)
+        finally:
+            self.pending -= 1
+
+        queue_wait = started_at - submitted_at
+        self.completed += 1
+        self.queue_wait_seconds += queue_wait
+        self.max_queue_wait_seconds = max(self.max_queue_wait_seconds, queue_wait)
+        self.hash_seconds += finished_at - started_at
+        return result
+
+    @staticmethod
+    def _timed(func, args):
+        started_at = time.perf_counter()
+        result = func(*args)
+        return result, started_at, time.perf_counter()
+
+    def stats(self) -> dict:
+        completed = self.completed or 1
+        return {
+            "workers": self.max_workers,
+            "maxQueue": self.max_queue,
+            "rounds": self.rounds,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avgQueueWaitSeconds": round(self.queue_wait_seconds / completed, 6),
+            "maxQueueWaitSeconds": round(self.max_queue_wait_seconds, 6),
+            "avgHashSeconds": round(self.hash_seconds / completed, 6),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,90 @@
+import hashlib
+from collections import OrderedDict
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.logger_helper import LoggerHelper
+from server.helpers.redis_helper import RedisHelper
+
+PERSISTED_QUERY_NOT_FOUND = "PERSISTED_QUERY_NOT_FOUND"
+PERSISTED_QUERY_NOT_SUPPORTED = "PERSISTED_QUERY_NOT_SUPPORTED"
+
+
+class PersistedQueryNotFoundError(CustomGraphQLExceptionHelper):
+    def __init__(self):
+        super().__init__("PersistedQueryNotFound", PERSISTED_QUERY_NOT_FOUND)
+
+
+@singleton
+class PersistedQueryHelper:
+    """Automatic Persisted Queries: LRU en proceso respaldado por Redis, indexado por sha256 del query."""
+
+    key_prefix = "apq:"
+
+    def __init__(self, max_size: int | None = None):
+        self.max_size = max_size if max_size is not None else settings.PERSISTED_QUERY_CACHE_SIZE
+        self._queries: OrderedDict[str, str] = OrderedDict()
+        self._redis = RedisHelper()
+
+    @staticmethod
+    def query_hash(query: str) -> str:
+        return hashlib.sha256(query.encode()).hexdigest()
+
+    async def resolve(self, data: dict) -> dict:
+        """Completa `data["query"]` a partir de `extensions.persistedQuery` cuando aplica."""
+        extensions = data.get("extensions") if isinstance(data, dict) else None
+        persisted = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+        if not isinstance(persisted, dict):
+            return data
+
+        if persisted.get("version") != 1:
+            raise CustomGraphQLExceptionHelper("PersistedQueryNotSupported", PERSISTED_QUERY_NOT_SUPPORTED)
+        sha256_hash = persisted.get("sha256Hash")
+        if not isinstance(sha256_hash, str) or not sha256_hash:
+            raise CustomGraphQLExceptionHelper("persistedQuery.sha256Hash es requerido")
+
+        query = data.get("query")
+        if query:
+            if self.query_hash(query) != sha256_hash.lower():
+                raise CustomGraphQLExceptionHelper("provided sha does not match query")
+            await self.store(sha256_hash.lower(), query)
+            return data
+
+        query = await self.lookup(sha256_hash.lower())
+        if query is None:
+            raise PersistedQueryNotFoundError()
+        return {**data, "query": query}
+
+    async def lookup(self, sha256_hash: str) -> str | None:
+        query = self._queries.get(sha256_hash)
+        if query is not None:
+            self._queries.move_to_end(sha256_hash)
+            return query
+        try:
+            query = await self._redis.get_value(f"{self.key_prefix}{sha256_hash}")
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo consultar persisted query en Redis: {exc}")
+            return None
+        if query is not None:
+            self._remember(sha256_hash, query)
+        return query
+
+    async def store(self, sha256_hash: str, query: str) -> None:
+        if sha256_hash in self._queries:
+            self._queries.move_to_end(sha256_hash)
+            return
+        self._remember(sha256_hash, query)
+        try:
+            await self._redis.set_value(
+                f"{self.key_prefix}{sha256_hash}", query, ttl_seconds=settings.PERSISTED_QUERY_TTL_SECONDS
+            )
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo guardar persisted query en Redis: {exc}")
+
+    def _remember(self, sha256_hash: str, query: str) -> None:
+        if self.max_size <= 0:
+            return
+        self._queries[sha256_hash] = query
+        while len(self._queries) > self.max_size:
+            self._queries.popitem(last=False)
@@ -0,0 +1,36 @@
+import json
+
+from server.config.settings import settings
+from server.decorators.singleton_decorator import singleton
+from server.helpers.two_tier_cache_helper import TwoTierCacheHelper
+
+PRINCIPAL_INVALIDATION_CHANNEL = "principal_invalidated"
+
+
+@singleton
+class PrincipalCacheHelper(TwoTierCacheHelper):
+    """Cache de dos niveles (TTL en proceso + Redis) del usuario con permisos efectivos, por id de usuario."""
+
+    key_prefix = "principal:"
+    channel = PRINCIPAL_INVALIDATION_CHANNEL
+    label = "principals"
+
+    def __init__(self):
+        super().__init__(
+            settings.PRINCIPAL_CACHE_MAX_SIZE,
+            settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+            settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+        )
+
+    async def get(self, user_id) -> dict | None:
+        return await self._lookup(user_id, "")
+
+    async def set(self, user_id, payload: dict) -> None:
+        await self._store(user_id, "", payload)
+
+    async def _read(self, user_id: str, field: str) -> dict | None:
+        raw_payload = await self._redis.get_value(self.redis_key(user_id))
+        return json.loads(raw_payload) if raw_payload is not None else None
+
+    async def _write(self, user_id: str, field: str, payload: dict) -> None:
+        await self._redis.set_value(self.redis_key(user_id), json.dumps(payload), ttl_seconds=self.redis_ttl_seconds)
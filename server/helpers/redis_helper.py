@@ -19,6 +19,42 @@ class RedisHelper:
             self._client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
         return self._client
 
+    async def get_value(self, key: str) -> str | None:
+        return await self.get_client().get(key)
+
+    async def set_value(self, key: str, value: str, ttl_seconds: int | None = None) -> None:
+        await self.get_client().set(key, value, ex=ttl_seconds)
+
+    async def delete_values(self, *keys: str) -> None:
+        if keys:
+            await self.get_client().delete(*keys)
+
+    async def hash_get(self, key: str, field: str) -> str | None:
+        return await self.get_client().hget(key, field)
+
+    async def hash_set(self, key: str, field: str, value: str, ttl_seconds: int | None = None) -> None:
+        """`HSET` + `EXPIRE`: el TTL aplica al hash completo y se renueva con cada escritura.
+
+        No vence campos individuales; quien necesite TTL por campo debe guardarlo en el valor.
+        """
+        async with self.get_client().pipeline(transaction=True) as pipeline:
+            pipeline.hset(key, field, value)
+            if ttl_seconds:
+                pipeline.expire(key, ttl_seconds)
+            await pipeline.execute()
+
+    async def hash_delete(self, key: str, *fields: str) -> None:
+        if fields:
+            await self.get_client().hdel(key, *fields)
+
+    async def push_capped(self, key: str, value: str, size: int) -> None:
+        """`LPUSH` + `LTRIM`: lista acotada a los `size` elementos más recientes."""
+        async with self.get_client().pipeline(transaction=True) as pipeline:
+            await pipeline.lpush(key, value).ltrim(key, 0, size - 1).execute()
+
+    async def list_range(self, key: str, start: int, end: int) -> list[str]:
+        return await self.get_client().lrange(key, start, end)
+
     async def publish_json(self, channel: str, payload: dict) -> None:
         message = json.dumps(payload)
         await self.get_client().publish(channel, message)
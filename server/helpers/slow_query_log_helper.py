@@ -0,0 +1,124 @@
+import asyncio
+import json
+import random
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from server.config.settings import settings
+from server.db.query_stats import add_statement_observer, current_query_stats
+from server.decorators.singleton_decorator import singleton
+from server.helpers.logger_helper import LoggerHelper
+from server.helpers.redis_helper import RedisHelper
+
+# EXPLAIN sin ANALYZE no ejecuta el statement; BEGIN, SET o LOCK no tienen plan
+EXPLAINABLE_PREFIXES = ("select", "with", "insert", "update", "delete")
+EXPLAIN_TIMEOUT_SECONDS = 5
+MAX_PENDING_CAPTURES = 4
+
+_capturing: ContextVar[bool] = ContextVar("slow_query_capturing", default=False)
+
+
+def redact_parameters(parameters):
+    """Conserva la forma de los parámetros (`None`, booleanos, tipos) sin exponer sus valores."""
+    if parameters is None or isinstance(parameters, bool):
+        return parameters
+    if isinstance(parameters, dict):
+        return {key: redact_parameters(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) for value in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+@singleton
+class SlowQueryLogHelper:
+    """Registra los statements que superan `SLOW_QUERY_THRESHOLD_MS` y captura el plan de una muestra.
+
+    Las entradas quedan en un ring buffer en Redis (compartido con `manage.py slow-queries`) y en uno local de
+    respaldo; el `EXPLAIN` corre en una task aparte, con su propia conexión, para no demorar la operación.
+    """
+
+    redis_key = "slow_queries"
+
+    def __init__(self):
+        self.threshold_ms = settings.SLOW_QUERY_THRESHOLD_MS
+        self.explain_sample_rate = settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        self.buffer_size = settings.SLOW_QUERY_BUFFER_SIZE
+        self._entries: deque[dict] = deque(maxlen=max(self.buffer_size, 1))
+        self._engine: AsyncEngine | None = None
+        self._redis = RedisHelper()
+        self._pending: set[asyncio.Task] = set()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        add_statement_observer(self.observe)
+
+    def observe(self, statement: str, parameters, elapsed_ms: float, executemany: bool = False) -> None:
+        if self.threshold_ms <= 0 or elapsed_ms < self.threshold_ms or _capturing.get():
+            return
+        stats = current_query_stats()
+        entry = {
+            "id": str(uuid.uuid4()),
+            "operation": stats.label if stats else None,
+            "statement": statement,
+            "parameters": redact_parameters(parameters),
+            "durationMs": round(elapsed_ms, 3),
+            "capturedAt": datetime.now(timezone.utc).isoformat(),
+            "plan": None,
+        }
+        LoggerHelper.warning(
+            f"Consulta lenta ({entry['durationMs']} ms) en {entry['operation'] or 'sin operación'}: "
+            f"{statement} params={entry['parameters']}"
+        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._entries.appendleft(entry)
+            return
+        if len(self._pending) >= MAX_PENDING_CAPTURES:
+            self._entries.appendleft(entry)
+            return
+        explain = (
+            self._engine is not None
+            and not executemany
+            and statement.lstrip().lower().startswith(EXPLAINABLE_PREFIXES)
+            and random.random() < self.explain_sample_rate
+        )
+        task = loop.create_task(self._capture(entry, statement, parameters if explain else None, explain))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _capture(self, entry: dict, statement: str, parameters, explain: bool) -> None:
+        # La task tiene su propio contexto: el EXPLAIN no se vuelve a registrar como consulta lenta
+        _capturing.set(True)
+        if explain:
+            try:
+                entry["plan"] = await asyncio.wait_for(self.explain(statement, parameters), EXPLAIN_TIMEOUT_SECONDS)
+            except Exception as exc:
+                LoggerHelper.warning(f"No se pudo capturar el plan de la consulta lenta {entry['id']}: {exc}")
+        await self.store(entry)
+
+    async def explain(self, statement: str, parameters):
+        async with self._engine.connect() as conn:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar()
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    async def store(self, entry: dict) -> None:
+        self._entries.appendleft(entry)
+        try:
+            await self._redis.push_capped(self.redis_key, json.dumps(entry, default=str), self.buffer_size)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo guardar la consulta lenta en Redis: {exc}")
+
+    async def recent(self, limit: int = 50) -> list[dict]:
+        """Las entradas más recientes; si Redis no responde, las del buffer de este proceso."""
+        limit = max(1, min(limit, self.buffer_size))
+        try:
+            raw_entries = await self._redis.list_range(self.redis_key, 0, limit - 1)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudieron leer las consultas lentas desde Redis: {exc}")
+            return list(self._entries)[:limit]
+        return [json.loads(raw_entry) for raw_entry in raw_entries]
@@ -0,0 +1,125 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from server.helpers.logger_helper import LoggerHelper
+from server.helpers.redis_helper import RedisHelper
+
+
+class TwoTierCacheHelper:
+    """Base de los caches de dos niveles (TTL en proceso + Redis) agrupados por usuario.
+
+    Cada entrada local es `(user_id, field)`; un índice por usuario permite invalidar sus entradas sin recorrer el
+    cache. Las subclases definen `key_prefix`, `channel`, `label` y cómo se lee y escribe un valor en Redis.
+    """
+
+    key_prefix = ""
+    channel = ""
+    label = ""
+
+    def __init__(self, max_size: int, local_ttl_seconds: float, redis_ttl_seconds: int):
+        self.max_size = max_size
+        self.local_ttl_seconds = local_ttl_seconds
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+        self._user_keys: dict[str, set[tuple[str, str]]] = {}
+        self._redis = RedisHelper()
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def redis_key(self, user_id: str) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    async def _read(self, user_id: str, field: str) -> dict | None:
+        raise NotImplementedError
+
+    async def _write(self, user_id: str, field: str, payload: dict) -> None:
+        raise NotImplementedError
+
+    async def _lookup(self, user_id, field: str) -> dict | None:
+        key = (str(user_id), field)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, payload = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return payload
+            self._forget(key)
+
+        try:
+            payload = await self._read(*key)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo leer {self.label} desde Redis: {exc}")
+            payload = None
+        if payload is None:
+            self.misses += 1
+            return None
+
+        self._remember(key, payload)
+        self.redis_hits += 1
+        return payload
+
+    async def _store(self, user_id, field: str, payload: dict) -> None:
+        key = (str(user_id), field)
+        self._remember(key, payload)
+        try:
+            await self._write(*key, payload)
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo guardar {self.label} en Redis: {exc}")
+
+    async def invalidate(self, user_ids: Iterable) -> None:
+        keys = sorted({str(user_id) for user_id in user_ids if user_id})
+        if not keys:
+            return
+        self.evict_local(keys)
+        try:
+            await self._redis.delete_values(*(self.redis_key(key) for key in keys))
+            await self._redis.publish_json(self.channel, {"userIds": keys})
+        except Exception as exc:
+            LoggerHelper.warning(f"No se pudo invalidar {self.label} en Redis: {exc}")
+
+    def evict_local(self, user_ids: Iterable[str]) -> None:
+        for user_id in user_ids:
+            for key in self._user_keys.pop(str(user_id), ()):
+                self._entries.pop(key, None)
+
+    async def listen_invalidations(self) -> None:
+        """Aplica en este worker las invalidaciones publicadas por otros procesos."""
+        try:
+            async for message in self._redis.subscribe(self.channel):
+                self.evict_local(message.get("userIds", []))
+        except Exception as exc:
+            LoggerHelper.warning(f"Listener de invalidación de {self.label} detenido: {exc}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._user_keys.clear()
+
+    def _remember(self, key: tuple[str, str], payload: dict) -> None:
+        if self.max_size <= 0 or self.local_ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.local_ttl_seconds, payload)
+        self._entries.move_to_end(key)
+        self._user_keys.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_size:
+            self._forget(next(iter(self._entries)))
+
+    def _forget(self, key: tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        user_keys = self._user_keys.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._user_keys[key[0]]
+
+    def stats(self) -> dict:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "localHits": self.local_hits,
+            "redisHits": self.redis_hits,
+            "misses": self.misses,
+            "hitRatio": round((self.local_hits + self.redis_hits) / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,31 @@
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from server.config.settings import settings
+from server.db.query_stats import QueryStats, track_queries
+from server.helpers.logger_helper import LoggerHelper
+
+
+def report_query_stats(stats: QueryStats) -> None:
+    message = f"SQL {stats.label}: {stats.statements} statements, {stats.rows} filas, {stats.elapsed_ms:.1f} ms"
+    if 0 < settings.SQL_QUERY_BUDGET_WARNING < stats.statements:
+        LoggerHelper.warning(f"{message} (presupuesto {settings.SQL_QUERY_BUDGET_WARNING})")
+    else:
+        LoggerHelper.debug(message)
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """Cuenta los statements SQL de cada request REST, etiquetados con la ruta (`GET /api/v1/tasks/{task_id}`)."""
+
+    async def dispatch(self, request: Request, call_next):
+        if not request.url.path.startswith("/api/"):
+            return await call_next(request)
+        with track_queries(f"{request.method} {request.url.path}") as stats:
+            response = await call_next(request)
+        route = request.scope.get("route")
+        if route is not None:
+            stats.label = f"{request.method} {route.path}"
+        report_query_stats(stats)
+        if settings.SQL_QUERY_STATS_EXTENSION:
+            response.headers["Server-Timing"] = stats.server_timing()
+        return response
@@ -0,0 +1,45 @@
+# ruff: noqa: E501
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "012_create_crm_counters_postgresql_20260901090000"
+description = "Create CRM counters maintained by the CRM services and backfill them"
+
+NO_SCOPE = "'00000000-0000-0000-0000-000000000000'::uuid"
+COUNTED_TABLES = {
+    "companies": "crm_companies",
+    "contacts": "crm_contacts",
+    "leads": "crm_leads",
+    "activities": "crm_activities",
+}
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.execute(
+        text("""
+        CREATE TABLE IF NOT EXISTS crm_counters (
+            organization_id UUID NOT NULL REFERENCES crm_organizations(id) ON DELETE CASCADE,
+            team_id UUID NOT NULL, owner_id UUID NOT NULL, entity VARCHAR(30) NOT NULL, stage VARCHAR(30) NOT NULL DEFAULT '',
+            total BIGINT NOT NULL DEFAULT 0, value NUMERIC(18,2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (organization_id, team_id, owner_id, entity, stage)
+        )
+    """)
+    )
+    await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_crm_counters_owner_id ON crm_counters (owner_id)"))
+    await conn.execute(text("DELETE FROM crm_counters"))
+    for entity, table in COUNTED_TABLES.items():
+        await conn.execute(
+            text(f"""
+            INSERT INTO crm_counters (organization_id, team_id, owner_id, entity, stage, total, value)
+            SELECT organization_id, COALESCE(team_id, {NO_SCOPE}), COALESCE(owner_id, {NO_SCOPE}), '{entity}', '', count(*), 0
+            FROM {table} GROUP BY 1, 2, 3
+        """)
+        )
+    await conn.execute(
+        text(f"""
+        INSERT INTO crm_counters (organization_id, team_id, owner_id, entity, stage, total, value)
+        SELECT organization_id, COALESCE(team_id, {NO_SCOPE}), COALESCE(owner_id, {NO_SCOPE}), 'opportunities', stage, count(*), sum(value)
+        FROM crm_opportunities GROUP BY 1, 2, 3, 5
+    """)
+    )
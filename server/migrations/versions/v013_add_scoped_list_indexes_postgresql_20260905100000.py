@@ -0,0 +1,48 @@
+# ruff: noqa: E501
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "013_add_scoped_list_indexes_postgresql_20260905100000"
+description = "Add composite indexes matching scoped keyset list queries"
+
+CRM_TABLES = ("crm_companies", "crm_contacts", "crm_leads", "crm_opportunities", "crm_activities")
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # Las listas paginan por keyset (created_at DESC, id DESC) dentro del alcance: el índice entrega las filas ya
+    # ordenadas y el LIMIT corta el recorrido. Las migraciones corren en una transacción, así que no hay CONCURRENTLY.
+    for table in CRM_TABLES:
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_org_created ON {table} (organization_id, created_at DESC, id DESC)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_org_owner_created ON {table} (organization_id, owner_id, created_at DESC, id DESC)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_org_team_created ON {table} (organization_id, team_id, created_at DESC, id DESC)"
+            )
+        )
+        # Cubierto por el prefijo de ix_{table}_org_created; team_id/owner_id simples se quedan para los ON DELETE SET NULL
+        await conn.execute(text(f"DROP INDEX IF EXISTS ix_{table}_organization_id"))
+
+    # Borrar una empresa, contacto, lead u oportunidad elimina sus actividades en cascada
+    for column in ("company_id", "contact_id", "lead_id", "opportunity_id"):
+        await conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_crm_activities_{column} ON crm_activities ({column})"))
+
+    await conn.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_tasks_project_created ON tasks (project_id, created_at DESC, id DESC)")
+    )
+    await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_created ON tasks (created_at DESC, id DESC)"))
+    await conn.execute(text("DROP INDEX IF EXISTS ix_tasks_project_id"))
+    await conn.execute(
+        text(
+            "CREATE INDEX IF NOT EXISTS ix_projects_active_created ON projects (created_at DESC, id DESC) WHERE archived_at IS NULL"
+        )
+    )
+    await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_created ON users (created_at DESC, id DESC)"))
@@ -0,0 +1,46 @@
+# ruff: noqa: E501
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "014_add_crm_search_postgresql_20260910110000"
+description = "Add generated search columns and GIN indexes for CRM search"
+
+# Campos buscables por tabla, en orden de peso (A, B, C): nombre, email, teléfono
+SEARCH_FIELDS = {
+    "crm_companies": ("name", "email", "phone"),
+    "crm_contacts": ("name || ' ' || lastname", "email", "phone"),
+    "crm_leads": ("name", "source", None),
+}
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # btree_gin permite anteponer organization_id a la llave GIN: el índice ya filtra por organización
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS btree_gin"))
+    for table, fields in SEARCH_FIELDS.items():
+        present = [(field, weight) for field, weight in zip(fields, "ABC") if field]
+        vector = " || ".join(
+            f"setweight(to_tsvector('simple', coalesce({field}, '')), '{weight}')" for field, weight in present
+        )
+        search_text = " || ' ' || ".join(f"coalesce({field}, '')" for field, _ in present)
+        await conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED"
+            )
+        )
+        await conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (lower({search_text})) STORED"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search_vector ON {table} USING gin (organization_id, search_vector)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search_text ON {table} USING gin (organization_id, search_text gin_trgm_ops)"
+            )
+        )
@@ -0,0 +1,33 @@
+# ruff: noqa: E501
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "015_add_list_filter_indexes_postgresql_20260915090000"
+description = "Add composite indexes for list filters and sorts"
+
+# Deben coincidir con `list_indexes` de cada repositorio: el compilador de filtros rechaza lo que no cubren
+INDEXES = (
+    ("ix_crm_companies_org_status_created", "crm_companies", "organization_id, status, created_at DESC, id DESC"),
+    ("ix_crm_companies_org_name", "crm_companies", "organization_id, name, id"),
+    ("ix_crm_contacts_org_status_created", "crm_contacts", "organization_id, status, created_at DESC, id DESC"),
+    ("ix_crm_contacts_org_company_created", "crm_contacts", "organization_id, company_id, created_at DESC, id DESC"),
+    ("ix_crm_leads_org_status_created", "crm_leads", "organization_id, status, created_at DESC, id DESC"),
+    ("ix_crm_leads_org_score", "crm_leads", "organization_id, score, id"),
+    ("ix_crm_opportunities_org_stage_created", "crm_opportunities", "organization_id, stage, created_at DESC, id DESC"),
+    ("ix_crm_opportunities_org_value", "crm_opportunities", "organization_id, value, id"),
+    ("ix_crm_activities_org_status_created", "crm_activities", "organization_id, status, created_at DESC, id DESC"),
+    (
+        "ix_crm_activities_org_type_created",
+        "crm_activities",
+        "organization_id, activity_type, created_at DESC, id DESC",
+    ),
+    ("ix_tasks_project_status_created", "tasks", "project_id, status, created_at DESC, id DESC"),
+    ("ix_tasks_project_assignee_created", "tasks", "project_id, assignee_id, created_at DESC, id DESC"),
+)
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # Igualdades primero y luego (orden, id): el índice entrega las filas filtradas ya ordenadas en ambos sentidos
+    for name, table, columns in INDEXES:
+        await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
@@ -0,0 +1,12 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "016_add_audit_log_aggregation_postgresql_20260920090000"
+description = "Add aggregation columns to audit logs"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    # Las filas existentes representan un solo evento; la ventana vacía se lee como `created_at`
+    await conn.execute(text("ALTER TABLE audit_logs ADD COLUMN IF NOT EXISTS count INTEGER NOT NULL DEFAULT 1"))
+    await conn.execute(text("ALTER TABLE audit_logs ADD COLUMN IF NOT EXISTS first_seen_at TIMESTAMP WITH TIME ZONE"))
+    await conn.execute(text("ALTER TABLE audit_logs ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMP WITH TIME ZONE"))
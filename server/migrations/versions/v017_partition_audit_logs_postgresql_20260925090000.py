@@ -0,0 +1,77 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from server.repositories.audit_partitions import (
+    AUDIT_TABLE,
+    DEFAULT_PARTITION,
+    add_months,
+    month_bound,
+    month_start,
+    partition_name,
+)
+
+version = "017_partition_audit_logs_postgresql_20260925090000"
+description = "Convert audit logs to a monthly range-partitioned table"
+
+MONTHS_AHEAD = 3
+COLUMNS = (
+    "id, user_id, module, action, resource_type, resource_id, status, metadata, created_at, "
+    "count, first_seen_at, last_seen_at"
+)
+# Reemplazan los siete índices de una columna: cada uno se crea por partición y se poda junto con ella
+INDEXES = (
+    ("ix_audit_logs_created_at", "created_at"),
+    ("ix_audit_logs_user_created", "user_id, created_at"),
+    ("ix_audit_logs_module_action_created", "module, action, created_at"),
+    ("ix_audit_logs_resource", "resource_type, resource_id"),
+)
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    relkind = (
+        await conn.execute(text("SELECT relkind FROM pg_class WHERE relname = :table"), {"table": AUDIT_TABLE})
+    ).scalar()
+    if relkind == "p":
+        return
+
+    await conn.execute(text(f"ALTER TABLE {AUDIT_TABLE} RENAME TO {AUDIT_TABLE}_unpartitioned"))
+    await conn.execute(text(f"ALTER INDEX IF EXISTS {AUDIT_TABLE}_pkey RENAME TO {AUDIT_TABLE}_unpartitioned_pkey"))
+    # La clave de partición debe formar parte de la clave primaria
+    await conn.execute(
+        text(
+            f"""
+            CREATE TABLE {AUDIT_TABLE} (
+                id UUID NOT NULL,
+                user_id UUID REFERENCES users(id) ON DELETE SET NULL,
+                module VARCHAR(50) NOT NULL,
+                action VARCHAR(50) NOT NULL,
+                resource_type VARCHAR(50),
+                resource_id VARCHAR(100),
+                status VARCHAR(30) NOT NULL,
+                metadata JSONB,
+                created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+                count INTEGER NOT NULL DEFAULT 1,
+                first_seen_at TIMESTAMP WITH TIME ZONE,
+                last_seen_at TIMESTAMP WITH TIME ZONE,
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at)
+            """
+        )
+    )
+    # Red de seguridad para filas fuera de las particiones creadas; `audit-partitions` las mueve a su mes
+    await conn.execute(text(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {AUDIT_TABLE} DEFAULT"))
+
+    oldest = (await conn.execute(text(f"SELECT min(created_at) FROM {AUDIT_TABLE}_unpartitioned"))).scalar()
+    current = month_start(datetime.now(timezone.utc))
+    month = month_start(oldest) if oldest and month_start(oldest) < current else current
+    while month <= add_months(current, MONTHS_AHEAD):
+        bounds = f"FROM ('{month_bound(month).isoformat()}') TO ('{month_bound(add_months(month, 1)).isoformat()}')"
+        await conn.execute(text(f"CREATE TABLE {partition_name(month)} PARTITION OF {AUDIT_TABLE} FOR VALUES {bounds}"))
+        month = add_months(month, 1)
+
+    await conn.execute(text(f"INSERT INTO {AUDIT_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {AUDIT_TABLE}_unpartitioned"))
+    await conn.execute(text(f"DROP TABLE {AUDIT_TABLE}_unpartitioned"))
+    for name, columns in INDEXES:
+        await conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {AUDIT_TABLE} ({columns})"))
@@ -0,0 +1,11 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+version = "018_add_users_name_keyset_index_postgresql_20260930090000"
+description = "Page users by (name, id) instead of (created_at, id)"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    await conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_name_id ON users (name, id)"))
+    # Ningún listado ordena usuarios por fecha de creación
+    await conn.execute(text("DROP INDEX IF EXISTS ix_users_created"))
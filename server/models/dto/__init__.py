@@ -10,7 +10,7 @@ from server.models.dto.permission_dto import (
     PermissionItemModel,
     PermissionListModel,
 )
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.models.dto.role_dto import (
     AssignPermissionsModel,
     CreateRoleModel,
@@ -29,6 +29,7 @@ from server.models.dto.user_dto import (
 
 __all__ = [
     "ResponseModel",
+    "ConnectionResponseModel",
     "ActionItemModel",
     "ActionListModel",
     "CreateActionModel",
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Any, List, Optional
 
-from pydantic import AliasChoices, BaseModel, Field, RootModel, field_validator
+from pydantic import AliasChoices, BaseModel, Field, RootModel, field_validator, model_validator
 
 from server.models.dto.project_dto import validate_uuid_value
 
@@ -49,9 +49,39 @@ class AuditLogItemModel(BaseModel):
         validation_alias=AliasChoices("metadata_json", "metadata"),
     )
     created_at: datetime = Field(..., alias="createdAt")
+    count: int = 1
+    first_seen_at: Optional[datetime] = Field(default=None, alias="firstSeenAt")
+    last_seen_at: Optional[datetime] = Field(default=None, alias="lastSeenAt")
 
     model_config = {"populate_by_name": True, "from_attributes": True}
 
+    @model_validator(mode="after")
+    def default_seen_window(self):
+        # Las filas no agregadas representan un solo evento: su ventana es `created_at`
+        self.count = self.count or 1
+        self.first_seen_at = self.first_seen_at or self.created_at
+        self.last_seen_at = self.last_seen_at or self.created_at
+        return self
+
+
+class AuditLogRangeModel(BaseModel):
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+
 
 class AuditLogListModel(RootModel):
     root: List[AuditLogItemModel]
+
+
+class AuditPolicyModel(BaseModel):
+    module: str = "*"
+    action: str = "*"
+    status: str = "*"
+    sample_rate: float = Field(default=1.0, alias="sampleRate", ge=0, le=1)
+    aggregate_window_seconds: int = Field(default=0, alias="aggregateWindowSeconds", ge=0)
+
+    model_config = {"populate_by_name": True}
+
+    def matches(self, module: str, action: str, status: str) -> bool:
+        rules = ((self.module, module), (self.action, action), (self.status, status))
+        return all(rule in ("*", value) for rule, value in rules)
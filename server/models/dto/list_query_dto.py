@@ -0,0 +1,52 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+
+class ValueFilterModel(BaseModel):
+    """Condiciones sobre un campo; varias a la vez se combinan con AND."""
+
+    eq: Any = None
+    in_: list[Any] | None = Field(default=None, alias="in", min_length=1, max_length=100)
+    gte: Any = None
+    lte: Any = None
+    is_null: bool | None = Field(default=None, alias="isNull")
+    model_config = {"populate_by_name": True, "extra": "forbid"}
+
+    @property
+    def is_equality(self) -> bool:
+        return self.eq is not None or self.in_ is not None or self.is_null is True
+
+    @property
+    def is_range(self) -> bool:
+        return self.gte is not None or self.lte is not None or self.is_null is False
+
+
+class ListSortModel(BaseModel):
+    field: str = "createdAt"
+    direction: Literal["ASC", "DESC"] = "DESC"
+
+    @field_validator("direction", mode="before")
+    @classmethod
+    def upper_direction(cls, value):
+        return value.upper() if isinstance(value, str) else value
+
+    @classmethod
+    def parse(cls, value: str) -> "ListSortModel":
+        """Formato REST: `createdAt` ordena ascendente y `-createdAt` descendente."""
+        if value.startswith("-"):
+            return cls(field=value[1:], direction="DESC")
+        return cls(field=value, direction="ASC")
+
+
+class ListQueryModel(BaseModel):
+    """Filtros (por nombre de campo GraphQL) y orden de una consulta de lista."""
+
+    filter: dict[str, ValueFilterModel] = Field(default_factory=dict)
+    sort: ListSortModel | None = None
+
+    @classmethod
+    def from_input(cls, filter: dict | None = None, sort: dict | None = None) -> "ListQueryModel | None":
+        if not filter and not sort:
+            return None
+        return cls(filter={key: value for key, value in (filter or {}).items() if value is not None}, sort=sort)
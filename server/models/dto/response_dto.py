@@ -14,3 +14,24 @@ class ResponseModel(BaseModel, Generic[T]):
         "populate_by_name": True,
         "from_attributes": True,
     }
+
+
+class ConnectionResponseModel(ResponseModel[T], Generic[T]):
+    """Respuesta de listas paginadas: `data` conserva los nodos y se agregan `edges`/`pageInfo` estilo Relay."""
+
+    edges: list[dict] = Field(default_factory=list, description="Nodos con su cursor")
+    page_info: dict = Field(default_factory=dict, alias="pageInfo", description="Estado de la paginación")
+
+    @property
+    def pageInfo(self) -> dict:  # ariadne resuelve el campo GraphQL `pageInfo` con getattr
+        return self.page_info
+
+    @classmethod
+    def from_connection(cls, connection: dict, message: str, status: int = 200) -> "ConnectionResponseModel":
+        return cls(
+            status=status,
+            message=message,
+            data=connection["nodes"],
+            edges=connection["edges"],
+            page_info=connection["pageInfo"],
+        )
@@ -6,7 +6,6 @@ from pydantic import BaseModel, EmailStr, Field, RootModel, field_validator, mod
 
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.models.dto.role_dto import RoleItemModel
-from server.utils.auth_utils import hash_password
 
 
 class RegisterModel(BaseModel):
@@ -27,7 +26,6 @@ class RegisterModel(BaseModel):
     def check_password_match(self):
         if self.password != self.confirm_password:
             raise CustomGraphQLExceptionHelper("Password mismatch.")
-        self.password = hash_password(self.password)
         del self.__dict__["confirm_password"]
         return self
 
@@ -60,7 +58,6 @@ class ResetPasswordModel(BaseModel):
     def check_password_match(self):
         if self.password != self.confirm_password:
             raise CustomGraphQLExceptionHelper("Password mismatch.")
-        self.password = hash_password(self.password)
         del self.__dict__["confirm_password"]
         return self
 
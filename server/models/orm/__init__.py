@@ -3,6 +3,7 @@ from server.models.orm.activity_orm import ActivityORM
 from server.models.orm.audit_log_orm import AuditLogORM
 from server.models.orm.company_orm import CompanyORM
 from server.models.orm.contact_orm import ContactORM
+from server.models.orm.crm_counter_orm import CRMCounterORM
 from server.models.orm.crm_organization_orm import CRMOrganizationORM
 from server.models.orm.crm_team_orm import CRMTeamMemberORM, CRMTeamORM
 from server.models.orm.lead_orm import LeadORM
@@ -37,4 +38,5 @@ __all__ = [
     "LeadORM",
     "OpportunityORM",
     "ActivityORM",
+    "CRMCounterORM",
 ]
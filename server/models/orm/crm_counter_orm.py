@@ -0,0 +1,23 @@
+import uuid
+from decimal import Decimal
+
+from sqlalchemy import BigInteger, ForeignKey, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from server.db.session import Base
+
+
+class CRMCounterORM(Base):
+    """Conteos agregados por (organización, equipo, dueño, entidad, etapa); equipo/dueño ausente = UUID nulo."""
+
+    __tablename__ = "crm_counters"
+    organization_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("crm_organizations.id", ondelete="CASCADE"), primary_key=True
+    )
+    team_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    owner_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, index=True)
+    entity: Mapped[str] = mapped_column(String(30), primary_key=True)
+    stage: Mapped[str] = mapped_column(String(30), primary_key=True, default="")
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    value: Mapped[Decimal] = mapped_column(Numeric(18, 2), nullable=False, default=0)
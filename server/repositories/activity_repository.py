@@ -6,3 +6,13 @@ from server.repositories.scoped_resource_repository import ScopedResourceReposit
 @singleton
 class ActivityRepository(ScopedResourceRepository[ActivityORM]):
     model = ActivityORM
+    filterable_fields = {
+        **ScopedResourceRepository.filterable_fields,
+        "status": "status",
+        "activityType": "activity_type",
+    }
+    list_indexes = (
+        *ScopedResourceRepository.list_indexes,
+        ("organization_id", "status", "created_at", "id"),
+        ("organization_id", "activity_type", "created_at", "id"),
+    )
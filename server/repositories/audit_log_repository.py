@@ -1,13 +1,26 @@
+import uuid
+from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.db.session import AsyncSessionLocal
 from server.decorators.singleton_decorator import singleton
+from server.helpers.logger_helper import LoggerHelper
 from server.models.orm.audit_log_orm import AuditLogORM
 from server.repositories.base_repository import BaseRepository
 
+FOREIGN_KEY_VIOLATION_SQLSTATE = "23503"
+
+
+def is_foreign_key_violation(error: BaseException) -> bool:
+    if not isinstance(error, DBAPIError):
+        return False
+    orig = error.orig
+    return FOREIGN_KEY_VIOLATION_SQLSTATE in (getattr(orig, "sqlstate", None), getattr(orig, "pgcode", None))
+
 
 @singleton
 class AuditLogRepository(BaseRepository[AuditLogORM]):
@@ -20,14 +33,64 @@ class AuditLogRepository(BaseRepository[AuditLogORM]):
             await session.commit()
             await session.refresh(audit_log)
             return audit_log
-        async with AsyncSessionLocal() as db_session:
+        # Sesión propia: el registro (p.ej. un acceso denegado) sobrevive al rollback de la operación
+        async with AsyncSessionLocal.independent() as db_session:
             db_session.add(audit_log)
             await db_session.commit()
             await db_session.refresh(audit_log)
             return audit_log
 
-    async def find_all(self, limit: int = 100, session: Optional[AsyncSession] = None) -> List[AuditLogORM]:
+    async def insert_many(self, rows: list[dict]) -> int:
+        """INSERT multi-fila sin `RETURNING` en una sesión propia, fuera del unit of work (sink de auditoría).
+
+        Si el lote falla por una fila inválida se reintenta fila por fila, para que una sola no envenene el lote (y
+        su reinserción desde el spill). Los errores de conexión se propagan y el sink guarda el lote completo.
+        """
+        if not rows:
+            return 0
+        # Mismas columnas en todas las filas: las agregadas traen `count` y su ventana, las demás no
+        defaults = {"count": 1, "first_seen_at": None, "last_seen_at": None}
+        params = [{"id": uuid.uuid4(), **defaults, **self._column_values(row)} for row in rows]
+        try:
+            await self._insert(params)
+        except (IntegrityError, DataError) as exc:
+            LoggerHelper.warning(f"Lote de {len(params)} audit logs rechazado, se reintenta fila por fila: {exc}")
+            return await self._insert_one_by_one(params)
+        return len(params)
+
+    async def _insert(self, params: list[dict]) -> None:
+        async with AsyncSessionLocal.independent() as db_session:
+            await db_session.execute(insert(AuditLogORM), params)
+            await db_session.commit()
+
+    async def _insert_one_by_one(self, params: list[dict]) -> int:
+        inserted = 0
+        for row in params:
+            try:
+                await self._insert([row])
+            except (IntegrityError, DataError) as exc:
+                if not (row.get("user_id") and is_foreign_key_violation(exc)):
+                    LoggerHelper.error(f"Audit log descartado por datos inválidos: {exc}")
+                    continue
+                # Usuario eliminado mientras su decisión esperaba en la cola: se conserva el id en `metadata`
+                metadata = {**(row.get("metadata_json") or {}), "deletedUserId": str(row["user_id"])}
+                await self._insert([{**row, "user_id": None, "metadata_json": metadata}])
+            inserted += 1
+        return inserted
+
+    async def find_all(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        session: Optional[AsyncSession] = None,
+    ) -> List[AuditLogORM]:
         stmt = select(AuditLogORM).order_by(AuditLogORM.created_at.desc()).limit(limit)
+        # Rango sobre la clave de partición: el planner descarta los meses fuera de [since, until)
+        if since:
+            stmt = stmt.where(AuditLogORM.created_at >= since)
+        if until:
+            stmt = stmt.where(AuditLogORM.created_at < until)
         if session:
             res = await session.execute(stmt)
             return list(res.scalars().all())
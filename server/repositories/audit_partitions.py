@@ -0,0 +1,110 @@
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+AUDIT_TABLE = "audit_logs"
+DEFAULT_PARTITION = f"{AUDIT_TABLE}_default"
+PARTITION_NAME = re.compile(rf"^{AUDIT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+@dataclass
+class PartitionPlan:
+    create: list[date] = field(default_factory=list)
+    expire: list[date] = field(default_factory=list)
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{AUDIT_TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> date | None:
+    match = PARTITION_NAME.match(name)
+    return date(int(match[1]), int(match[2]), 1) if match else None
+
+
+def month_bound(month: date) -> datetime:
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+
+def plan_partitions(existing: list[date], today: date, months_ahead: int, retention_months: int) -> PartitionPlan:
+    """Meses a crear (el actual y `months_ahead` siguientes) y a vencer (los que terminan antes de la retención).
+
+    `retention_months=0` conserva todo.
+    """
+    current = month_start(today)
+    wanted = [add_months(current, offset) for offset in range(max(months_ahead, 0) + 1)]
+    plan = PartitionPlan(create=[month for month in wanted if month not in existing])
+    if retention_months > 0:
+        cutoff = add_months(current, -retention_months)
+        plan.expire = sorted(month for month in existing if add_months(month, 1) <= cutoff)
+    return plan
+
+
+async def attached_partitions(conn: AsyncConnection) -> list[date]:
+    result = await conn.execute(
+        text("""
+            SELECT child.relname FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            WHERE parent.relname = :table
+        """),
+        {"table": AUDIT_TABLE},
+    )
+    return sorted(month for month in map(partition_month, result.scalars().all()) if month)
+
+
+async def create_partition(conn: AsyncConnection, month: date) -> None:
+    """Crea la partición del mes moviendo antes las filas que hayan caído en la partición por defecto.
+
+    `ATTACH PARTITION` falla si la partición por defecto tiene filas de ese rango, por eso se crea la tabla suelta,
+    se mueven las filas y recién ahí se adjunta.
+    """
+    name, start, end = partition_name(month), month_bound(month), month_bound(add_months(month, 1))
+    await conn.execute(text(f"CREATE TABLE {name} (LIKE {AUDIT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+    await conn.execute(
+        text(f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION} WHERE created_at >= :start AND created_at < :end RETURNING *
+            )
+            INSERT INTO {name} SELECT * FROM moved
+        """),
+        {"start": start, "end": end},
+    )
+    bounds = f"FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    await conn.execute(text(f"ALTER TABLE {AUDIT_TABLE} ATTACH PARTITION {name} FOR VALUES {bounds}"))
+
+
+async def expire_partition(conn: AsyncConnection, month: date, drop: bool = False) -> None:
+    """Separa la partición (queda como tabla suelta para archivarla) o la elimina con `drop=True`."""
+    name = partition_name(month)
+    await conn.execute(text(f"ALTER TABLE {AUDIT_TABLE} DETACH PARTITION {name}"))
+    if drop:
+        await conn.execute(text(f"DROP TABLE {name}"))
+
+
+async def manage_partitions(
+    conn: AsyncConnection,
+    months_ahead: int,
+    retention_months: int,
+    drop: bool = False,
+    today: date | None = None,
+) -> PartitionPlan:
+    existing = await attached_partitions(conn)
+    plan = plan_partitions(existing, today or datetime.now(timezone.utc).date(), months_ahead, retention_months)
+    for month in plan.create:
+        await create_partition(conn, month)
+    for month in plan.expire:
+        await expire_partition(conn, month, drop)
+    return plan
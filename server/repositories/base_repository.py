@@ -1,10 +1,34 @@
 import uuid
-from typing import Generic, TypeVar
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, Generic, TypeVar
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    Insert,
+    Select,
+    Update,
+    any_,
+    bindparam,
+    column,
+    delete,
+    insert,
+    inspect,
+    literal,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from server.db.session import AsyncSessionLocal
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.data_loader_helper import DataLoader, get_data_loader
+from server.models.dto.list_query_dto import ListQueryModel
+from server.repositories.list_query_compiler import CompiledListQuery, compile_list_query
+from server.utils.pagination_utils import Page, cursor_order, decode_cursor, encode_cursor, page_size
 
 ModelT = TypeVar("ModelT")
 
@@ -22,45 +46,260 @@ class BaseRepository(Generic[ModelT]):
     """CRUD común para entidades SQLAlchemy con una llave primaria `id`."""
 
     model: type[ModelT]
+    # Opciones de carga (selectinload/joinedload) que se aplican a las lecturas por id y por lote
+    load_options: tuple = ()
+    # Columnas del keyset usado por `paginate`; deben identificar una fila de forma única
+    keyset_columns: tuple[str, ...] = ("created_at", "id")
+    keyset_descending: bool = True
+    # Relaciones que el DTO necesita tras un INSERT/UPDATE … RETURNING; deben ser `selectinload`
+    # (un `joinedload`, incluido `lazy="joined"` del mapper, no se aplica sobre RETURNING)
+    returning_options: tuple = ()
+    # Filtros y orden de las listas (nombre GraphQL -> columna) y los índices que los soportan, ver
+    # `list_query_compiler`: cada índice es la tupla de columnas tal como la crean las migraciones
+    filterable_fields: dict[str, str] = {}
+    sortable_fields: dict[str, str] = {"createdAt": "created_at"}
+    list_indexes: tuple[tuple[str, ...], ...] = ()
 
     async def create(self, data: dict, session: AsyncSession | None = None) -> ModelT:
-        instance = self.model(**data)
-        if session:
-            session.add(instance)
-            await session.flush()
-            await session.refresh(instance)
-            return instance
-        async with AsyncSessionLocal() as db:
-            db.add(instance)
-            await db.commit()
-            await db.refresh(instance)
-            return instance
+        """`INSERT … RETURNING` en un solo viaje; la fila devuelta ya trae defaults e id."""
+        return await self._execute_returning(insert(self.model).values(**self._column_values(data)), session)
 
     async def find_by_id(self, entity_id, session: AsyncSession | None = None) -> ModelT | None:
         parsed_id = parse_uuid(entity_id)
         if not parsed_id:
             return None
-        stmt = select(self.model).where(self.model.id == parsed_id)
+        stmt = select(self.model).options(*self.load_options).where(self.model.id == parsed_id)
         if session:
             return (await session.execute(stmt)).scalar_one_or_none()
         async with AsyncSessionLocal() as db:
             return (await db.execute(stmt)).scalar_one_or_none()
 
+    async def find_by_ids(self, entity_ids, session: AsyncSession | None = None) -> list[ModelT | None]:
+        """Lee varias entidades con un solo `WHERE id = ANY(:ids)`; conserva el orden de `entity_ids`."""
+        parsed_ids = [parse_uuid(entity_id) for entity_id in entity_ids]
+        unique_ids = list(dict.fromkeys(entity_id for entity_id in parsed_ids if entity_id))
+        if not unique_ids:
+            return [None] * len(parsed_ids)
+        ids_param = bindparam("ids", unique_ids, type_=ARRAY(self.model.id.type))
+        stmt = select(self.model).options(*self.load_options).where(self.model.id == any_(ids_param))
+        if session:
+            rows = (await session.execute(stmt)).scalars().all()
+        else:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(stmt)).scalars().all()
+        by_id = {row.id: row for row in rows}
+        return [by_id.get(entity_id) for entity_id in parsed_ids]
+
+    def projection_options(self, attributes: Iterable[str]) -> tuple:
+        """`load_only` con las columnas pedidas (más id y keyset); las relaciones se cargan solo si se piden."""
+        mapper = inspect(self.model)
+        requested = set(attributes) | {"id", *self.keyset_columns}
+        relationships = [relationship for key, relationship in mapper.relationships.items() if key in requested]
+        for relationship in relationships:
+            requested.update(column.key for column in relationship.local_columns)
+        columns = [getattr(self.model, key) for key in mapper.column_attrs.keys() if key in requested]
+        return (load_only(*columns), *(self.load_options if relationships else ()))
+
+    async def paginate(
+        self,
+        stmt: Select,
+        first: int | None = None,
+        after: str | None = None,
+        session: AsyncSession | None = None,
+        columns: Iterable[str] | None = None,
+        keyset: CompiledListQuery | None = None,
+    ) -> Page[ModelT]:
+        """Ejecuta `stmt` paginando por keyset `(keyset_columns) < cursor`, sin OFFSET.
+
+        Con `columns` solo se cargan esas columnas (ver `projection_options`); `keyset` reemplaza el orden por
+        defecto con el de una consulta compilada.
+        """
+        limit = page_size(first)
+        keyset_columns = keyset.keyset_columns if keyset else self.keyset_columns
+        descending = keyset.descending if keyset else self.keyset_descending
+        order = cursor_order(keyset_columns, descending)
+        stmt = self.page_statement(stmt, first, after, columns, keyset)
+        if session:
+            rows = list((await session.execute(stmt)).scalars().all())
+        else:
+            async with AsyncSessionLocal() as db:
+                rows = list((await db.execute(stmt)).scalars().all())
+        items = rows[:limit]
+        return Page(
+            items=items,
+            cursors=[encode_cursor((getattr(item, name) for name in keyset_columns), order) for item in items],
+            has_next_page=len(rows) > limit,
+            has_previous_page=after is not None,
+        )
+
+    def page_statement(
+        self,
+        stmt: Select,
+        first: int | None = None,
+        after: str | None = None,
+        columns: Iterable[str] | None = None,
+        keyset: CompiledListQuery | None = None,
+    ) -> Select:
+        """El SELECT que ejecuta `paginate` (una fila extra para saber si hay página siguiente)."""
+        limit = page_size(first)
+        keyset_columns = keyset.keyset_columns if keyset else self.keyset_columns
+        descending = keyset.descending if keyset else self.keyset_descending
+        if columns is not None:
+            stmt = stmt.options(*self.projection_options(set(columns) | set(keyset_columns)))
+        columns = [getattr(self.model, name) for name in keyset_columns]
+        if after:
+            bound = tuple_(
+                *(
+                    literal(self._parse_keyset_value(column, value), column.type)
+                    for column, value in zip(
+                        columns, decode_cursor(after, len(columns), cursor_order(keyset_columns, descending))
+                    )
+                )
+            )
+            row = tuple_(*columns)
+            stmt = stmt.where(row < bound if descending else row > bound)
+        ordering = [column.desc() if descending else column.asc() for column in columns]
+        return stmt.order_by(None).order_by(*ordering).limit(limit + 1)
+
+    def compile_list_query(
+        self, list_query: ListQueryModel, base_columns: Iterable[str] = (), scope_columns: Iterable[str] = ()
+    ) -> CompiledListQuery:
+        return compile_list_query(
+            self.model,
+            list_query,
+            self.filterable_fields,
+            self.sortable_fields,
+            self.list_indexes,
+            base_columns,
+            scope_columns,
+        )
+
+    def apply_list_query(self, stmt: Select, compiled: CompiledListQuery) -> Select:
+        """Agrega los filtros y el orden de la consulta compilada (para lecturas sin paginar)."""
+        columns = [getattr(self.model, name) for name in compiled.keyset_columns]
+        ordering = [column.desc() if compiled.descending else column.asc() for column in columns]
+        return stmt.where(*compiled.predicates).order_by(None).order_by(*ordering)
+
+    @staticmethod
+    def _parse_keyset_value(column, value: str):
+        try:
+            python_type = column.type.python_type
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            return python_type(value)
+        except (ValueError, TypeError, ArithmeticError, NotImplementedError) as exc:
+            # ArithmeticError: `Decimal("2026-…")` lanza decimal.InvalidOperation
+            raise CustomGraphQLExceptionHelper("Cursor inválido") from exc
+
+    def loader(self, scope: Any) -> DataLoader:
+        """DataLoader por request (contexto GraphQL o `Request`) que agrupa los `find_by_id` del mismo tick."""
+        return get_data_loader(scope, f"{type(self).__module__}.{type(self).__qualname__}", self.find_by_ids)
+
     async def update(self, entity_id, data: dict, session: AsyncSession | None = None) -> ModelT | None:
-        instance = await self.find_by_id(entity_id, session)
-        if not instance:
+        """`UPDATE … WHERE id = :id RETURNING` en un solo viaje; `None` si el id no existe.
+
+        Los valores `None` y las llaves que no son columnas se ignoran.
+        """
+        parsed_id = parse_uuid(entity_id)
+        if not parsed_id:
             return None
-        for key, value in data.items():
-            if hasattr(instance, key) and value is not None:
-                setattr(instance, key, value)
+        values = self._column_values(data, skip_none=True)
+        if not values:
+            return await self.find_by_id(parsed_id, session)
+        stmt = update(self.model).where(self.model.id == parsed_id).values(**values)
+        return await self._execute_returning(stmt, session)
+
+    async def create_many(self, rows: list[dict], session: AsyncSession | None = None) -> list[ModelT]:
+        """INSERT multi-fila `… RETURNING`; devuelve las entidades en el orden de `rows`."""
+        if not rows:
+            return []
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True).options(*self.returning_options)
+        params = [self._column_values(row) for row in rows]
         if session:
-            await session.flush()
-            await session.refresh(instance)
-            return instance
+            return list((await session.execute(stmt, params)).scalars().all())
+        async with AsyncSessionLocal() as db:
+            instances = list((await db.execute(stmt, params)).scalars().all())
+            await db.commit()
+            return instances
+
+    async def update_many(
+        self, changes: list[tuple[Any, dict]], session: AsyncSession | None = None
+    ) -> list[ModelT | None]:
+        """Actualiza `(id, data)` con un `UPDATE … FROM (VALUES …) RETURNING` por cada combinación de columnas.
+
+        Igual que `update`, ignora `None` y llaves que no son columnas; devuelve `None` para los ids inexistentes.
+        """
+        parsed_ids = [parse_uuid(entity_id) for entity_id, _ in changes]
+        pending: dict[Any, dict] = {}
+        for parsed_id, (_, data) in zip(parsed_ids, changes):
+            if parsed_id:
+                pending.setdefault(parsed_id, {}).update(self._column_values(data, skip_none=True))
+        groups: dict[tuple[str, ...], list[tuple]] = {}
+        for parsed_id, data in pending.items():
+            keys = tuple(sorted(data))
+            groups.setdefault(keys, []).append((parsed_id, *(data[key] for key in keys)))
+        statements = [self._bulk_update_statement(keys, rows) for keys, rows in groups.items() if keys]
+        unchanged = list(groups.get((), ()))
+
+        async def execute(db: AsyncSession) -> dict:
+            results = {}
+            for stmt in statements:
+                results.update((instance.id, instance) for instance in (await db.execute(stmt)).scalars().all())
+            if unchanged:
+                found = await self.find_by_ids([row[0] for row in unchanged], db)
+                results.update((instance.id, instance) for instance in found if instance)
+            return results
+
+        if session:
+            results = await execute(session)
+        else:
+            async with AsyncSessionLocal() as db:
+                results = await execute(db)
+                await db.commit()
+        return [results.get(parsed_id) for parsed_id in parsed_ids]
+
+    def _bulk_update_statement(self, keys: tuple[str, ...], rows: list[tuple]) -> Update:
+        mapper = inspect(self.model)
+        source = values(
+            column("id", self.model.id.type),
+            *(column(key, mapper.column_attrs[key].columns[0].type) for key in keys),
+            name="bulk_values",
+        ).data(rows)
+        return (
+            update(self.model)
+            .where(self.model.id == source.c.id)
+            .values({key: source.c[key] for key in keys})
+            .returning(self.model)
+            .options(*self.returning_options)
+            .execution_options(populate_existing=True)
+        )
+
+    async def delete_many(self, entity_ids, session: AsyncSession | None = None) -> list:
+        """`DELETE … WHERE id = ANY(:ids) RETURNING id`; devuelve los ids que existían."""
+        unique_ids = list(dict.fromkeys(filter(None, (parse_uuid(entity_id) for entity_id in entity_ids))))
+        if not unique_ids:
+            return []
+        ids_param = bindparam("ids", unique_ids, type_=ARRAY(self.model.id.type))
+        stmt = delete(self.model).where(self.model.id == any_(ids_param)).returning(self.model.id)
+        if session:
+            return list((await session.execute(stmt)).scalars().all())
+        async with AsyncSessionLocal() as db:
+            deleted = list((await db.execute(stmt)).scalars().all())
+            await db.commit()
+            return deleted
+
+    def _column_values(self, data: dict, skip_none: bool = False) -> dict:
+        columns = inspect(self.model).column_attrs.keys()
+        return {key: value for key, value in data.items() if key in columns and not (skip_none and value is None)}
+
+    async def _execute_returning(self, stmt: Insert | Update, session: AsyncSession | None) -> ModelT | None:
+        # populate_existing refresca la instancia si ya estaba en la sesión (p.ej. leída por el DataLoader)
+        stmt = stmt.returning(self.model).options(*self.returning_options).execution_options(populate_existing=True)
+        if session:
+            return (await session.execute(stmt)).scalars().one_or_none()
         async with AsyncSessionLocal() as db:
-            db.add(instance)
+            instance = (await db.execute(stmt)).scalars().one_or_none()
             await db.commit()
-            await db.refresh(instance)
             return instance
 
     async def delete(self, entity_id, session: AsyncSession | None = None) -> bool:
@@ -6,3 +6,10 @@ from server.repositories.scoped_resource_repository import ScopedResourceReposit
 @singleton
 class CompanyRepository(ScopedResourceRepository[CompanyORM]):
     model = CompanyORM
+    filterable_fields = {**ScopedResourceRepository.filterable_fields, "status": "status"}
+    sortable_fields = {**ScopedResourceRepository.sortable_fields, "name": "name"}
+    list_indexes = (
+        *ScopedResourceRepository.list_indexes,
+        ("organization_id", "status", "created_at", "id"),
+        ("organization_id", "name", "id"),
+    )
@@ -6,3 +6,9 @@ from server.repositories.scoped_resource_repository import ScopedResourceReposit
 @singleton
 class ContactRepository(ScopedResourceRepository[ContactORM]):
     model = ContactORM
+    filterable_fields = {**ScopedResourceRepository.filterable_fields, "status": "status", "companyId": "company_id"}
+    list_indexes = (
+        *ScopedResourceRepository.list_indexes,
+        ("organization_id", "status", "created_at", "id"),
+        ("organization_id", "company_id", "created_at", "id"),
+    )
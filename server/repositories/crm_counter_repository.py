@@ -0,0 +1,179 @@
+import uuid
+from collections.abc import Iterable
+from decimal import Decimal
+
+from sqlalchemy import any_, bindparam, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.db.session import AsyncSessionLocal
+from server.models.orm.activity_orm import ActivityORM
+from server.models.orm.company_orm import CompanyORM
+from server.models.orm.contact_orm import ContactORM
+from server.models.orm.crm_counter_orm import CRMCounterORM
+from server.models.orm.lead_orm import LeadORM
+from server.models.orm.opportunity_orm import OpportunityORM
+from server.repositories.base_repository import parse_uuid
+
+# La llave primaria no admite NULL: un recurso sin equipo o sin dueño se cuenta bajo el UUID nulo
+NO_SCOPE = uuid.UUID(int=0)
+# Campos que mueven un recurso de un contador a otro
+COUNTED_FIELDS = frozenset({"organization_id", "team_id", "owner_id", "stage", "value"})
+
+# (organization_id, team_id, owner_id, entity, stage) -> (total, value)
+CounterDeltas = dict[tuple, tuple[int, Decimal]]
+
+
+class CRMCounterRepository:
+    """Mantiene `crm_counters`: los servicios CRM aplican deltas en la misma transacción que cada escritura."""
+
+    models = {
+        "companies": CompanyORM,
+        "contacts": ContactORM,
+        "leads": LeadORM,
+        "opportunities": OpportunityORM,
+        "activities": ActivityORM,
+    }
+    # Borrar uno de estos recursos elimina en cascada (FK ON DELETE CASCADE) sus actividades
+    activity_parent_columns = {
+        "companies": ActivityORM.company_id,
+        "contacts": ActivityORM.contact_id,
+        "leads": ActivityORM.lead_id,
+        "opportunities": ActivityORM.opportunity_id,
+    }
+
+    @staticmethod
+    def key(entity: str, row) -> tuple:
+        stage = row.stage if entity == "opportunities" else ""
+        return (row.organization_id, row.team_id or NO_SCOPE, row.owner_id or NO_SCOPE, entity, stage)
+
+    def deltas(self, entity: str, removed: Iterable = (), added: Iterable = (), into: CounterDeltas | None = None):
+        """Acumula -1 por cada fila de `removed` y +1 por cada una de `added` (más su valor si es oportunidad)."""
+        deltas = {} if into is None else into
+        for sign, rows in ((-1, removed), (1, added)):
+            for row in rows:
+                key = self.key(entity, row)
+                value = Decimal(row.value or 0) if entity == "opportunities" else Decimal(0)
+                total, amount = deltas.get(key, (0, Decimal(0)))
+                deltas[key] = (total + sign, amount + sign * value)
+        return deltas
+
+    async def snapshot(self, entity: str, resource_ids, session: AsyncSession) -> list:
+        """Llaves de contador actuales de los recursos, con `FOR UPDATE` para que nadie las cambie antes del write."""
+        ids = list(dict.fromkeys(filter(None, (parse_uuid(resource_id) for resource_id in resource_ids))))
+        if not ids:
+            return []
+        model = self.models[entity]
+        columns = [model.id, model.organization_id, model.team_id, model.owner_id]
+        if entity == "opportunities":
+            columns += [model.stage, model.value]
+        ids_param = bindparam("ids", ids, type_=ARRAY(model.id.type))
+        stmt = select(*columns).where(model.id == any_(ids_param)).with_for_update()
+        return list((await session.execute(stmt)).all())
+
+    async def cascaded_activity_deltas(self, entity: str, resource_ids, session: AsyncSession) -> CounterDeltas:
+        """Deltas de las actividades que la base borrará en cascada junto con los recursos."""
+        parent_column = self.activity_parent_columns.get(entity)
+        ids = [resource_id for resource_id in map(parse_uuid, resource_ids) if resource_id]
+        if parent_column is None or not ids:
+            return {}
+        group = (ActivityORM.organization_id, ActivityORM.team_id, ActivityORM.owner_id)
+        ids_param = bindparam("ids", ids, type_=ARRAY(ActivityORM.id.type))
+        stmt = select(*group, func.count().label("total")).where(parent_column == any_(ids_param)).group_by(*group)
+        deltas: CounterDeltas = {}
+        for row in (await session.execute(stmt)).all():
+            deltas[self.key("activities", row)] = (-row.total, Decimal(0))
+        return deltas
+
+    async def apply(self, deltas: CounterDeltas, session: AsyncSession | None = None) -> None:
+        """Un `INSERT … ON CONFLICT DO UPDATE` multi-fila; las llaves van ordenadas para no provocar deadlocks."""
+        rows = [
+            {
+                "organization_id": key[0],
+                "team_id": key[1],
+                "owner_id": key[2],
+                "entity": key[3],
+                "stage": key[4],
+                "total": total,
+                "value": value,
+            }
+            for key, (total, value) in sorted(deltas.items(), key=lambda item: tuple(map(str, item[0])))
+            if total or value
+        ]
+        if not rows:
+            return
+        stmt = pg_insert(CRMCounterORM).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[column.name for column in CRMCounterORM.__table__.primary_key.columns],
+            set_={
+                "total": CRMCounterORM.total + stmt.excluded.total,
+                "value": CRMCounterORM.value + stmt.excluded.value,
+            },
+        )
+        if session:
+            await session.execute(stmt)
+            return
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt)
+            await db.commit()
+
+    async def release_owner(self, owner_id, session: AsyncSession | None = None) -> None:
+        """Al borrar un usuario sus recursos quedan sin dueño (`ON DELETE SET NULL`): mueve sus contadores."""
+        stmt = text("""
+            WITH released AS (
+                DELETE FROM crm_counters WHERE owner_id = :owner_id
+                RETURNING organization_id, team_id, entity, stage, total, value
+            )
+            INSERT INTO crm_counters (organization_id, team_id, owner_id, entity, stage, total, value)
+            SELECT organization_id, team_id, :no_scope, entity, stage, sum(total), sum(value)
+            FROM released GROUP BY organization_id, team_id, entity, stage
+            ON CONFLICT (organization_id, team_id, owner_id, entity, stage)
+            DO UPDATE SET total = crm_counters.total + excluded.total, value = crm_counters.value + excluded.value
+        """)
+        params = {"owner_id": parse_uuid(owner_id), "no_scope": NO_SCOPE}
+        if session:
+            await session.execute(stmt, params)
+            return
+        async with AsyncSessionLocal() as db:
+            await db.execute(stmt, params)
+            await db.commit()
+
+    def rebuild_statement(self, organization_id=None):
+        """`INSERT … SELECT` que recalcula todos los contadores (o los de una organización) desde las tablas."""
+        selects = []
+        for entity, model in self.models.items():
+            is_opportunity = model is OpportunityORM
+            team_id = func.coalesce(model.team_id, NO_SCOPE)
+            owner_id = func.coalesce(model.owner_id, NO_SCOPE)
+            stage = model.stage if is_opportunity else literal("")
+            value = func.sum(model.value) if is_opportunity else literal(0)
+            stmt = select(model.organization_id, team_id, owner_id, literal(entity), stage, func.count(), value)
+            if organization_id is not None:
+                stmt = stmt.where(model.organization_id == parse_uuid(organization_id))
+            group = (model.organization_id, team_id, owner_id, *((model.stage,) if is_opportunity else ()))
+            selects.append(stmt.group_by(*group))
+        columns = ["organization_id", "team_id", "owner_id", "entity", "stage", "total", "value"]
+        return insert(CRMCounterORM).from_select(columns, union_all(*selects))
+
+    async def rebuild(self, organization_id=None, session: AsyncSession | None = None) -> int:
+        """Reconstruye los contadores; devuelve cuántas filas quedaron.
+
+        El `LOCK` bloquea los deltas concurrentes hasta el commit: los writes ya visibles quedan contados por el
+        recálculo y los que aún no terminan aplican su delta encima, sin contarse dos veces.
+        """
+        clear = delete(CRMCounterORM)
+        if organization_id is not None:
+            clear = clear.where(CRMCounterORM.organization_id == parse_uuid(organization_id))
+
+        async def execute(db: AsyncSession) -> int:
+            await db.execute(text("LOCK TABLE crm_counters IN EXCLUSIVE MODE"))
+            await db.execute(clear)
+            return (await db.execute(self.rebuild_statement(organization_id))).rowcount
+
+        if session:
+            return await execute(session)
+        async with AsyncSessionLocal() as db:
+            rebuilt = await execute(db)
+            await db.commit()
+            return rebuilt
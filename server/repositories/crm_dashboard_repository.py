@@ -1,12 +1,19 @@
-from sqlalchemy import func, select
+from decimal import Decimal
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.db.session import AsyncSessionLocal
 from server.models.orm.activity_orm import ActivityORM
 from server.models.orm.company_orm import CompanyORM
 from server.models.orm.contact_orm import ContactORM
+from server.models.orm.crm_counter_orm import CRMCounterORM
 from server.models.orm.lead_orm import LeadORM
 from server.models.orm.opportunity_orm import OpportunityORM
 from server.repositories.base_repository import parse_uuid
+from server.repositories.scoped_resource_repository import apply_access_scope
+
+CLOSED_STAGES = ("won", "lost")
 
 
 class CRMDashboardRepository:
@@ -19,23 +26,57 @@ class CRMDashboardRepository:
     }
 
     def apply_scope(self, stmt, model, access):
-        if access["scope"] == "OWN":
-            return stmt.where(model.owner_id == parse_uuid(access["user_id"]))
-        if access["scope"] == "TEAM":
-            return stmt.where(model.team_id == parse_uuid(access["team_id"]))
-        return stmt
-
-    async def summarize(self, organization_id, access):
-        result = {}
-        async with AsyncSessionLocal() as db:
-            for key, model in self.models.items():
-                stmt = select(func.count(model.id)).where(model.organization_id == parse_uuid(organization_id))
-                result[key] = (await db.execute(self.apply_scope(stmt, model, access))).scalar_one()
-            pipeline = select(func.coalesce(func.sum(OpportunityORM.value), 0)).where(
-                OpportunityORM.organization_id == parse_uuid(organization_id),
-                OpportunityORM.stage.notin_(("won", "lost")),
-            )
-            result["pipelineValue"] = str(
-                (await db.execute(self.apply_scope(pipeline, OpportunityORM, access))).scalar_one()
-            )
-        return result
+        return apply_access_scope(stmt, model, access)
+
+    def summary_statement(self, organization_id, access) -> Select:
+        """Resumen recorriendo las tablas en un solo SELECT: un conteo escalar por tabla y un CTE que cuenta
+        oportunidades y suma el pipeline en el mismo recorrido. El alcance OWN/TEAM se aplica dentro de cada
+        subconsulta. Sirve para verificar `crm_counters`; el dashboard usa `counters_statement`."""
+        organization_id = parse_uuid(organization_id)
+
+        def scoped(model, *columns):
+            stmt = select(*columns).where(model.organization_id == organization_id)
+            return self.apply_scope(stmt, model, access)
+
+        open_value = func.sum(OpportunityORM.value).filter(OpportunityORM.stage.notin_(CLOSED_STAGES))
+        opportunities = scoped(
+            OpportunityORM,
+            func.count(OpportunityORM.id).label("total"),
+            func.coalesce(open_value, 0).label("pipeline"),
+        ).cte("opportunity_totals")
+        counts = {
+            key: scoped(model, func.count(model.id)).scalar_subquery().label(key)
+            for key, model in self.models.items()
+            if model is not OpportunityORM
+        }
+        counts["opportunities"] = opportunities.c.total.label("opportunities")
+        return select(*(counts[key] for key in self.models), opportunities.c.pipeline.label("pipelineValue"))
+
+    def counters_statement(self, organization_id, access) -> Select:
+        """Suma las filas de `crm_counters` del alcance: unas pocas filas por entidad, sin recorrer los recursos."""
+        open_value = func.sum(CRMCounterORM.value).filter(
+            CRMCounterORM.entity == "opportunities", CRMCounterORM.stage.notin_(CLOSED_STAGES)
+        )
+        stmt = (
+            select(CRMCounterORM.entity, func.sum(CRMCounterORM.total).label("total"), open_value.label("pipeline"))
+            .where(CRMCounterORM.organization_id == parse_uuid(organization_id))
+            .group_by(CRMCounterORM.entity)
+        )
+        return self.apply_scope(stmt, CRMCounterORM, access)
+
+    def counters_summary(self, rows) -> dict:
+        summary = dict.fromkeys(self.models, 0)
+        pipeline = Decimal(0)
+        for row in rows:
+            summary[row.entity] = int(row.total)
+            pipeline += row.pipeline or 0
+        return {**summary, "pipelineValue": str(pipeline)}
+
+    async def summarize(self, organization_id, access, session: AsyncSession | None = None):
+        stmt = self.counters_statement(organization_id, access)
+        if session:
+            rows = (await session.execute(stmt)).all()
+        else:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(stmt)).all()
+        return self.counters_summary(rows)
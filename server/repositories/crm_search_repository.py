@@ -0,0 +1,100 @@
+from sqlalchemy import Float, Select, Text, cast, func, literal, literal_column, or_, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from server.db.session import AsyncSessionLocal
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.orm.company_orm import CompanyORM
+from server.models.orm.contact_orm import ContactORM
+from server.models.orm.lead_orm import LeadORM
+from server.repositories.base_repository import parse_uuid
+from server.repositories.scoped_resource_repository import apply_access_scope
+from server.utils.pagination_utils import Page, decode_cursor, encode_cursor, page_size
+
+# Con menos caracteres no hay trigramas completos y el ILIKE no puede usar el índice: solo se usa el tsvector
+MIN_TRIGRAM_QUERY_LENGTH = 3
+
+
+class CRMSearchRepository:
+    """Búsqueda rankeada sobre las columnas generadas `search_vector` (tsvector) y `search_text` (pg_trgm)."""
+
+    models = {
+        "companies": CompanyORM,
+        "contacts": ContactORM,
+        "leads": LeadORM,
+    }
+
+    def _title_columns(self, entity: str):
+        if entity == "contacts":
+            return ContactORM.name + " " + ContactORM.lastname, func.coalesce(ContactORM.email, ContactORM.phone)
+        if entity == "companies":
+            return CompanyORM.name, func.coalesce(CompanyORM.email, CompanyORM.phone)
+        return LeadORM.name, LeadORM.source
+
+    def _entity_statement(self, entity: str, organization_id, access: dict, query: str) -> Select:
+        model = self.models[entity]
+        table = model.__tablename__
+        search_vector = literal_column(f"{table}.search_vector", TSVECTOR)
+        search_text = literal_column(f"{table}.search_text", Text)
+        ts_query = func.websearch_to_tsquery(literal_column("'simple'"), query)
+        rank = func.ts_rank_cd(search_vector, ts_query)
+        matches = [search_vector.op("@@")(ts_query)]
+        if len(query) >= MIN_TRIGRAM_QUERY_LENGTH:
+            escaped = query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            rank = func.greatest(rank, func.similarity(search_text, query.lower()))
+            matches += [search_text.like(f"%{escaped}%", escape="\\"), search_text.op("%")(query.lower())]
+        title, subtitle = self._title_columns(entity)
+        stmt = select(
+            literal(entity).label("type"),
+            model.id.label("id"),
+            title.label("title"),
+            subtitle.label("subtitle"),
+            cast(rank, Float).label("rank"),
+        ).where(model.organization_id == parse_uuid(organization_id), or_(*matches))
+        return apply_access_scope(stmt, model, access)
+
+    def search_statement(
+        self, organization_id, access: dict, query: str, types, first: int | None = None, after: str | None = None
+    ) -> Select:
+        """Un `UNION ALL` por tipo, ordenado por (rank, id) descendente y paginado por keyset sobre ese par."""
+        results = union_all(
+            *(self._entity_statement(entity, organization_id, access, query) for entity in types)
+        ).subquery("results")
+        stmt = select(results)
+        if after:
+            rank, result_id = decode_cursor(after, 2)
+            result_id = parse_uuid(result_id)
+            try:
+                rank = float(rank)
+            except ValueError as exc:
+                raise CustomGraphQLExceptionHelper("Cursor inválido") from exc
+            if result_id is None:
+                raise CustomGraphQLExceptionHelper("Cursor inválido")
+            bound = tuple_(literal(rank, Float), literal(result_id, results.c.id.type))
+            stmt = stmt.where(tuple_(results.c.rank, results.c.id) < bound)
+        return stmt.order_by(results.c.rank.desc(), results.c.id.desc()).limit(page_size(first) + 1)
+
+    async def search(
+        self,
+        organization_id,
+        access: dict,
+        query: str,
+        types,
+        first: int | None = None,
+        after: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Page[dict]:
+        stmt = self.search_statement(organization_id, access, query, types, first, after)
+        if session:
+            rows = (await session.execute(stmt)).mappings().all()
+        else:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(stmt)).mappings().all()
+        limit = page_size(first)
+        items = [dict(row) for row in rows[:limit]]
+        return Page(
+            items=items,
+            cursors=[encode_cursor((repr(item["rank"]), item["id"])) for item in items],
+            has_next_page=len(rows) > limit,
+            has_previous_page=after is not None,
+        )
@@ -1,10 +1,16 @@
+import uuid
+
 from sqlalchemy import select
 
 from server.db.session import AsyncSessionLocal
+from server.db.unit_of_work import after_commit
 from server.decorators.singleton_decorator import singleton
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper
 from server.models.orm.crm_team_orm import CRMTeamMemberORM, CRMTeamORM
 from server.repositories.base_repository import BaseRepository, parse_uuid
 
+SCOPE_RANK = {"OWN": 1, "TEAM": 2, "ORGANIZATION": 3, "GLOBAL": 4}
+
 
 @singleton
 class CRMTeamRepository(BaseRepository[CRMTeamORM]):
@@ -16,7 +22,9 @@ class CRMTeamRepository(BaseRepository[CRMTeamORM]):
             db.add(instance)
             await db.commit()
             await db.refresh(instance)
-            return instance
+        user_id = instance.user_id
+        await after_commit(lambda: AuthorizationCacheHelper().invalidate([user_id]))
+        return instance
 
     async def find_all(self, organization_id):
         stmt = (
@@ -40,13 +48,34 @@ class CRMTeamRepository(BaseRepository[CRMTeamORM]):
             stmt = stmt.where(CRMTeamMemberORM.team_id == parse_uuid(team_id))
         async with AsyncSessionLocal() as db:
             members = list((await db.execute(stmt)).scalars().all())
-        if not members:
-            return None
-        rank = {"OWN": 1, "TEAM": 2, "ORGANIZATION": 3, "GLOBAL": 4}
-        member = max(members, key=lambda item: rank[item.scope])
-        return {
-            "scope": member.scope,
-            "team_id": str(member.team_id),
-            "user_id": str(member.user_id),
-            "role": member.role,
-        }
+        return pick_user_access(members)
+
+    async def find_user_memberships(self, organization_ids, user_id) -> dict[uuid.UUID, list[CRMTeamMemberORM]]:
+        """Membresías del usuario en los equipos de varias organizaciones con una sola consulta, por organización."""
+        org_uuids = list(dict.fromkeys(filter(None, (parse_uuid(org_id) for org_id in organization_ids))))
+        if not org_uuids or not parse_uuid(user_id):
+            return {}
+        stmt = (
+            select(CRMTeamORM.organization_id, CRMTeamMemberORM)
+            .join(CRMTeamORM, CRMTeamORM.id == CRMTeamMemberORM.team_id)
+            .where(CRMTeamORM.organization_id.in_(org_uuids), CRMTeamMemberORM.user_id == parse_uuid(user_id))
+        )
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(stmt)).all()
+        memberships: dict[uuid.UUID, list[CRMTeamMemberORM]] = {}
+        for organization_id, member in rows:
+            memberships.setdefault(organization_id, []).append(member)
+        return memberships
+
+
+def pick_user_access(members) -> dict | None:
+    """El alcance más amplio entre las membresías del usuario (OWN < TEAM < ORGANIZATION < GLOBAL)."""
+    if not members:
+        return None
+    member = max(members, key=lambda item: SCOPE_RANK[item.scope])
+    return {
+        "scope": member.scope,
+        "team_id": str(member.team_id),
+        "user_id": str(member.user_id),
+        "role": member.role,
+    }
@@ -0,0 +1,152 @@
+import json
+from dataclasses import dataclass, field
+
+from sqlalchemy import Executable, Select, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement
+
+from server.models.orm.user_orm import UserORM
+from server.repositories.activity_repository import ActivityRepository
+from server.repositories.company_repository import CompanyRepository
+from server.repositories.contact_repository import ContactRepository
+from server.repositories.crm_counter_repository import NO_SCOPE
+from server.repositories.crm_dashboard_repository import CRMDashboardRepository
+from server.repositories.lead_repository import LeadRepository
+from server.repositories.opportunity_repository import OpportunityRepository
+from server.repositories.project_repository import ProjectRepository
+from server.repositories.task_repository import TaskRepository
+from server.repositories.user_repository import UserRepository
+
+SORT_NODES = ("Sort", "Incremental Sort")
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)` sobre un statement de SQLAlchemy, con sus parámetros enlazados."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+@dataclass(frozen=True)
+class PlanFinding:
+    node: str
+    relation: str | None
+    detail: str
+
+
+@dataclass
+class PlanReport:
+    name: str
+    execution_ms: float
+    shared_hit_blocks: int
+    shared_read_blocks: int
+    findings: list[PlanFinding] = field(default_factory=list)
+
+
+def plan_findings(plan: dict, min_rows: int = 1000) -> list[PlanFinding]:
+    """Recorre el plan y reporta los Seq Scan que leen al menos `min_rows` filas y todos los Sort.
+
+    Un Seq Scan sobre una tabla chica es la elección correcta del planner; por eso se filtra por filas leídas.
+    """
+    findings = []
+    pending = [plan]
+    while pending:
+        node = pending.pop()
+        pending.extend(reversed(node.get("Plans", [])))
+        node_type = node.get("Node Type")
+        if node_type == "Seq Scan":
+            scanned = node.get("Actual Rows", node.get("Plan Rows", 0)) + node.get("Rows Removed by Filter", 0)
+            if scanned >= min_rows:
+                detail = f"{scanned} filas leídas"
+                if node.get("Filter"):
+                    detail += f", filtro {node['Filter']}"
+                findings.append(PlanFinding(node_type, node.get("Relation Name"), detail))
+        elif node_type in SORT_NODES:
+            detail = f"clave {', '.join(node.get('Sort Key', []))}"
+            if node.get("Sort Method"):
+                detail += f", {node['Sort Method']} ({node.get('Sort Space Used', '?')} kB)"
+            findings.append(PlanFinding(node_type, None, detail))
+    return findings
+
+
+def plan_report(name: str, explain_output, min_rows: int = 1000) -> PlanReport:
+    """Interpreta la salida de `EXPLAIN (FORMAT JSON)`; asyncpg la entrega como texto."""
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    root = explain_output[0]
+    plan = root["Plan"]
+    return PlanReport(
+        name=name,
+        execution_ms=root.get("Execution Time", 0.0),
+        shared_hit_blocks=plan.get("Shared Hit Blocks", 0),
+        shared_read_blocks=plan.get("Shared Read Blocks", 0),
+        findings=plan_findings(plan, min_rows),
+    )
+
+
+def hot_statements(sample: dict) -> dict[str, Select]:
+    """Los SELECT de listas y dashboard tal como los ejecutan los repositorios, con ids reales de `sample`."""
+    statements: dict[str, Select] = {}
+    organization_id = sample.get("organization_id")
+    if organization_id:
+        accesses = {"ORGANIZATION": {"scope": "ORGANIZATION"}}
+        if sample.get("team_id"):
+            accesses["TEAM"] = {"scope": "TEAM", "team_id": sample["team_id"]}
+        if sample.get("owner_id"):
+            accesses["OWN"] = {"scope": "OWN", "user_id": sample["owner_id"]}
+        repositories = {
+            "companies": CompanyRepository(),
+            "contacts": ContactRepository(),
+            "leads": LeadRepository(),
+            "opportunities": OpportunityRepository(),
+            "activities": ActivityRepository(),
+        }
+        dashboard = CRMDashboardRepository()
+        for scope, access in accesses.items():
+            for entity, repository in repositories.items():
+                statements[f"{entity}.page[{scope}]"] = repository.page_statement(
+                    repository._scoped_statement(organization_id, access)
+                )
+            statements[f"crm_dashboard[{scope}]"] = dashboard.counters_statement(organization_id, access)
+
+    tasks = TaskRepository()
+    if sample.get("project_id"):
+        statements["tasks.page[project]"] = tasks.page_statement(tasks._list_statement(sample["project_id"]))
+    statements["tasks.page"] = tasks.page_statement(tasks._list_statement())
+    projects = ProjectRepository()
+    statements["projects.page"] = projects.page_statement(projects._list_statement())
+    statements["users.page"] = UserRepository().page_statement(select(UserORM))
+    return statements
+
+
+async def sample_scope(conn: AsyncConnection) -> dict:
+    """Toma el equipo/dueño con más recursos (según `crm_counters`) y un proyecto con tareas, para que los planes
+    se midan sobre datos reales."""
+    stmt = text("""
+        SELECT organization_id, team_id, owner_id FROM crm_counters
+        WHERE team_id <> :no_scope AND owner_id <> :no_scope ORDER BY total DESC LIMIT 1
+    """)
+    row = (await conn.execute(stmt, {"no_scope": NO_SCOPE})).mappings().first()
+    project_id = (await conn.execute(text("SELECT project_id FROM tasks LIMIT 1"))).scalar()
+    return {**(row or {}), "project_id": project_id}
+
+
+async def run_index_advisor(conn: AsyncConnection, min_rows: int = 1000) -> list[PlanReport]:
+    """`EXPLAIN ANALYZE` ejecuta las consultas: todo corre en una transacción que se revierte."""
+    transaction = await conn.begin()
+    try:
+        reports = []
+        for name, statement in hot_statements(await sample_scope(conn)).items():
+            explain_output = (await conn.execute(Explain(statement))).scalar_one()
+            reports.append(plan_report(name, explain_output, min_rows))
+        return reports
+    finally:
+        await transaction.rollback()
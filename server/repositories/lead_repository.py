@@ -6,3 +6,10 @@ from server.repositories.scoped_resource_repository import ScopedResourceReposit
 @singleton
 class LeadRepository(ScopedResourceRepository[LeadORM]):
     model = LeadORM
+    filterable_fields = {**ScopedResourceRepository.filterable_fields, "status": "status", "score": "score"}
+    sortable_fields = {**ScopedResourceRepository.sortable_fields, "score": "score"}
+    list_indexes = (
+        *ScopedResourceRepository.list_indexes,
+        ("organization_id", "status", "created_at", "id"),
+        ("organization_id", "score", "id"),
+    )
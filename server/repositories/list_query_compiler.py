@@ -0,0 +1,128 @@
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.list_query_dto import ListQueryModel, ValueFilterModel
+
+
+@dataclass(frozen=True)
+class CompiledListQuery:
+    """Predicados `WHERE` y keyset `(columna de orden, id)` de una consulta de lista validada contra los índices."""
+
+    predicates: list = field(default_factory=list)
+    keyset_columns: tuple[str, ...] = ("created_at", "id")
+    descending: bool = True
+    index: tuple[str, ...] = ()
+
+
+def coerce_value(column, value):
+    """Convierte el valor recibido (GraphQL o JSON) al tipo Python de la columna."""
+    try:
+        python_type = column.type.python_type
+        if python_type is uuid.UUID:
+            return uuid.UUID(str(value))
+        if python_type is datetime:
+            return value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+        if python_type is Decimal:
+            return Decimal(str(value))
+        if python_type is int and not isinstance(value, bool):
+            return int(value)
+        if python_type is str and isinstance(value, str):
+            return value
+    except (ValueError, TypeError, InvalidOperation, AttributeError, NotImplementedError):
+        pass
+    raise CustomGraphQLExceptionHelper(f"Valor inválido para el filtro de {column.key}: {value!r}")
+
+
+def _predicates(column, condition: ValueFilterModel) -> list:
+    predicates = []
+    if condition.eq is not None:
+        predicates.append(column == coerce_value(column, condition.eq))
+    if condition.in_ is not None:
+        predicates.append(column.in_([coerce_value(column, value) for value in condition.in_]))
+    if condition.gte is not None:
+        predicates.append(column >= coerce_value(column, condition.gte))
+    if condition.lte is not None:
+        predicates.append(column <= coerce_value(column, condition.lte))
+    if condition.is_null is not None:
+        predicates.append(column.is_(None) if condition.is_null else column.is_not(None))
+    return predicates
+
+
+def supporting_index(
+    indexes: Iterable[tuple[str, ...]], equality: set[str], required: set[str], sort_column: str
+) -> tuple[str, ...] | None:
+    """Primer índice cuyo prefijo de columnas con igualdad cubre todas las columnas `required` y que sigue con
+    `(sort_column, id)`: así el índice entrega las filas ya ordenadas y el LIMIT corta el recorrido.
+
+    Las columnas de `equality` fuera del prefijo (p.ej. el alcance OWN/TEAM) quedan como filtro residual.
+    """
+    for index in indexes:
+        prefix = 0
+        while prefix < len(index) and index[prefix] in equality:
+            prefix += 1
+        if required <= set(index[:prefix]) and index[prefix : prefix + 2] == (sort_column, "id"):
+            return index
+    return None
+
+
+def compile_list_query(
+    model,
+    list_query: ListQueryModel,
+    filterable_fields: dict[str, str],
+    sortable_fields: dict[str, str],
+    indexes: Iterable[tuple[str, ...]],
+    base_columns: Iterable[str] = (),
+    scope_columns: Iterable[str] = (),
+) -> CompiledListQuery:
+    """Traduce filtros/orden a predicados SQLAlchemy y rechaza lo que ningún índice de `indexes` puede servir.
+
+    `base_columns` son las igualdades que la consulta ya aplica (organización o proyecto) y `scope_columns` las del
+    alcance de acceso, que pueden quedar como filtro residual. Como mucho un campo admite rango (gte/lte/isNull:
+    false) y debe ser el campo de orden.
+    """
+    predicates = []
+    equality = set(base_columns)
+    required = set(base_columns)
+    range_fields = []
+    for name, condition in list_query.filter.items():
+        column_name = filterable_fields.get(name)
+        if column_name is None:
+            allowed = ", ".join(sorted(filterable_fields)) or "ninguno"
+            raise CustomGraphQLExceptionHelper(f"No se puede filtrar por {name}; campos permitidos: {allowed}")
+        if not condition.is_equality and not condition.is_range:
+            continue
+        column = getattr(model, column_name)
+        predicates.extend(_predicates(column, condition))
+        required.add(column_name)
+        if condition.is_range:
+            range_fields.append(name)
+        else:
+            equality.add(column_name)
+    if len(range_fields) > 1:
+        raise CustomGraphQLExceptionHelper(f"Solo un campo admite rango por consulta: {', '.join(range_fields)}")
+
+    sort = list_query.sort
+    if sort is None:
+        sort_field = range_fields[0] if range_fields and range_fields[0] in sortable_fields else "createdAt"
+        descending = True
+    else:
+        sort_field, descending = sort.field, sort.direction == "DESC"
+    sort_column = sortable_fields.get(sort_field)
+    if sort_column is None:
+        allowed = ", ".join(sorted(sortable_fields))
+        raise CustomGraphQLExceptionHelper(f"No se puede ordenar por {sort_field}; campos permitidos: {allowed}")
+    if range_fields and range_fields[0] != sort_field:
+        raise CustomGraphQLExceptionHelper(f"El rango sobre {range_fields[0]} requiere ordenar por ese campo")
+    required.discard(sort_column)
+
+    index = supporting_index(indexes, equality | set(scope_columns), required, sort_column)
+    if index is None:
+        filters = ", ".join(list_query.filter) or "sin filtros"
+        raise CustomGraphQLExceptionHelper(
+            f"Ningún índice soporta esta combinación de filtros ({filters}) y orden ({sort_field})"
+        )
+    return CompiledListQuery(predicates, (sort_column, "id"), descending, index)
@@ -6,3 +6,10 @@ from server.repositories.scoped_resource_repository import ScopedResourceReposit
 @singleton
 class OpportunityRepository(ScopedResourceRepository[OpportunityORM]):
     model = OpportunityORM
+    filterable_fields = {**ScopedResourceRepository.filterable_fields, "stage": "stage", "value": "value"}
+    sortable_fields = {**ScopedResourceRepository.sortable_fields, "value": "value"}
+    list_indexes = (
+        *ScopedResourceRepository.list_indexes,
+        ("organization_id", "stage", "created_at", "id"),
+        ("organization_id", "value", "id"),
+    )
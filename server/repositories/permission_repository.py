@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from server.db.session import AsyncSessionLocal
 from server.decorators.singleton_decorator import singleton
@@ -14,6 +14,8 @@ from server.repositories.base_repository import BaseRepository
 @singleton
 class PermissionRepository(BaseRepository[PermissionORM]):
     model = PermissionORM
+    load_options = (joinedload(PermissionORM.module), joinedload(PermissionORM.action))
+    returning_options = (selectinload(PermissionORM.module), selectinload(PermissionORM.action))
 
     async def create(self, data: dict, session: Optional[AsyncSession] = None) -> PermissionORM:
         module_id = uuid.UUID(str(data["module_id"])) if isinstance(data["module_id"], str) else data["module_id"]
@@ -70,11 +72,7 @@ class PermissionRepository(BaseRepository[PermissionORM]):
         self, permission_id: str | uuid.UUID, session: Optional[AsyncSession] = None
     ) -> Optional[PermissionORM]:
         perm_uuid = uuid.UUID(str(permission_id)) if isinstance(permission_id, str) else permission_id
-        stmt = (
-            select(PermissionORM)
-            .options(joinedload(PermissionORM.module), joinedload(PermissionORM.action))
-            .where(PermissionORM.id == perm_uuid)
-        )
+        stmt = select(PermissionORM).options(*self.load_options).where(PermissionORM.id == perm_uuid)
         if session:
             res = await session.execute(stmt)
             return res.scalar_one_or_none()
@@ -1,21 +1,58 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from server.db.session import AsyncSessionLocal
+from server.db.unit_of_work import after_commit
 from server.decorators.singleton_decorator import singleton
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper
 from server.models.orm.permission_orm import PermissionORM
 from server.models.orm.project_member_orm import ProjectMemberORM
 from server.models.orm.project_role_orm import ProjectRoleORM
-from server.repositories.base_repository import BaseRepository
+from server.repositories.base_repository import BaseRepository, parse_uuid
 
 
 @singleton
 class ProjectMemberRepository(BaseRepository[ProjectMemberORM]):
     model = ProjectMemberORM
+    load_options = (
+        selectinload(ProjectMemberORM.project_role)
+        .selectinload(ProjectRoleORM.permissions)
+        .selectinload(PermissionORM.module),
+        selectinload(ProjectMemberORM.project_role)
+        .selectinload(ProjectRoleORM.permissions)
+        .selectinload(PermissionORM.action),
+    )
+
+    async def create(self, data: dict, session: Optional[AsyncSession] = None) -> ProjectMemberORM:
+        member = await super().create(data, session)
+        await self._invalidate_decisions(member.user_id)
+        return member
+
+    async def delete(self, member_id, session: Optional[AsyncSession] = None) -> bool:
+        parsed_id = parse_uuid(member_id)
+        if not parsed_id:
+            return False
+        # `RETURNING user_id`: el usuario cuyas decisiones cacheadas hay que invalidar
+        stmt = delete(ProjectMemberORM).where(ProjectMemberORM.id == parsed_id).returning(ProjectMemberORM.user_id)
+        if session:
+            user_id = (await session.execute(stmt)).scalar_one_or_none()
+            await session.flush()
+        else:
+            async with AsyncSessionLocal() as db_session:
+                user_id = (await db_session.execute(stmt)).scalar_one_or_none()
+                await db_session.commit()
+        if user_id is None:
+            return False
+        await self._invalidate_decisions(user_id)
+        return True
+
+    async def _invalidate_decisions(self, user_id) -> None:
+        # Tras el commit: antes, otra request podría volver a cachear la membresía todavía confirmada
+        await after_commit(lambda: AuthorizationCacheHelper().invalidate([user_id]))
 
     async def find_by_project_and_user(
         self,
@@ -31,14 +68,7 @@ class ProjectMemberRepository(BaseRepository[ProjectMemberORM]):
 
         stmt = (
             select(ProjectMemberORM)
-            .options(
-                selectinload(ProjectMemberORM.project_role)
-                .selectinload(ProjectRoleORM.permissions)
-                .selectinload(PermissionORM.module),
-                selectinload(ProjectMemberORM.project_role)
-                .selectinload(ProjectRoleORM.permissions)
-                .selectinload(PermissionORM.action),
-            )
+            .options(*self.load_options)
             .where(ProjectMemberORM.project_id == p_uuid, ProjectMemberORM.user_id == u_uuid)
         )
         if session:
@@ -48,6 +78,30 @@ class ProjectMemberRepository(BaseRepository[ProjectMemberORM]):
             res = await db_session.execute(stmt)
             return res.scalar_one_or_none()
 
+    async def find_by_projects_and_user(
+        self,
+        project_ids,
+        user_id: str | uuid.UUID,
+        session: Optional[AsyncSession] = None,
+    ) -> dict[uuid.UUID, ProjectMemberORM]:
+        """Membresías del usuario en varios proyectos con una sola consulta, por id de proyecto."""
+        p_uuids = list(dict.fromkeys(filter(None, (parse_uuid(project_id) for project_id in project_ids))))
+        u_uuid = parse_uuid(user_id)
+        if not p_uuids or not u_uuid:
+            return {}
+
+        stmt = (
+            select(ProjectMemberORM)
+            .options(*self.load_options)
+            .where(ProjectMemberORM.project_id.in_(p_uuids), ProjectMemberORM.user_id == u_uuid)
+        )
+        if session:
+            members = (await session.execute(stmt)).scalars().all()
+        else:
+            async with AsyncSessionLocal() as db_session:
+                members = (await db_session.execute(stmt)).scalars().all()
+        return {member.project_id: member for member in members}
+
     async def find_by_project(
         self, project_id: str | uuid.UUID, session: Optional[AsyncSession] = None
     ) -> List[ProjectMemberORM]:
@@ -58,14 +112,7 @@ class ProjectMemberRepository(BaseRepository[ProjectMemberORM]):
 
         stmt = (
             select(ProjectMemberORM)
-            .options(
-                selectinload(ProjectMemberORM.project_role)
-                .selectinload(ProjectRoleORM.permissions)
-                .selectinload(PermissionORM.module),
-                selectinload(ProjectMemberORM.project_role)
-                .selectinload(ProjectRoleORM.permissions)
-                .selectinload(PermissionORM.action),
-            )
+            .options(*self.load_options)
             .where(ProjectMemberORM.project_id == p_uuid)
             .order_by(ProjectMemberORM.created_at.desc())
         )
@@ -98,17 +145,18 @@ class ProjectMemberRepository(BaseRepository[ProjectMemberORM]):
             member.project_role_id = r_uuid
             await session.commit()
             await session.refresh(member)
-            return member
-
-        async with AsyncSessionLocal() as db_session:
-            res = await db_session.execute(stmt)
-            member = res.scalar_one_or_none()
-            if not member:
-                return None
-            member.project_role_id = r_uuid
-            await db_session.commit()
-            await db_session.refresh(member)
-            return member
+        else:
+            async with AsyncSessionLocal() as db_session:
+                res = await db_session.execute(stmt)
+                member = res.scalar_one_or_none()
+                if not member:
+                    return None
+                member.project_role_id = r_uuid
+                await db_session.commit()
+                await db_session.refresh(member)
+        # Las decisiones cacheadas del miembro dependen de los permisos de su rol en el proyecto
+        await self._invalidate_decisions(member.user_id)
+        return member
 
     async def find_project_role_by_id(
         self, project_role_id: str | uuid.UUID, session: Optional[AsyncSession] = None
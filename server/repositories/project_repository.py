@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -8,18 +9,33 @@ from server.db.session import AsyncSessionLocal
 from server.decorators.singleton_decorator import singleton
 from server.models.orm.project_orm import ProjectORM
 from server.repositories.base_repository import BaseRepository
+from server.utils.pagination_utils import Page
 
 
 @singleton
 class ProjectRepository(BaseRepository[ProjectORM]):
     model = ProjectORM
 
-    async def find_all(
-        self, include_archived: bool = False, session: Optional[AsyncSession] = None
-    ) -> list[ProjectORM]:
+    def _list_statement(self, include_archived: bool = False):
         stmt = select(ProjectORM).order_by(ProjectORM.created_at.desc())
         if not include_archived:
             stmt = stmt.where(ProjectORM.archived_at.is_(None))
+        return stmt
+
+    async def find_page(
+        self,
+        include_archived: bool = False,
+        first: int | None = None,
+        after: str | None = None,
+        session: Optional[AsyncSession] = None,
+        columns: Iterable[str] | None = None,
+    ) -> Page[ProjectORM]:
+        return await self.paginate(self._list_statement(include_archived), first, after, session, columns=columns)
+
+    async def find_all(
+        self, include_archived: bool = False, session: Optional[AsyncSession] = None
+    ) -> list[ProjectORM]:
+        stmt = self._list_statement(include_archived)
         if session:
             return list((await session.execute(stmt)).scalars().all())
         async with AsyncSessionLocal() as db:
@@ -6,26 +6,31 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from server.db.session import AsyncSessionLocal
+from server.db.unit_of_work import after_commit
 from server.decorators.singleton_decorator import singleton
+from server.helpers.principal_cache_helper import PrincipalCacheHelper
 from server.models.orm.permission_orm import PermissionORM
 from server.models.orm.role_orm import RoleORM
-from server.repositories.base_repository import BaseRepository
+from server.repositories.base_repository import BaseRepository, parse_uuid
+from server.repositories.user_repository import UserRepository
+from server.utils.pagination_utils import Page
 
 
 @singleton
 class RoleRepository(BaseRepository[RoleORM]):
     model = RoleORM
+    load_options = (
+        selectinload(RoleORM.permissions).selectinload(PermissionORM.module),
+        selectinload(RoleORM.permissions).selectinload(PermissionORM.action),
+    )
+    returning_options = load_options
+    # `roles` no tiene created_at; el catálogo se pagina por nombre (único) e id
+    keyset_columns = ("name", "id")
+    keyset_descending = False
 
     async def find_by_id(self, role_id: str | uuid.UUID, session: Optional[AsyncSession] = None) -> Optional[RoleORM]:
         r_uuid = uuid.UUID(str(role_id)) if isinstance(role_id, str) else role_id
-        stmt = (
-            select(RoleORM)
-            .options(
-                selectinload(RoleORM.permissions).selectinload(PermissionORM.module),
-                selectinload(RoleORM.permissions).selectinload(PermissionORM.action),
-            )
-            .where(RoleORM.id == r_uuid)
-        )
+        stmt = select(RoleORM).options(*self.load_options).where(RoleORM.id == r_uuid)
         if session:
             res = await session.execute(stmt)
             return res.scalar_one_or_none()
@@ -49,6 +54,11 @@ class RoleRepository(BaseRepository[RoleORM]):
             res = await db_session.execute(stmt)
             return res.scalar_one_or_none()
 
+    async def find_page(
+        self, first: int | None = None, after: str | None = None, session: Optional[AsyncSession] = None
+    ) -> Page[RoleORM]:
+        return await self.paginate(select(RoleORM).options(*self.load_options), first, after, session)
+
     async def find_all(self, session: Optional[AsyncSession] = None) -> List[RoleORM]:
         stmt = (
             select(RoleORM)
@@ -68,21 +78,18 @@ class RoleRepository(BaseRepository[RoleORM]):
     async def update(
         self, role_id: str | uuid.UUID, update_data: dict, session: Optional[AsyncSession] = None
     ) -> Optional[RoleORM]:
-        role = await self.find_by_id(role_id, session=session)
-        if not role:
-            return None
-        for key, val in update_data.items():
-            if hasattr(role, key) and val is not None:
-                setattr(role, key, val)
-        if session:
-            await session.commit()
-            await session.refresh(role)
-            return role
-        async with AsyncSessionLocal() as db_session:
-            db_session.add(role)
-            await db_session.commit()
-            await db_session.refresh(role)
-            return role
+        role = await super().update(role_id, update_data, session)
+        if role:
+            await self._invalidate_principals(role.id)
+        return role
+
+    async def delete(self, role_id, session: Optional[AsyncSession] = None) -> bool:
+        # Se capturan antes de borrar: el FK users.role_id queda en NULL al eliminar el rol
+        user_ids = await UserRepository().find_ids_by_role(role_id, session=session) if parse_uuid(role_id) else []
+        deleted = await super().delete(role_id, session=session)
+        if deleted:
+            await after_commit(lambda: PrincipalCacheHelper().invalidate(user_ids))
+        return deleted
 
     async def assign_permissions(
         self,
@@ -110,9 +117,13 @@ class RoleRepository(BaseRepository[RoleORM]):
             return role
 
         if session:
-            return await _assign(session)
-        async with AsyncSessionLocal() as db_session:
-            return await _assign(db_session)
+            role = await _assign(session)
+        else:
+            async with AsyncSessionLocal() as db_session:
+                role = await _assign(db_session)
+        if role:
+            await self._invalidate_principals(r_uuid)
+        return role
 
     async def add_permissions(
         self,
@@ -166,6 +177,18 @@ class RoleRepository(BaseRepository[RoleORM]):
             return role
 
         if session:
-            return await _update(session)
-        async with AsyncSessionLocal() as db_session:
-            return await _update(db_session)
+            role = await _update(session)
+        else:
+            async with AsyncSessionLocal() as db_session:
+                role = await _update(db_session)
+        if role:
+            await self._invalidate_principals(r_uuid)
+        return role
+
+    async def _invalidate_principals(self, role_id: uuid.UUID) -> None:
+        """Los usuarios con este rol cachean sus permisos efectivos; se invalidan tras el commit de cualquier cambio.
+
+        Antes del commit otra request podría volver a cachear los permisos viejos todavía confirmados.
+        """
+        user_ids = await UserRepository().find_ids_by_role(role_id)
+        await after_commit(lambda: PrincipalCacheHelper().invalidate(user_ids))
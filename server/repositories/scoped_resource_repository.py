@@ -1,28 +1,80 @@
+from collections.abc import Iterable
 from typing import Generic, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.db.session import AsyncSessionLocal
+from server.models.dto.list_query_dto import ListQueryModel
 from server.repositories.base_repository import BaseRepository, parse_uuid
+from server.utils.pagination_utils import Page
 
 ModelT = TypeVar("ModelT")
 
 
+def apply_access_scope(stmt, model, access: dict):
+    """Filtra por el alcance resuelto por `AuthorizationService.resolve_access`: dueño (OWN) o equipo (TEAM)."""
+    if access["scope"] == "OWN":
+        return stmt.where(model.owner_id == parse_uuid(access["user_id"]))
+    if access["scope"] == "TEAM":
+        return stmt.where(model.team_id == parse_uuid(access["team_id"]))
+    return stmt
+
+
+def access_scope_columns(access: dict) -> tuple[str, ...]:
+    """Columnas que `apply_access_scope` filtra por igualdad."""
+    return {"OWN": ("owner_id",), "TEAM": ("team_id",)}.get(access["scope"], ())
+
+
 class ScopedResourceRepository(BaseRepository[ModelT], Generic[ModelT]):
     """Consultas para recursos con organización, equipo y propietario."""
 
-    async def find_all(self, organization_id, access: dict, session: AsyncSession | None = None) -> list[ModelT]:
+    filterable_fields = {"teamId": "team_id", "ownerId": "owner_id", "createdAt": "created_at"}
+    # Índices de la migración 013; cada repositorio agrega los de sus filtros y órdenes propios (migración 015)
+    list_indexes = (
+        ("organization_id", "created_at", "id"),
+        ("organization_id", "owner_id", "created_at", "id"),
+        ("organization_id", "team_id", "created_at", "id"),
+    )
+
+    def _scoped_statement(self, organization_id, access: dict):
         stmt = (
             select(self.model)
             .where(self.model.organization_id == parse_uuid(organization_id))
             .order_by(self.model.created_at.desc())
         )
-        if access["scope"] == "OWN":
-            stmt = stmt.where(self.model.owner_id == parse_uuid(access["user_id"]))
-        elif access["scope"] == "TEAM":
-            stmt = stmt.where(self.model.team_id == parse_uuid(access["team_id"]))
+        return apply_access_scope(stmt, self.model, access)
+
+    async def find_page(
+        self,
+        organization_id,
+        access: dict,
+        first: int | None = None,
+        after: str | None = None,
+        session: AsyncSession | None = None,
+        columns: Iterable[str] | None = None,
+        list_query: ListQueryModel | None = None,
+    ) -> Page[ModelT]:
+        stmt = self._scoped_statement(organization_id, access)
+        if list_query is None:
+            return await self.paginate(stmt, first, after, session, columns=columns)
+        compiled = self._compile_scoped(access, list_query)
+        return await self.paginate(stmt.where(*compiled.predicates), first, after, session, columns, compiled)
+
+    async def find_all(
+        self,
+        organization_id,
+        access: dict,
+        session: AsyncSession | None = None,
+        list_query: ListQueryModel | None = None,
+    ) -> list[ModelT]:
+        stmt = self._scoped_statement(organization_id, access)
+        if list_query is not None:
+            stmt = self.apply_list_query(stmt, self._compile_scoped(access, list_query))
         if session:
             return list((await session.execute(stmt)).scalars().all())
         async with AsyncSessionLocal() as db:
             return list((await db.execute(stmt)).scalars().all())
+
+    def _compile_scoped(self, access: dict, list_query: ListQueryModel):
+        return self.compile_list_query(list_query, ("organization_id",), access_scope_columns(access))
@@ -1,4 +1,5 @@
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -7,28 +8,69 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from server.db.session import AsyncSessionLocal
 from server.decorators.singleton_decorator import singleton
+from server.models.dto.list_query_dto import ListQueryModel
 from server.models.orm.task_orm import TaskORM
 from server.repositories.base_repository import BaseRepository, parse_uuid
+from server.utils.pagination_utils import Page
 
 
 @singleton
 class TaskRepository(BaseRepository[TaskORM]):
     model = TaskORM
+    filterable_fields = {"status": "status", "assigneeId": "assignee_id", "createdAt": "created_at"}
+    # Índices de las migraciones 013 y 015; sin proyecto solo se puede ordenar por fecha de creación
+    list_indexes = (
+        ("project_id", "created_at", "id"),
+        ("created_at", "id"),
+        ("project_id", "status", "created_at", "id"),
+        ("project_id", "assignee_id", "created_at", "id"),
+    )
 
-    async def find_all(
-        self, project_id: str | uuid.UUID | None = None, session: Optional[AsyncSession] = None
-    ) -> list[TaskORM]:
+    def _list_statement(self, project_id: str | uuid.UUID | None = None):
         stmt = select(TaskORM).order_by(TaskORM.created_at.desc())
         if project_id:
             project_uuid = parse_uuid(project_id)
             if not project_uuid:
-                return []
+                return None
             stmt = stmt.where(TaskORM.project_id == project_uuid)
+        return stmt
+
+    async def find_page(
+        self,
+        project_id: str | uuid.UUID | None = None,
+        first: int | None = None,
+        after: str | None = None,
+        session: Optional[AsyncSession] = None,
+        columns: Iterable[str] | None = None,
+        list_query: ListQueryModel | None = None,
+    ) -> Page[TaskORM]:
+        stmt = self._list_statement(project_id)
+        if stmt is None:
+            return Page()
+        if list_query is None:
+            return await self.paginate(stmt, first, after, session, columns=columns)
+        compiled = self._compile(project_id, list_query)
+        return await self.paginate(stmt.where(*compiled.predicates), first, after, session, columns, compiled)
+
+    async def find_all(
+        self,
+        project_id: str | uuid.UUID | None = None,
+        session: Optional[AsyncSession] = None,
+        list_query: ListQueryModel | None = None,
+    ) -> list[TaskORM]:
+        stmt = self._list_statement(project_id)
+        if stmt is None:
+            return []
+        if list_query is not None:
+            stmt = self.apply_list_query(stmt, self._compile(project_id, list_query))
         if session:
             return list((await session.execute(stmt)).scalars().all())
         async with AsyncSessionLocal() as db:
             return list((await db.execute(stmt)).scalars().all())
 
+    def _compile(self, project_id, list_query: ListQueryModel):
+        return self.compile_list_query(list_query, ("project_id",) if project_id else ())
+
     async def complete(self, task_id, session: Optional[AsyncSession] = None) -> TaskORM | None:
         return await self.update(
             task_id, {"status": "done", "completed_at": datetime.now(timezone.utc)}, session=session
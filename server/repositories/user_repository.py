@@ -1,9 +1,10 @@
 import uuid
+from collections.abc import Iterable
 from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
 from server.db.session import AsyncSessionLocal
 from server.decorators.singleton_decorator import singleton
@@ -11,28 +12,29 @@ from server.models.orm.permission_orm import PermissionORM
 from server.models.orm.role_orm import RoleORM
 from server.models.orm.user_orm import UserORM
 from server.repositories.base_repository import BaseRepository
+from server.utils.pagination_utils import Page
 
 
 @singleton
 class UserRepository(BaseRepository[UserORM]):
     model = UserORM
+    # Mismo orden que tenía el listado completo (`find_all`); `id` desempata nombres repetidos
+    keyset_columns = ("name", "id")
+    keyset_descending = False
+    load_options = (
+        joinedload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.module),
+        joinedload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.action),
+    )
+    returning_options = (
+        selectinload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.module),
+        selectinload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.action),
+    )
 
     async def create(self, user_data: dict, session: Optional[AsyncSession] = None) -> UserORM:
         data = dict(user_data)
         if "role_id" in data and isinstance(data["role_id"], str):
             data["role_id"] = uuid.UUID(data["role_id"])
-
-        user = UserORM(**data)
-        if session:
-            session.add(user)
-            await session.commit()
-            await session.refresh(user)
-            return user
-        async with AsyncSessionLocal() as db_session:
-            db_session.add(user)
-            await db_session.commit()
-            await db_session.refresh(user)
-            return user
+        return await super().create(data, session)
 
     async def find_by_email(self, email: str, session: Optional[AsyncSession] = None) -> Optional[UserORM]:
         stmt = (
@@ -52,14 +54,7 @@ class UserRepository(BaseRepository[UserORM]):
 
     async def find_by_id(self, user_id: str | uuid.UUID, session: Optional[AsyncSession] = None) -> Optional[UserORM]:
         u_uuid = uuid.UUID(str(user_id)) if isinstance(user_id, str) else user_id
-        stmt = (
-            select(UserORM)
-            .options(
-                joinedload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.module),
-                joinedload(UserORM.role).selectinload(RoleORM.permissions).selectinload(PermissionORM.action),
-            )
-            .where(UserORM.id == u_uuid)
-        )
+        stmt = select(UserORM).options(*self.load_options).where(UserORM.id == u_uuid)
         if session:
             res = await session.execute(stmt)
             return res.scalar_one_or_none()
@@ -67,6 +62,18 @@ class UserRepository(BaseRepository[UserORM]):
             res = await db_session.execute(stmt)
             return res.scalar_one_or_none()
 
+    async def find_page(
+        self,
+        first: int | None = None,
+        after: str | None = None,
+        session: Optional[AsyncSession] = None,
+        columns: Iterable[str] | None = None,
+    ) -> Page[UserORM]:
+        stmt = select(UserORM)
+        if columns is None:
+            stmt = stmt.options(joinedload(UserORM.role))
+        return await self.paginate(stmt, first, after, session, columns=columns)
+
     async def find_all(self, session: Optional[AsyncSession] = None) -> List[UserORM]:
         stmt = select(UserORM).options(joinedload(UserORM.role)).order_by(UserORM.name)
         if session:
@@ -76,6 +83,16 @@ class UserRepository(BaseRepository[UserORM]):
             res = await db_session.execute(stmt)
             return list(res.scalars().all())
 
+    async def find_ids_by_role(self, role_id: str | uuid.UUID, session: Optional[AsyncSession] = None) -> List[str]:
+        r_uuid = uuid.UUID(str(role_id)) if isinstance(role_id, str) else role_id
+        stmt = select(UserORM.id).where(UserORM.role_id == r_uuid)
+        if session:
+            res = await session.execute(stmt)
+            return [str(user_id) for user_id in res.scalars().all()]
+        async with AsyncSessionLocal() as db_session:
+            res = await db_session.execute(stmt)
+            return [str(user_id) for user_id in res.scalars().all()]
+
     async def aggregate_users_with_roles(self, session: Optional[AsyncSession] = None) -> List[dict]:
         users = await self.find_all(session=session)
         result = []
@@ -165,24 +182,7 @@ class UserRepository(BaseRepository[UserORM]):
     async def update(
         self, user_id: str | uuid.UUID, update_data: dict, session: Optional[AsyncSession] = None
     ) -> Optional[UserORM]:
-        user = await self.find_by_id(user_id, session=session)
-        if not user:
-            return None
-
         data = dict(update_data)
         if "role_id" in data and isinstance(data["role_id"], str):
             data["role_id"] = uuid.UUID(data["role_id"])
-
-        for key, val in data.items():
-            if hasattr(user, key) and val is not None:
-                setattr(user, key, val)
-
-        if session:
-            await session.commit()
-            await session.refresh(user)
-            return user
-        async with AsyncSessionLocal() as db_session:
-            db_session.add(user)
-            await db_session.commit()
-            await db_session.refresh(user)
-            return user
+        return await super().update(user_id, data, session)
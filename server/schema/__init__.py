@@ -5,16 +5,19 @@ from ariadne import load_schema_from_path, make_executable_schema
 from server.schema.actions.action_resolver import ActionResolver
 from server.schema.activities.resolver import ActivityResolver
 from server.schema.audit_logs.resolver import AuditLogResolver
+from server.schema.cache_stats.resolver import CacheStatsResolver
 from server.schema.companies.resolver import CompanyResolver
 from server.schema.contacts.resolver import ContactResolver
 from server.schema.crm_administration.resolver import CRMAdministrationResolver
 from server.schema.crm_dashboard.resolver import CRMDashboardResolver
+from server.schema.crm_search.resolver import CRMSearchResolver
 from server.schema.leads.resolver import LeadResolver
 from server.schema.modules.resolver import ModuleResolver
 from server.schema.opportunities.resolver import OpportunityResolver
 from server.schema.permission.resolver import PermissionResolver
 from server.schema.project_members.resolver import ProjectMemberResolver
 from server.schema.projects.resolver import ProjectResolver
+from server.schema.slow_queries.resolver import SlowQueryResolver
 from server.schema.tasks.resolver import TaskResolver
 
 from .auth.resolver import AuthResolver
@@ -29,6 +32,8 @@ __role_resolver = RoleResolver()
 __module_resolver = ModuleResolver()
 __action_resolver = ActionResolver()
 __audit_log_resolver = AuditLogResolver()
+__slow_query_resolver = SlowQueryResolver()
+__cache_stats_resolver = CacheStatsResolver()
 __permission_resolver = PermissionResolver()
 __project_member_resolver = ProjectMemberResolver()
 __project_resolver = ProjectResolver()
@@ -41,6 +46,7 @@ __crm_resolvers = [
     ActivityResolver(),
     CRMAdministrationResolver(),
     CRMDashboardResolver(),
+    CRMSearchResolver(),
 ]
 schemas_path = Path(__file__).parent
 
@@ -57,6 +63,8 @@ all_resolvers.extend(__role_resolver.get_resolvers())
 all_resolvers.extend(__module_resolver.get_resolvers())
 all_resolvers.extend(__action_resolver.get_resolvers())
 all_resolvers.extend(__audit_log_resolver.get_resolvers())
+all_resolvers.extend(__slow_query_resolver.get_resolvers())
+all_resolvers.extend(__cache_stats_resolver.get_resolvers())
 all_resolvers.extend(__permission_resolver.get_resolvers())
 all_resolvers.extend(__project_member_resolver.get_resolvers())
 all_resolvers.extend(__project_resolver.get_resolvers())
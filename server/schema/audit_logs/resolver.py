@@ -22,8 +22,8 @@ class AuditLogResolver:
 
     @require_token
     @require_permission(type="activity", action="read")
-    async def resolve_audit_logs(self, _, info, limit=100):
-        data = await self.__service.list_logs(limit=limit)
+    async def resolve_audit_logs(self, _, info, limit=100, since=None, until=None):
+        data = await self.__service.list_logs(limit=limit, since=since, until=until)
         return ResponseModel(status=200, message="Audit logs fetched", data=data)
 
     def get_resolvers(self):
@@ -0,0 +1,40 @@
+from ariadne import QueryType
+
+from server.decorators.require_permission_decorator import require_permissions
+from server.decorators.require_token_decorator import require_token
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper
+from server.helpers.graphql_document_cache_helper import GraphQLDocumentCacheHelper
+from server.helpers.password_hasher_helper import PasswordHasherHelper
+from server.helpers.principal_cache_helper import PrincipalCacheHelper
+from server.models.dto.response_dto import ResponseModel
+from server.strategies.permission_check_strategy import PermissionCheckMode
+
+
+class CacheStatsResolver:
+    """Aciertos de los caches (principal, autorización, documentos GraphQL) y saturación de bcrypt en este worker."""
+
+    def __init__(self):
+        self.query = QueryType()
+        self.__principal_cache = PrincipalCacheHelper()
+        self.__authorization_cache = AuthorizationCacheHelper()
+        self.__document_cache = GraphQLDocumentCacheHelper()
+        self.__password_hasher = PasswordHasherHelper()
+
+        self.query.set_field("cacheStats", self.resolve_cache_stats)
+
+    @require_token
+    @require_permissions(
+        permissions=[{"type": "activity", "action": "read"}, {"type": "roles", "action": "read"}],
+        mode=PermissionCheckMode.ALL,
+    )
+    async def resolve_cache_stats(self, _, info):
+        data = {
+            "principal": self.__principal_cache.stats(),
+            "authorization": self.__authorization_cache.stats(),
+            "graphqlDocuments": self.__document_cache.stats(),
+            "passwordHasher": self.__password_hasher.stats(),
+        }
+        return ResponseModel(status=200, message="Cache stats fetched", data=data)
+
+    def get_resolvers(self):
+        return [self.query]
@@ -4,8 +4,10 @@ from ariadne import MutationType, QueryType
 
 from server.decorators.require_permission_decorator import require_permission
 from server.decorators.require_token_decorator import require_token
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.list_query_dto import ListQueryModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.services.authorization_service import AuthorizationService
+from server.utils.projection_utils import requested_fields
 
 
 def protect_bound(owner, handler, module, action):
@@ -32,18 +34,29 @@ class CRMResourceResolver:
         self.mutation.set_field(f"create{self.singular}", self._protected("create", self.resolve_create))
         self.mutation.set_field(f"update{self.singular}", self._protected("update", self.resolve_update))
         self.mutation.set_field(f"delete{self.singular}", self._protected("delete", self.resolve_delete))
+        plural = self.module[:1].upper() + self.module[1:]
+        self.mutation.set_field(f"create{plural}", self._protected("create", self.resolve_create_many))
+        self.mutation.set_field(f"update{plural}", self._protected("update", self.resolve_update_many))
+        self.mutation.set_field(f"delete{plural}", self._protected("delete", self.resolve_delete_many))
 
     def _protected(self, action, handler):
         return protect_bound(self, handler, self.module, action)
 
-    async def resolve_all(self, _, info, organizationId):
+    async def resolve_all(self, _, info, organizationId, first=None, after=None, filter=None, sort=None):
         access = await self.authorization.resolve_access(info.context["current_user"], organizationId)
-        return ResponseModel(
-            status=200, message=f"{self.singular} list fetched", data=await self.service.get_all(organizationId, access)
+        fields = requested_fields(info, ("data",), ("edges", "node"))
+        connection = await self.service.get_page(
+            organizationId,
+            access,
+            first=first,
+            after=after,
+            fields=fields,
+            list_query=ListQueryModel.from_input(filter, sort),
         )
+        return ConnectionResponseModel.from_connection(connection, f"{self.singular} list fetched")
 
     async def resolve_one(self, _, info, id):
-        data = await self.service.get_one(id)
+        data = await self.service.get_one(id, info.context)
         if data:
             await self.authorization.authorize_or_raise(info.context["current_user"], self.module, "read", data)
         return ResponseModel(status=200, message=f"{self.singular} fetched", data=data)
@@ -72,5 +85,43 @@ class CRMResourceResolver:
             await self.authorization.authorize_or_raise(info.context["current_user"], self.module, "delete", resource)
         return ResponseModel(status=200, message=f"{self.singular} deleted", data=await self.service.delete(id))
 
+    async def resolve_create_many(self, _, info, input):
+        user = info.context["current_user"]
+        self.service.check_bulk_size(input)
+        payloads = [self.create_model(**item) for item in input]
+        accesses = {}
+        for payload in payloads:
+            access = accesses.get(payload.organization_id)
+            if access is None:
+                access = await self.authorization.resolve_access(user, payload.organization_id)
+                accesses[payload.organization_id] = access
+            if payload.owner_id is None:
+                payload.owner_id = uuid.UUID(str(user["id"]))
+            if payload.team_id is None and access.get("team_id"):
+                payload.team_id = uuid.UUID(str(access["team_id"]))
+        resources = [payload.model_dump(by_alias=True, mode="json", exclude_none=True) for payload in payloads]
+        await self.authorization.authorize_scopes_or_raise(user, self.module, "create", resources)
+        data = await self.service.create_many(payloads)
+        return ResponseModel(status=200, message=f"{len(data)} {self.module} created", data=data)
+
+    async def resolve_update_many(self, _, info, input):
+        self.service.check_bulk_size(input)
+        payloads = [self.update_model(**item) for item in input]
+        await self._authorize_existing(info, "update", [payload.id for payload in payloads])
+        data = await self.service.update_many(payloads)
+        return ResponseModel(status=200, message=f"{len(data)} {self.module} updated", data=data)
+
+    async def resolve_delete_many(self, _, info, ids):
+        self.service.check_bulk_size(ids)
+        await self._authorize_existing(info, "delete", ids)
+        data = await self.service.delete_many(ids)
+        return ResponseModel(status=200, message=f"{len(data)} {self.module} deleted", data=data)
+
+    async def _authorize_existing(self, info, action, ids):
+        resources = await self.service.get_many(ids)
+        if any(resource is None for resource in resources):
+            self.service.raise_not_found()
+        await self.authorization.authorize_scopes_or_raise(info.context["current_user"], self.module, action, resources)
+
     def get_resolvers(self):
         return [self.query, self.mutation]
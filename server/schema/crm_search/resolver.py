@@ -0,0 +1,25 @@
+from ariadne import QueryType
+
+from server.decorators.require_token_decorator import require_token
+from server.models.dto.response_dto import ConnectionResponseModel
+from server.services.authorization_service import AuthorizationService
+from server.services.crm_search_service import CRMSearchService
+
+
+class CRMSearchResolver:
+    def __init__(self):
+        self.query = QueryType()
+        self.authorization = AuthorizationService()
+        self.service = CRMSearchService()
+        self.query.set_field("searchCrm", self.resolve_search)
+
+    @require_token
+    async def resolve_search(self, _, info, organizationId, query, types=None, first=None, after=None):
+        user = info.context["current_user"]
+        types = self.service.searchable_types(user, types)
+        access = await self.authorization.resolve_access(user, organizationId)
+        connection = await self.service.search(organizationId, access, query, types, first=first, after=after)
+        return ConnectionResponseModel.from_connection(connection, "CRM search results fetched")
+
+    def get_resolvers(self):
+        return [self.query]
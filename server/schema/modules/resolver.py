@@ -26,8 +26,8 @@ class ModuleResolver:
 
     @require_token
     @require_permission(type="modules", action="read")
-    async def resolve_module(self, _, __, id):
-        data = await self.__service.get_one(id)
+    async def resolve_module(self, _, info, id):
+        data = await self.__service.get_one(id, info.context)
         return ResponseModel(status=200, message="Module fetched", data=data)
 
     @require_token
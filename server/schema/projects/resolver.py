@@ -3,9 +3,10 @@ from ariadne import MutationType, QueryType
 from server.decorators.require_permission_decorator import require_permission
 from server.decorators.require_token_decorator import require_token
 from server.models.dto.project_dto import CreateProjectModel, UpdateProjectModel
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.services.authorization_service import AuthorizationService
 from server.services.project_service import ProjectService
+from server.utils.projection_utils import requested_fields
 
 
 class ProjectResolver:
@@ -24,14 +25,19 @@ class ProjectResolver:
 
     @require_token
     @require_permission(type="projects", action="read")
-    async def resolve_projects(self, _, info, includeArchived=False):
-        data = await self.__service.get_all(include_archived=includeArchived)
-        return ResponseModel(status=200, message="Projects fetched", data=data)
+    async def resolve_projects(self, _, info, includeArchived=False, first=None, after=None):
+        connection = await self.__service.get_page(
+            include_archived=includeArchived,
+            first=first,
+            after=after,
+            fields=requested_fields(info, ("data",), ("edges", "node")),
+        )
+        return ConnectionResponseModel.from_connection(connection, "Projects fetched")
 
     @require_token
     @require_permission(type="projects", action="read")
     async def resolve_project(self, _, info, id):
-        data = await self.__service.get_one(id)
+        data = await self.__service.get_one(id, info.context)
         if data:
             await self.__authorization.authorize_or_raise(info.context.get("current_user"), "projects", "read", data)
         return ResponseModel(status=200, message="Project fetched", data=data)
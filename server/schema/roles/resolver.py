@@ -4,7 +4,7 @@ from graphql import GraphQLResolveInfo
 from server.decorators.require_permission_decorator import require_permission
 from server.decorators.require_token_decorator import require_token
 from server.helpers.logger_helper import LoggerHelper
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.models.dto.role_dto import (
     CreateRoleModel,
     RoleItemModel,
@@ -104,14 +104,9 @@ class RoleResolver:
 
     @require_token
     @require_permission(type="roles", action="read")
-    async def resolve_roles(self, *_):
-        roles = await self.__service.get_roles()
-
-        return ResponseModel[list[RoleItemModel]](
-            status=200,
-            message="Roles fetched successfully",
-            data=roles,
-        )
+    async def resolve_roles(self, _, info, first=None, after=None):
+        connection = await self.__service.get_roles_page(first=first, after=after)
+        return ConnectionResponseModel.from_connection(connection, "Roles fetched successfully")
 
     @require_token
     @require_permission(type="roles", action="read")
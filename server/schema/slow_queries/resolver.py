@@ -0,0 +1,27 @@
+from ariadne import QueryType
+
+from server.decorators.require_permission_decorator import require_permissions
+from server.decorators.require_token_decorator import require_token
+from server.helpers.slow_query_log_helper import SlowQueryLogHelper
+from server.models.dto.response_dto import ResponseModel
+from server.strategies.permission_check_strategy import PermissionCheckMode
+
+
+class SlowQueryResolver:
+    def __init__(self):
+        self.query = QueryType()
+        self.__slow_queries = SlowQueryLogHelper()
+
+        self.query.set_field("slowQueries", self.resolve_slow_queries)
+
+    @require_token
+    @require_permissions(
+        permissions=[{"type": "activity", "action": "read"}, {"type": "roles", "action": "read"}],
+        mode=PermissionCheckMode.ALL,
+    )
+    async def resolve_slow_queries(self, _, info, limit=50):
+        data = await self.__slow_queries.recent(limit)
+        return ResponseModel(status=200, message="Slow queries fetched", data=data)
+
+    def get_resolvers(self):
+        return [self.query]
@@ -2,10 +2,12 @@ from ariadne import MutationType, QueryType
 
 from server.decorators.require_permission_decorator import require_permission
 from server.decorators.require_token_decorator import require_token
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.list_query_dto import ListQueryModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.models.dto.task_dto import CreateTaskModel, UpdateTaskModel
 from server.services.authorization_service import AuthorizationService
 from server.services.task_service import TaskService
+from server.utils.projection_utils import requested_fields
 
 
 class TaskResolver:
@@ -22,21 +24,30 @@ class TaskResolver:
         self.mutation.set_field("assignTask", self.resolve_assign_task)
         self.mutation.set_field("completeTask", self.resolve_complete_task)
         self.mutation.set_field("deleteTask", self.resolve_delete_task)
+        self.mutation.set_field("createTasks", self.resolve_create_tasks)
+        self.mutation.set_field("updateTasks", self.resolve_update_tasks)
+        self.mutation.set_field("deleteTasks", self.resolve_delete_tasks)
 
     @require_token
     @require_permission(type="tasks", action="read")
-    async def resolve_tasks(self, _, info, projectId=None):
+    async def resolve_tasks(self, _, info, projectId=None, first=None, after=None, filter=None, sort=None):
         if projectId:
             await self.__authorization.authorize_or_raise(
                 info.context.get("current_user"), "tasks", "read", context={"project_id": projectId}
             )
-        data = await self.__service.get_all(project_id=projectId)
-        return ResponseModel(status=200, message="Tasks fetched", data=data)
+        connection = await self.__service.get_page(
+            project_id=projectId,
+            first=first,
+            after=after,
+            fields=requested_fields(info, ("data",), ("edges", "node")),
+            list_query=ListQueryModel.from_input(filter, sort),
+        )
+        return ConnectionResponseModel.from_connection(connection, "Tasks fetched")
 
     @require_token
     @require_permission(type="tasks", action="read")
     async def resolve_task(self, _, info, id):
-        data = await self.__service.get_one(id)
+        data = await self.__service.get_one(id, info.context)
         if data:
             await self.__authorization.authorize_or_raise(info.context.get("current_user"), "tasks", "read", data)
         return ResponseModel(status=200, message="Task fetched", data=data)
@@ -45,6 +56,9 @@ class TaskResolver:
     @require_permission(type="tasks", action="create")
     async def resolve_create_task(self, _, info, input):
         model = CreateTaskModel(**input)
+        await self.__authorization.authorize_or_raise(
+            info.context.get("current_user"), "tasks", "create", context={"project_id": str(model.project_id)}
+        )
         data = await self.__service.create(model)
         return ResponseModel(status=200, message="Task created", data=data)
 
@@ -87,5 +101,44 @@ class TaskResolver:
         data = await self.__service.delete(id)
         return ResponseModel(status=200, message="Task deleted", data=data)
 
+    @require_token
+    @require_permission(type="tasks", action="create")
+    async def resolve_create_tasks(self, _, info, input):
+        self.__service.check_bulk_size(input)
+        models = [CreateTaskModel(**item) for item in input]
+        await self.__authorization.authorize_scopes_or_raise(
+            info.context.get("current_user"),
+            "tasks",
+            "create",
+            contexts=[{"project_id": str(model.project_id)} for model in models],
+        )
+        data = await self.__service.create_many(models)
+        return ResponseModel(status=200, message=f"{len(data)} tasks created", data=data)
+
+    @require_token
+    @require_permission(type="tasks", action="update")
+    async def resolve_update_tasks(self, _, info, input):
+        self.__service.check_bulk_size(input)
+        models = [UpdateTaskModel(**item) for item in input]
+        await self._authorize_existing(info, "update", [model.id for model in models])
+        data = await self.__service.update_many(models)
+        return ResponseModel(status=200, message=f"{len(data)} tasks updated", data=data)
+
+    @require_token
+    @require_permission(type="tasks", action="delete")
+    async def resolve_delete_tasks(self, _, info, ids):
+        self.__service.check_bulk_size(ids)
+        await self._authorize_existing(info, "delete", ids)
+        data = await self.__service.delete_many(ids)
+        return ResponseModel(status=200, message=f"{len(data)} tasks deleted", data=data)
+
+    async def _authorize_existing(self, info, action, ids):
+        resources = await self.__service.get_many(ids)
+        if any(resource is None for resource in resources):
+            self.__service.raise_not_found()
+        await self.__authorization.authorize_scopes_or_raise(
+            info.context.get("current_user"), "tasks", action, resources
+        )
+
     def get_resolvers(self):
         return [self.query, self.mutation]
@@ -7,9 +7,10 @@ from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.helpers.logger_helper import LoggerHelper
 from server.helpers.redis_helper import RedisHelper
-from server.models.dto.response_dto import ResponseModel
+from server.models.dto.response_dto import ConnectionResponseModel, ResponseModel
 from server.models.dto.user_dto import UpdateUserModel
 from server.services.user_service import UserService
+from server.utils.projection_utils import requested_fields
 
 
 class UserResolver:
@@ -49,13 +50,11 @@ class UserResolver:
 
     @require_token
     @require_permission(type="users", action="read")
-    async def resolve_users(self, _, info):
-        response = await self.user_service.get_users()
-        return ResponseModel(
-            status=200,
-            message="Users fetched successfully",
-            data=response,
+    async def resolve_users(self, _, info, first=None, after=None):
+        connection = await self.user_service.get_users_page(
+            first=first, after=after, fields=requested_fields(info, ("data",), ("edges", "node"))
         )
+        return ConnectionResponseModel.from_connection(connection, "Users fetched successfully")
 
     @require_token
     @require_permission(type="users", action="read")
@@ -1,11 +1,12 @@
 from server.decorators.singleton_decorator import singleton
 from server.models.dto.activity_dto import ActivityItemModel, CreateActivityModel, UpdateActivityModel
 from server.repositories.activity_repository import ActivityRepository
-from server.services.base_service import BaseService
+from server.services.crm_resource_service import CRMResourceService
 
 
 @singleton
-class ActivityService(BaseService[CreateActivityModel, UpdateActivityModel, ActivityItemModel]):
+class ActivityService(CRMResourceService[CreateActivityModel, UpdateActivityModel, ActivityItemModel]):
     repository = ActivityRepository()
     item_model = ActivityItemModel
+    counter_entity = "activities"
     resource_not_found = "Activity not found"
@@ -1,8 +1,11 @@
+from datetime import datetime, timezone
 from typing import Any
 
 from server.decorators.singleton_decorator import singleton
+from server.helpers.audit_log_sink_helper import AuditLogSinkHelper
+from server.helpers.audit_policy_helper import AuditPolicyHelper
 from server.helpers.logger_helper import LoggerHelper
-from server.models.dto.audit_log_dto import AuditLogItemModel, AuditLogListModel
+from server.models.dto.audit_log_dto import AuditLogItemModel, AuditLogListModel, AuditLogRangeModel
 from server.repositories.audit_log_repository import AuditLogRepository
 
 
@@ -10,6 +13,14 @@ from server.repositories.audit_log_repository import AuditLogRepository
 class AuditLogService:
     def __init__(self):
         self.__repository = AuditLogRepository()
+        self.__sink = AuditLogSinkHelper()
+        self.__policies = AuditPolicyHelper()
+
+    def start_sink(self) -> None:
+        self.__sink.start(self.__repository.insert_many)
+
+    async def stop_sink(self) -> None:
+        await self.__sink.stop()
 
     async def record(
         self,
@@ -22,6 +33,13 @@ class AuditLogService:
         metadata: dict[str, Any] | None = None,
         strict: bool = False,
     ):
+        policy = None
+        if not strict:
+            policy = self.__policies.match(module, action, status)
+            if not self.__policies.sampled(policy):
+                return None
+            if policy.sample_rate < 1:
+                metadata = {**(metadata or {}), "sampleRate": policy.sample_rate}
         payload = {
             "user_id": user_id,
             "module": module,
@@ -31,6 +49,13 @@ class AuditLogService:
             "status": status,
             "metadata_json": metadata or {},
         }
+        if not strict and self.__sink.running:
+            # Write-behind: la request no espera el INSERT; `strict=True` conserva la escritura síncrona
+            await self.__sink.submit(
+                {**payload, "created_at": datetime.now(timezone.utc)},
+                aggregate_window_seconds=policy.aggregate_window_seconds,
+            )
+            return None
         try:
             audit_log = await self.__repository.create(payload)
             return AuditLogItemModel.model_validate(audit_log).model_dump(by_alias=True, mode="json")
@@ -40,6 +65,7 @@ class AuditLogService:
                 raise
             return None
 
-    async def list_logs(self, limit: int = 100):
-        logs = await self.__repository.find_all(limit=limit)
+    async def list_logs(self, limit: int = 100, since=None, until=None):
+        time_range = AuditLogRangeModel(since=since, until=until)
+        logs = await self.__repository.find_all(limit=limit, since=time_range.since, until=time_range.until)
         return AuditLogListModel.model_validate(logs).model_dump(by_alias=True, mode="json")
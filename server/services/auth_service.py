@@ -5,13 +5,13 @@ from server.helpers.custom_graphql_exception_helper import (
 )
 from server.helpers.logger_helper import LoggerHelper
 from server.helpers.mail_helper import MailHelper
+from server.helpers.password_hasher_helper import PasswordHasherHelper
 from server.helpers.template_helper import TemplateHelper
 from server.models.dto.user_dto import UserItemModel
 from server.repositories.user_repository import UserRepository
 from server.utils.auth_utils import (
     create_refresh_token,
     create_token,
-    verify_password,
     verify_refresh_token,
     verify_token,
 )
@@ -23,9 +23,11 @@ class AuthService:
         self.__repository = UserRepository()
         self.__mail_helper = MailHelper()
         self.__template_helper = TemplateHelper()
+        self.__password_hasher = PasswordHasherHelper()
         LoggerHelper.info("AuthService initialized")
 
     async def register(self, user_data: dict):
+        user_data = {**user_data, "password": await self.__password_hasher.hash(user_data["password"])}
         user_orm = await self.__repository.create(user_data)
         user_dto = UserItemModel.model_validate(user_orm).model_dump(mode="json")
         access_token = create_token(user_dto)
@@ -39,7 +41,7 @@ class AuthService:
     async def login(self, email: str, password: str):
         user_orm = await self.__repository.find_by_email(email)
 
-        if not user_orm or not verify_password(password, user_orm.password):
+        if not user_orm or not await self.__password_hasher.verify(password, user_orm.password):
             raise CustomGraphQLExceptionHelper("Credenciales inválidas")
 
         user_dto = UserItemModel.model_validate(user_orm).model_dump(mode="json")
@@ -111,7 +113,7 @@ class AuthService:
 
             await self.__repository.update(
                 str(user_orm.id),
-                {"password": new_password},
+                {"password": await self.__password_hasher.hash(new_password)},
             )
 
             LoggerHelper.info(f"Password reset successfully for user: {email}")
@@ -1,13 +1,21 @@
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 from server.decorators.singleton_decorator import singleton
 from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
-from server.repositories.crm_team_repository import CRMTeamRepository
+from server.repositories.base_repository import parse_uuid
+from server.repositories.crm_team_repository import CRMTeamRepository, pick_user_access
 from server.repositories.project_member_repository import ProjectMemberRepository
 from server.services.audit_log_service import AuditLogService
-from server.utils.permission_utils import has_permission
+from server.utils.permission_utils import (
+    CompiledPermissions,
+    compile_permissions,
+    has_permission,
+    permissions_fingerprint,
+)
 
 
 @dataclass(frozen=True)
@@ -17,12 +25,41 @@ class AuthorizationResult:
     status_code: HTTPErrorCode | None = None
 
 
+class _BatchLookups:
+    """Membresías de un lote de recursos: la primera búsqueda de cada tipo carga las de todo el lote.
+
+    Expone la misma interfaz que los repositorios, así `_evaluate` aplica exactamente las mismas reglas.
+    """
+
+    def __init__(self, project_members, crm_teams, project_ids, organization_ids):
+        self._project_member_repository = project_members
+        self._crm_team_repository = crm_teams
+        self._project_ids = project_ids
+        self._organization_ids = organization_ids
+        self._members = None
+        self._memberships = None
+
+    async def find_by_project_and_user(self, project_id, user_id):
+        if self._members is None:
+            self._members = await self._project_member_repository.find_by_projects_and_user(self._project_ids, user_id)
+        return self._members.get(parse_uuid(project_id))
+
+    async def find_user_access(self, organization_id, user_id, team_id=None):
+        if self._memberships is None:
+            self._memberships = await self._crm_team_repository.find_user_memberships(self._organization_ids, user_id)
+        members = self._memberships.get(parse_uuid(organization_id), [])
+        if team_id:
+            members = [member for member in members if member.team_id == parse_uuid(team_id)]
+        return pick_user_access(members)
+
+
 @singleton
 class AuthorizationService:
     def __init__(self):
         self.__project_member_repository = ProjectMemberRepository()
         self.__crm_team_repository = CRMTeamRepository()
         self.__audit_log_service = AuditLogService()
+        self.__decision_cache = AuthorizationCacheHelper()
 
     async def authorize(
         self,
@@ -32,10 +69,72 @@ class AuthorizationService:
         resource: Any = None,
         context: dict | None = None,
     ) -> AuthorizationResult:
-        result = await self._evaluate(user, module, action, resource=resource, context=context)
+        result = await self._cached_evaluate(user, module, action, resource=resource, context=context)
         await self._record_authorization(user, module, action, result, resource=resource, context=context)
         return result
 
+    async def _cached_evaluate(
+        self,
+        user: dict | None,
+        module: str,
+        action: str,
+        resource: Any = None,
+        context: dict | None = None,
+        lookups: "_BatchLookups | None" = None,
+    ) -> AuthorizationResult:
+        """`_evaluate` memorizado por usuario, permisos, módulo, acción y alcance (ver `_scope_key`)."""
+        if not user or not user.get("id"):
+            return await self._evaluate(user, module, action, resource=resource, context=context, lookups=lookups)
+        scope = ":".join(value or "" for value in self._scope_key(module, resource, context))
+        field = f"{self._permissions_fingerprint(user)}|{module}.{action}|{scope}"
+        cached = await self.__decision_cache.get(user["id"], field)
+        if cached is not None:
+            status_code = HTTPErrorCode[cached["statusCode"]] if cached["statusCode"] else None
+            return AuthorizationResult(cached["allowed"], cached["reason"], status_code)
+
+        result = await self._evaluate(user, module, action, resource=resource, context=context, lookups=lookups)
+        await self.__decision_cache.set(
+            user["id"],
+            field,
+            {
+                "allowed": result.allowed,
+                "reason": result.reason,
+                "statusCode": result.status_code.name if result.status_code else None,
+            },
+        )
+        return result
+
+    async def authorize_many(
+        self,
+        user: dict | None,
+        module: str,
+        action: str,
+        resources: Iterable[Any],
+        context: dict | None = None,
+    ) -> list[AuthorizationResult]:
+        """Decisión por recurso, en el orden recibido, con las mismas reglas que `authorize`.
+
+        Cada alcance distinto (`_scope_key`) se evalúa y audita una vez; las membresías de proyecto y de equipos CRM
+        que falten en el cache se cargan para todo el lote con una consulta por tipo.
+        """
+        resources = list(resources)
+        keys = [self._scope_key(module, resource, context) for resource in resources]
+        scopes = self._group_scopes(module, [(resource, context) for resource in resources])
+        lookups = _BatchLookups(
+            self.__project_member_repository,
+            self.__crm_team_repository,
+            project_ids=[key[3] for key in scopes if key[3]],
+            organization_ids=[key[0] for key in scopes if key[0]],
+        )
+        decisions = {}
+        for key, (resource, scope_context, resource_ids) in scopes.items():
+            result = await self._cached_evaluate(user, module, action, resource, scope_context, lookups=lookups)
+            await self._record_authorization(
+                user, module, action, result, resource=resource, context=scope_context, resource_ids=resource_ids
+            )
+            decisions[key] = result
+        return [decisions[key] for key in keys]
+
     async def _evaluate(
         self,
         user: dict | None,
@@ -43,6 +142,7 @@ class AuthorizationService:
         action: str,
         resource: Any = None,
         context: dict | None = None,
+        lookups: "_BatchLookups | None" = None,
     ) -> AuthorizationResult:
         if not user:
             return AuthorizationResult(False, "unauthenticated", HTTPErrorCode.UNAUTHORIZED)
@@ -51,7 +151,7 @@ class AuthorizationService:
         if context and context.get("organization_id"):
             organization_id = context["organization_id"]
         if organization_id:
-            return await self._evaluate_context_scope(user, module, action, resource, organization_id)
+            return await self._evaluate_context_scope(user, module, action, resource, organization_id, lookups)
 
         project_id = self._resolve_project_id(resource, context)
         if not project_id:
@@ -62,11 +162,12 @@ class AuthorizationService:
         if self._has_admin_scope(user, module, action):
             return AuthorizationResult(True, "allowed_by_admin_scope")
 
-        member = await self.__project_member_repository.find_by_project_and_user(project_id, user.get("id"))
+        project_members = lookups or self.__project_member_repository
+        member = await project_members.find_by_project_and_user(project_id, user.get("id"))
         if not member:
             return AuthorizationResult(False, "missing_project_membership", HTTPErrorCode.FORBIDDEN)
 
-        project_permissions = self._project_role_permissions(member)
+        project_permissions = compile_permissions(self._project_role_permissions(member), memoize=False)
         if not has_permission(project_permissions, module, action):
             return AuthorizationResult(False, "missing_project_role_permission", HTTPErrorCode.FORBIDDEN)
 
@@ -77,13 +178,14 @@ class AuthorizationService:
 
         return AuthorizationResult(True, "allowed_by_project_role")
 
-    async def _evaluate_context_scope(self, user, module, action, resource, organization_id):
+    async def _evaluate_context_scope(self, user, module, action, resource, organization_id, lookups=None):
         if not self._has_global_permission(user, module, action):
             return AuthorizationResult(False, "missing_global_permission", HTTPErrorCode.FORBIDDEN)
         if self._has_admin_scope(user, module, action):
             return AuthorizationResult(True, "allowed_by_admin_scope")
         team_id = self._resource_value(resource, "teamId", "team_id")
-        access = await self.__crm_team_repository.find_user_access(organization_id, user.get("id"), team_id)
+        crm_teams = lookups or self.__crm_team_repository
+        access = await crm_teams.find_user_access(organization_id, user.get("id"), team_id)
         if not access:
             return AuthorizationResult(False, "missing_context_membership", HTTPErrorCode.FORBIDDEN)
         scope = access["scope"]
@@ -99,7 +201,13 @@ class AuthorizationService:
     async def resolve_access(self, user: dict, organization_id) -> dict:
         if self._has_admin_scope(user, "roles", "read"):
             return {"scope": "GLOBAL", "user_id": user.get("id"), "team_id": None}
-        access = await self.__crm_team_repository.find_user_access(organization_id, user.get("id"))
+        field = f"{self._permissions_fingerprint(user)}|access|{organization_id}"
+        cached = await self.__decision_cache.get(user.get("id"), field)
+        if cached is not None:
+            access = cached["access"]
+        else:
+            access = await self.__crm_team_repository.find_user_access(organization_id, user.get("id"))
+            await self.__decision_cache.set(user.get("id"), field, {"access": access})
         if not access:
             raise CustomGraphQLExceptionHelper("Permiso denegado", HTTPErrorCode.FORBIDDEN)
         return access
@@ -124,12 +232,71 @@ class AuthorizationService:
             raise CustomGraphQLExceptionHelper("Permiso denegado", result.status_code or HTTPErrorCode.FORBIDDEN)
         return result
 
+    async def authorize_scopes_or_raise(
+        self,
+        user: dict | None,
+        module: str,
+        action: str,
+        resources: Iterable[Any] = (),
+        contexts: Iterable[dict] = (),
+    ) -> int:
+        """Autoriza una operación masiva evaluando (y auditando) una sola vez cada alcance distinto.
+
+        Dos recursos comparten alcance si coinciden organización, equipo, dueño, proyecto y, en tareas, asignado;
+        la decisión depende solo de esos valores. Devuelve cuántos alcances se evaluaron.
+        """
+        scopes = self._group_scopes(
+            module, [*((item, None) for item in resources), *((None, item) for item in contexts)]
+        )
+        for resource, context, resource_ids in scopes.values():
+            result = await self._cached_evaluate(user, module, action, resource=resource, context=context)
+            await self._record_authorization(
+                user, module, action, result, resource=resource, context=context, resource_ids=resource_ids
+            )
+            if not result.allowed:
+                raise CustomGraphQLExceptionHelper("Permiso denegado", result.status_code or HTTPErrorCode.FORBIDDEN)
+        return len(scopes)
+
+    def _group_scopes(self, module: str, items: list[tuple[Any, dict | None]]) -> dict[tuple, tuple]:
+        """Agrupa `(recurso, contexto)` por `_scope_key`: el primero de cada alcance y los ids de todo el grupo."""
+        scopes = {}
+        for resource, context in items:
+            key = self._scope_key(module, resource, context)
+            _, _, resource_ids = scopes.setdefault(key, (resource, context, []))
+            resource_id = self._resolve_resource_id(resource, context)
+            if resource_id and resource_id not in resource_ids:
+                resource_ids.append(resource_id)
+        return scopes
+
+    def _scope_key(self, module: str, resource: Any = None, context: dict | None = None) -> tuple:
+        organization_id = (context or {}).get("organization_id") or self._resource_value(
+            resource, "organizationId", "organization_id"
+        )
+        project_id = None if organization_id else self._resolve_project_id(resource, context)
+        assignee_id = self._resource_value(resource, "assigneeId", "assignee_id") if module == "tasks" else None
+        return tuple(
+            str(value) if value is not None else None
+            for value in (
+                organization_id,
+                self._resource_value(resource, "teamId", "team_id"),
+                self._resource_value(resource, "ownerId", "owner_id"),
+                project_id,
+                assignee_id,
+            )
+        )
+
+    def _principal_permissions(self, user: dict) -> CompiledPermissions:
+        return compile_permissions((user.get("role") or {}).get("permissions") or [])
+
+    def _permissions_fingerprint(self, user: dict) -> str:
+        # Un cambio de rol o de sus permisos cambia la huella: las decisiones anteriores dejan de aplicar
+        return permissions_fingerprint(self._principal_permissions(user))
+
     def _has_global_permission(self, user: dict, module: str, action: str) -> bool:
-        permissions = user.get("role", {}).get("permissions", [])
-        return has_permission(permissions, module, action)
+        return has_permission(self._principal_permissions(user), module, action)
 
     def _has_admin_scope(self, user: dict, module: str, action: str) -> bool:
-        permissions = user.get("role", {}).get("permissions", [])
+        permissions = self._principal_permissions(user)
         return has_permission(permissions, module, action) and has_permission(permissions, "roles", "read")
 
     def _project_role_permissions(self, member) -> list[dict[str, str]]:
@@ -172,15 +339,22 @@ class AuthorizationService:
         result: AuthorizationResult,
         resource: Any = None,
         context: dict | None = None,
+        resource_ids: list[str] | None = None,
     ) -> None:
+        """Con `resource_ids` (alcance de una operación masiva) la fila no nombra un recurso: los lista en metadata."""
+        metadata = {"reason": result.reason}
+        resource_id = self._resolve_resource_id(resource, context)
+        if resource_ids is not None:
+            metadata.update(count=len(resource_ids), resourceIds=resource_ids)
+            resource_id = None
         await self.__audit_log_service.record(
             user_id=user.get("id") if user else None,
             module=module,
             action=action,
             resource_type=self._resolve_resource_type(module, resource),
-            resource_id=self._resolve_resource_id(resource, context),
+            resource_id=resource_id,
             status="success" if result.allowed else "denied",
-            metadata={"reason": result.reason},
+            metadata=metadata,
             strict=False,
         )
 
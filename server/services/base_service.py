@@ -1,7 +1,10 @@
 from typing import Generic, TypeVar
 
+from server.config.settings import settings
 from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.repositories.base_repository import parse_uuid
+from server.utils.projection_utils import attribute_names, serialize_projection
 
 CreateT = TypeVar("CreateT")
 UpdateT = TypeVar("UpdateT")
@@ -25,22 +28,83 @@ class BaseService(Generic[CreateT, UpdateT, ItemT]):
             exclude_none=self.serialize_exclude_none,
         )
 
+    def serialize_projection(self, resource, attributes: frozenset[str]):
+        return serialize_projection(
+            self.item_model,
+            resource,
+            attributes,
+            by_alias=self.serialize_by_alias,
+            mode=self.serialize_mode,
+            exclude_none=self.serialize_exclude_none,
+        )
+
     async def create(self, payload: CreateT):
         return self.serialize(await self.repository.create(payload.model_dump(exclude_none=True)))
 
-    async def get_one(self, resource_id):
-        resource = await self.repository.find_by_id(resource_id)
+    async def get_one(self, resource_id, context=None):
+        """Con `context` la lectura pasa por el DataLoader de la request y se agrupa con otras del mismo tick."""
+        if context is not None:
+            resource = await self.repository.loader(context).load(resource_id)
+        else:
+            resource = await self.repository.find_by_id(resource_id)
         return self.serialize(resource) if resource else None
 
+    async def get_many(self, resource_ids) -> list:
+        """Lee varios recursos con un solo query; `None` en la posición de los que no existen."""
+        resources = await self.repository.find_by_ids(resource_ids)
+        return [self.serialize(resource) if resource else None for resource in resources]
+
     async def get_all(self, *args, **filters):
         return [self.serialize(item) for item in await self.repository.find_all(*args, **filters)]
 
+    async def get_page(
+        self, *args, first: int | None = None, after: str | None = None, fields: frozenset[str] | None = None, **filters
+    ) -> dict:
+        """Página de recursos; con `fields` (nombres GraphQL pedidos) solo se leen y serializan esas columnas."""
+        if fields is None:
+            page = await self.repository.find_page(*args, first=first, after=after, **filters)
+            return page.to_connection(self.serialize)
+        attributes = attribute_names(self.item_model, fields) | {"id"}
+        page = await self.repository.find_page(*args, first=first, after=after, columns=attributes, **filters)
+        return page.to_connection(lambda resource: self.serialize_projection(resource, attributes))
+
     async def update(self, payload: UpdateT):
         resource = await self.repository.update(payload.id, payload.model_dump(exclude={"id"}, exclude_none=True))
         if not resource:
             self.raise_not_found()
         return self.serialize(resource)
 
+    async def create_many(self, payloads: list[CreateT]) -> list:
+        self.check_bulk_size(payloads)
+        resources = await self.repository.create_many([payload.model_dump(exclude_none=True) for payload in payloads])
+        return [self.serialize(resource) for resource in resources]
+
+    async def update_many(self, payloads: list[UpdateT]) -> list:
+        """Todo o nada: si algún id no existe se lanza NOT_FOUND y el unit of work hace rollback."""
+        self.check_bulk_size(payloads)
+        resources = await self.repository.update_many(
+            [(payload.id, payload.model_dump(exclude={"id"}, exclude_none=True)) for payload in payloads]
+        )
+        if any(resource is None for resource in resources):
+            self.raise_not_found()
+        return [self.serialize(resource) for resource in resources]
+
+    async def delete_many(self, resource_ids) -> list[str]:
+        self.check_bulk_size(resource_ids)
+        requested = {parse_uuid(resource_id) for resource_id in resource_ids}
+        deleted = await self.repository.delete_many([resource_id for resource_id in requested if resource_id])
+        if None in requested or len(deleted) != len(requested):
+            self.raise_not_found()
+        return [str(resource_id) for resource_id in deleted]
+
+    def check_bulk_size(self, items) -> None:
+        if not items:
+            raise CustomGraphQLExceptionHelper("La operación masiva no contiene elementos")
+        if len(items) > settings.BULK_MAX_ITEMS:
+            raise CustomGraphQLExceptionHelper(
+                f"Se permiten como máximo {settings.BULK_MAX_ITEMS} elementos por operación masiva"
+            )
+
     async def delete(self, resource_id):
         if not await self.repository.delete(resource_id):
             self.raise_not_found()
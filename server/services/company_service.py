@@ -1,11 +1,12 @@
 from server.decorators.singleton_decorator import singleton
 from server.models.dto.company_dto import CompanyItemModel, CreateCompanyModel, UpdateCompanyModel
 from server.repositories.company_repository import CompanyRepository
-from server.services.base_service import BaseService
+from server.services.crm_resource_service import CRMResourceService
 
 
 @singleton
-class CompanyService(BaseService[CreateCompanyModel, UpdateCompanyModel, CompanyItemModel]):
+class CompanyService(CRMResourceService[CreateCompanyModel, UpdateCompanyModel, CompanyItemModel]):
     repository = CompanyRepository()
     item_model = CompanyItemModel
+    counter_entity = "companies"
     resource_not_found = "Company not found"
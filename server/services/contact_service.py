@@ -1,11 +1,12 @@
 from server.decorators.singleton_decorator import singleton
 from server.models.dto.contact_dto import ContactItemModel, CreateContactModel, UpdateContactModel
 from server.repositories.contact_repository import ContactRepository
-from server.services.base_service import BaseService
+from server.services.crm_resource_service import CRMResourceService
 
 
 @singleton
-class ContactService(BaseService[CreateContactModel, UpdateContactModel, ContactItemModel]):
+class ContactService(CRMResourceService[CreateContactModel, UpdateContactModel, ContactItemModel]):
     repository = ContactRepository()
     item_model = ContactItemModel
+    counter_entity = "contacts"
     resource_not_found = "Contact not found"
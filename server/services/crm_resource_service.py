@@ -0,0 +1,91 @@
+from typing import TypeVar
+
+from server.db.session import AsyncSessionLocal
+from server.repositories.base_repository import parse_uuid
+from server.repositories.crm_counter_repository import COUNTED_FIELDS, CRMCounterRepository
+from server.services.base_service import BaseService
+
+CreateT = TypeVar("CreateT")
+UpdateT = TypeVar("UpdateT")
+ItemT = TypeVar("ItemT")
+
+
+class CRMResourceService(BaseService[CreateT, UpdateT, ItemT]):
+    """CRUD de recursos CRM que ajusta `crm_counters` en la misma transacción que cada escritura."""
+
+    counter_entity: str
+    counter_repository = CRMCounterRepository()
+
+    async def create(self, payload: CreateT):
+        async with AsyncSessionLocal() as session:
+            resource = await self.repository.create(payload.model_dump(exclude_none=True), session)
+            await self._count(session, added=[resource])
+            await session.commit()
+            return self.serialize(resource)
+
+    async def update(self, payload: UpdateT):
+        return await self.update_counted(payload.id, payload.model_dump(exclude={"id"}, exclude_none=True))
+
+    async def update_counted(self, resource_id, data: dict):
+        """Solo si cambia algún campo contado se lee (y bloquea) la fila anterior para mover su contador."""
+        async with AsyncSessionLocal() as session:
+            before = await self._snapshot([resource_id] if COUNTED_FIELDS & data.keys() else [], session)
+            resource = await self.repository.update(resource_id, data, session)
+            if not resource:
+                self.raise_not_found()
+            if before:
+                await self._count(session, removed=before, added=[resource])
+            await session.commit()
+            return self.serialize(resource)
+
+    async def delete(self, resource_id):
+        await self._delete_counted([resource_id])
+        return True
+
+    async def create_many(self, payloads: list[CreateT]) -> list:
+        self.check_bulk_size(payloads)
+        async with AsyncSessionLocal() as session:
+            resources = await self.repository.create_many(
+                [payload.model_dump(exclude_none=True) for payload in payloads], session
+            )
+            await self._count(session, added=resources)
+            await session.commit()
+            return [self.serialize(resource) for resource in resources]
+
+    async def update_many(self, payloads: list[UpdateT]) -> list:
+        self.check_bulk_size(payloads)
+        changes = [(payload.id, payload.model_dump(exclude={"id"}, exclude_none=True)) for payload in payloads]
+        counted_ids = {parse_uuid(resource_id) for resource_id, data in changes if COUNTED_FIELDS & data.keys()}
+        async with AsyncSessionLocal() as session:
+            before = await self._snapshot(counted_ids, session)
+            resources = await self.repository.update_many(changes, session)
+            if any(resource is None for resource in resources):
+                self.raise_not_found()
+            await self._count(session, removed=before, added=[row for row in resources if row.id in counted_ids])
+            await session.commit()
+            return [self.serialize(resource) for resource in resources]
+
+    async def delete_many(self, resource_ids) -> list[str]:
+        self.check_bulk_size(resource_ids)
+        return [str(resource_id) for resource_id in await self._delete_counted(resource_ids)]
+
+    async def _snapshot(self, resource_ids, session) -> list:
+        return await self.counter_repository.snapshot(self.counter_entity, resource_ids, session)
+
+    async def _count(self, session, removed=(), added=(), into=None) -> None:
+        deltas = self.counter_repository.deltas(self.counter_entity, removed=removed, added=added, into=into)
+        await self.counter_repository.apply(deltas, session)
+
+    async def _delete_counted(self, resource_ids) -> list:
+        """Borra todo o nada; descuenta los recursos y las actividades que caen en cascada con ellos."""
+        requested = {parse_uuid(resource_id) for resource_id in resource_ids}
+        ids = [resource_id for resource_id in requested if resource_id]
+        async with AsyncSessionLocal() as session:
+            before = await self._snapshot(ids, session)
+            if None in requested or len(before) != len(requested):
+                self.raise_not_found()
+            deltas = await self.counter_repository.cascaded_activity_deltas(self.counter_entity, ids, session)
+            deleted = await self.repository.delete_many(ids, session)
+            await self._count(session, removed=before, into=deltas)
+            await session.commit()
+            return deleted
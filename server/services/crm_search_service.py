@@ -0,0 +1,49 @@
+from server.decorators.singleton_decorator import singleton
+from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.repositories.crm_search_repository import CRMSearchRepository
+from server.utils.permission_utils import has_permission
+
+MAX_QUERY_LENGTH = 200
+
+
+@singleton
+class CRMSearchService:
+    def __init__(self):
+        self.repository = CRMSearchRepository()
+
+    def searchable_types(self, user: dict, types: list[str] | None = None) -> list[str]:
+        """Tipos a buscar: los pedidos (todos deben tener permiso `read`) o, sin `types`, todos los permitidos."""
+        permissions = (user.get("role") or {}).get("permissions", [])
+        if types:
+            requested = list(dict.fromkeys(value.lower() for value in types))
+            unknown = [value for value in requested if value not in self.repository.models]
+            if unknown:
+                raise CustomGraphQLExceptionHelper(f"Tipos de búsqueda no soportados: {', '.join(unknown)}")
+            for value in requested:
+                if not has_permission(permissions, value, "read"):
+                    raise CustomGraphQLExceptionHelper(
+                        f"Permiso denegado: se requiere {value}:read", HTTPErrorCode.FORBIDDEN
+                    )
+            return requested
+        allowed = [value for value in self.repository.models if has_permission(permissions, value, "read")]
+        if not allowed:
+            raise CustomGraphQLExceptionHelper("Permiso denegado", HTTPErrorCode.FORBIDDEN)
+        return allowed
+
+    async def search(self, organization_id, access, query: str, types, first=None, after=None) -> dict:
+        query = (query or "").strip()
+        if not query:
+            raise CustomGraphQLExceptionHelper("La búsqueda no puede estar vacía")
+        if len(query) > MAX_QUERY_LENGTH:
+            raise CustomGraphQLExceptionHelper(f"La búsqueda admite como máximo {MAX_QUERY_LENGTH} caracteres")
+        page = await self.repository.search(organization_id, access, query, types, first=first, after=after)
+        return page.to_connection(
+            lambda item: {
+                "type": item["type"],
+                "id": str(item["id"]),
+                "title": item["title"],
+                "subtitle": item["subtitle"],
+                "rank": item["rank"],
+            }
+        )
@@ -7,14 +7,15 @@ from server.models.dto.lead_dto import ConvertLeadModel, CreateLeadModel, LeadIt
 from server.models.dto.opportunity_dto import OpportunityItemModel
 from server.repositories.lead_repository import LeadRepository
 from server.repositories.opportunity_repository import OpportunityRepository
-from server.services.base_service import BaseService
+from server.services.crm_resource_service import CRMResourceService
 
 
 @singleton
-class LeadService(BaseService[CreateLeadModel, UpdateLeadModel, LeadItemModel]):
+class LeadService(CRMResourceService[CreateLeadModel, UpdateLeadModel, LeadItemModel]):
     repository = LeadRepository()
     opportunity_repository = OpportunityRepository()
     item_model = LeadItemModel
+    counter_entity = "leads"
     resource_not_found = "Lead not found"
 
     async def convert(self, payload: ConvertLeadModel):
@@ -41,6 +42,8 @@ class LeadService(BaseService[CreateLeadModel, UpdateLeadModel, LeadItemModel]):
                 },
                 session,
             )
+            deltas = self.counter_repository.deltas("opportunities", added=[opportunity])
+            await self.counter_repository.apply(deltas, session)
             await session.commit()
             return OpportunityItemModel.model_validate(opportunity).model_dump(
                 by_alias=True, mode="json", exclude_none=True
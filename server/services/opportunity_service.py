@@ -1,23 +1,17 @@
 from datetime import datetime, timezone
 
 from server.decorators.singleton_decorator import singleton
-from server.enums.http_error_code_enum import HTTPErrorCode
-from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.models.dto.opportunity_dto import CreateOpportunityModel, OpportunityItemModel, UpdateOpportunityModel
 from server.repositories.opportunity_repository import OpportunityRepository
-from server.services.base_service import BaseService
+from server.services.crm_resource_service import CRMResourceService
 
 
 @singleton
-class OpportunityService(BaseService[CreateOpportunityModel, UpdateOpportunityModel, OpportunityItemModel]):
+class OpportunityService(CRMResourceService[CreateOpportunityModel, UpdateOpportunityModel, OpportunityItemModel]):
     repository = OpportunityRepository()
     item_model = OpportunityItemModel
+    counter_entity = "opportunities"
     resource_not_found = "Opportunity not found"
 
     async def close(self, opportunity_id, stage):
-        resource = await self.repository.update(
-            opportunity_id, {"stage": stage, "closed_at": datetime.now(timezone.utc)}
-        )
-        if not resource:
-            raise CustomGraphQLExceptionHelper("Opportunity not found", HTTPErrorCode.NOT_FOUND)
-        return self.serialize(resource)
+        return await self.update_counted(opportunity_id, {"stage": stage, "closed_at": datetime.now(timezone.utc)})
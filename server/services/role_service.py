@@ -35,6 +35,10 @@ class RoleService(BaseService[CreateRoleModel, UpdateRoleModel, RoleItemModel]):
         role_orms = await self.repository.find_all()
         return RoleListModel.model_validate(role_orms).model_dump(by_alias=False)
 
+    async def get_roles_page(self, first: int | None = None, after: str | None = None) -> dict:
+        page = await self.repository.find_page(first=first, after=after)
+        return page.to_connection(lambda role: RoleItemModel.model_validate(role).model_dump(by_alias=False))
+
     async def get_role(self, role_id: str):
         return await self.get_one(role_id)
 
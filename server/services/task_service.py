@@ -1,6 +1,7 @@
 from server.decorators.singleton_decorator import singleton
 from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.list_query_dto import ListQueryModel
 from server.models.dto.task_dto import CreateTaskModel, TaskItemModel, UpdateTaskModel
 from server.repositories.project_repository import ProjectRepository
 from server.repositories.task_repository import TaskRepository
@@ -19,8 +20,14 @@ class TaskService(BaseService[CreateTaskModel, UpdateTaskModel, TaskItemModel]):
             raise CustomGraphQLExceptionHelper("Proyecto no encontrado", HTTPErrorCode.NOT_FOUND)
         return await super().create(payload)
 
-    async def get_all(self, project_id: str | None = None):
-        return await super().get_all(project_id=project_id)
+    async def create_many(self, payloads: list[CreateTaskModel]):
+        project_ids = list({payload.project_id for payload in payloads})
+        if None in await self.project_repository.find_by_ids(project_ids):
+            raise CustomGraphQLExceptionHelper("Proyecto no encontrado", HTTPErrorCode.NOT_FOUND)
+        return await super().create_many(payloads)
+
+    async def get_all(self, project_id: str | None = None, list_query: ListQueryModel | None = None):
+        return await super().get_all(project_id=project_id, list_query=list_query)
 
     async def assign(self, task_id: str, assignee_id: str):
         task = await self.repository.update(task_id, {"assignee_id": assignee_id})
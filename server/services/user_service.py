@@ -1,12 +1,16 @@
+from server.db.unit_of_work import after_commit
 from server.decorators.singleton_decorator import singleton
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.helpers.logger_helper import LoggerHelper
+from server.helpers.principal_cache_helper import PrincipalCacheHelper
 from server.helpers.redis_helper import RedisHelper
 from server.models.dto.user_dto import UserItemModel, UserListModel
 from server.observers.event_publisher import AsyncEventPublisher
 from server.observers.user_updated_observer import UserUpdatedEvent, UserUpdatedRedisObserver
+from server.repositories.crm_counter_repository import CRMCounterRepository
 from server.repositories.user_repository import UserRepository
 from server.services.role_service import RoleService
+from server.utils.projection_utils import attribute_names, serialize_projection
 
 
 @singleton
@@ -14,7 +18,9 @@ class UserService:
     def __init__(self):
         self.__repository = UserRepository()
         self.__role_service = RoleService()
+        self.__crm_counters = CRMCounterRepository()
         self.__redis = RedisHelper()
+        self.__principal_cache = PrincipalCacheHelper()
         self.__event_publisher = AsyncEventPublisher()
         self.__event_publisher.attach(UserUpdatedRedisObserver(self.__redis))
         LoggerHelper.info("UserService initialized")
@@ -23,12 +29,25 @@ class UserService:
         user_orms = await self.__repository.find_all()
         return UserListModel.model_validate(user_orms).model_dump(by_alias=False)
 
+    async def get_users_page(
+        self, first: int | None = None, after: str | None = None, fields: frozenset[str] | None = None
+    ) -> dict:
+        if fields is None:
+            page = await self.__repository.find_page(first=first, after=after)
+            return page.to_connection(lambda user: UserItemModel.model_validate(user).model_dump(by_alias=False))
+        attributes = attribute_names(UserItemModel, fields) | {"id"}
+        page = await self.__repository.find_page(first=first, after=after, columns=attributes)
+        return page.to_connection(lambda user: serialize_projection(UserItemModel, user, attributes, by_alias=False))
+
     async def get_user(self, user_id: str):
-        user_orm = await self.__repository.find_by_id(user_id)
-        if not user_orm:
-            return None
-        # Retorna dict con permisos resueltos (usado por @require_token)
-        return await self.__repository.aggregate_user_with_role_permissions(user_id)
+        # Retorna dict con permisos resueltos (usado por @require_token) o None si no existe
+        cached = await self.__principal_cache.get(user_id)
+        if cached is not None:
+            return cached
+        user = await self.__repository.aggregate_user_with_role_permissions(user_id)
+        if user:
+            await self.__principal_cache.set(user_id, user)
+        return user
 
     async def update_user(self, user_id: str, update_data: dict):
         role_id = update_data.get("role_id")
@@ -38,14 +57,21 @@ class UserService:
                 raise CustomGraphQLExceptionHelper("Role not found")
 
         if update_data:
-            await self.__repository.update(user_id, update_data)
-
-        user_orm = await self.__repository.find_by_id(user_id)
+            # UPDATE … RETURNING ya devuelve el usuario con su rol; no hace falta releerlo
+            user_orm = await self.__repository.update(user_id, update_data)
+            await after_commit(lambda: self.__principal_cache.invalidate([user_id]))
+        else:
+            user_orm = await self.__repository.find_by_id(user_id)
         if not user_orm:
             raise CustomGraphQLExceptionHelper("Usuario no encontrado")
         payload = UserItemModel.model_validate(user_orm).model_dump(by_alias=False, mode="json")
-        await self.__event_publisher.notify(UserUpdatedEvent(user_id=user_id, payload=payload))
+        await after_commit(lambda: self.__event_publisher.notify(UserUpdatedEvent(user_id=user_id, payload=payload)))
         return payload
 
     async def delete_user(self, user_id: str):
-        return await self.__repository.delete(user_id)
+        deleted = await self.__repository.delete(user_id)
+        if deleted:
+            # Sus recursos CRM quedan sin dueño (ON DELETE SET NULL); dentro del unit of work es la misma transacción
+            await self.__crm_counters.release_owner(user_id)
+        await after_commit(lambda: self.__principal_cache.invalidate([user_id]))
+        return deleted
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 
-from server.utils.permission_utils import permission_set
+from server.utils.permission_utils import CompiledPermissions, compile_permissions
+
+Permissions = list[dict] | CompiledPermissions
 
 
 class PermissionCheckMode(str, Enum):
@@ -13,18 +15,18 @@ class PermissionCheckStrategy(ABC):
     """Contrato para políticas de evaluación de múltiples permisos."""
 
     @abstractmethod
-    def is_allowed(self, user_permissions: list[dict], required_permissions: list[dict]) -> bool:
+    def is_allowed(self, user_permissions: Permissions, required_permissions: Permissions) -> bool:
         raise NotImplementedError
 
 
 class AnyPermissionStrategy(PermissionCheckStrategy):
-    def is_allowed(self, user_permissions: list[dict], required_permissions: list[dict]) -> bool:
-        return bool(permission_set(user_permissions) & permission_set(required_permissions))
+    def is_allowed(self, user_permissions: Permissions, required_permissions: Permissions) -> bool:
+        return not compile_permissions(user_permissions).isdisjoint(compile_permissions(required_permissions))
 
 
 class AllPermissionsStrategy(PermissionCheckStrategy):
-    def is_allowed(self, user_permissions: list[dict], required_permissions: list[dict]) -> bool:
-        return permission_set(required_permissions).issubset(permission_set(user_permissions))
+    def is_allowed(self, user_permissions: Permissions, required_permissions: Permissions) -> bool:
+        return compile_permissions(required_permissions).issubset(compile_permissions(user_permissions))
 
 
 class PermissionCheckStrategyFactory:
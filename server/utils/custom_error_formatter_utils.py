@@ -1,6 +1,8 @@
 from graphql import GraphQLError
 from pydantic import ValidationError
 
+from server.db.operation_deadline import is_statement_timeout
+from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.helpers.logger_helper import LoggerHelper
 
@@ -29,6 +31,12 @@ def custom_format_error(error: GraphQLError, debug: bool = False):
             },
         }
 
+    if is_statement_timeout(original):
+        return {
+            "message": "Un statement excedió el tiempo límite de la operación",
+            "extensions": {"code": HTTPErrorCode.OPERATION_TIMEOUT.code_name, "details": {}},
+        }
+
     # 🔥 Aquí metes el raw message
     return {
         "message": str(original) if original else error.message,
@@ -0,0 +1,71 @@
+import base64
+import json
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from server.config.settings import settings
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """Página de resultados obtenida con keyset; `cursors[i]` identifica la posición de `items[i]`."""
+
+    items: list[T] = field(default_factory=list)
+    cursors: list[str] = field(default_factory=list)
+    has_next_page: bool = False
+    has_previous_page: bool = False
+
+    def to_connection(self, serialize: Callable[[T], Any]) -> dict:
+        nodes = [serialize(item) for item in self.items]
+        return {
+            "nodes": nodes,
+            "edges": [{"cursor": cursor, "node": node} for cursor, node in zip(self.cursors, nodes)],
+            "pageInfo": {
+                "hasNextPage": self.has_next_page,
+                "hasPreviousPage": self.has_previous_page,
+                "startCursor": self.cursors[0] if self.cursors else None,
+                "endCursor": self.cursors[-1] if self.cursors else None,
+            },
+        }
+
+
+def page_size(first: int | None) -> int:
+    if first is None:
+        return settings.PAGINATION_DEFAULT_LIMIT
+    if first < 1 or first > settings.PAGINATION_MAX_LIMIT:
+        raise CustomGraphQLExceptionHelper(f"El tamaño de página debe estar entre 1 y {settings.PAGINATION_MAX_LIMIT}")
+    return first
+
+
+def cursor_order(columns: Iterable[str], descending: bool) -> str:
+    """Firma del orden de una página (`created_at,id:desc`); viaja en el cursor para no reusarlo con otro orden."""
+    return f"{','.join(columns)}:{'desc' if descending else 'asc'}"
+
+
+def encode_cursor(values: Iterable[Any], order: str | None = None) -> str:
+    raw = [value.isoformat() if isinstance(value, datetime) else str(value) for value in values]
+    if order is not None:
+        raw = [order, *raw]
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int, order: str | None = None) -> list[str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise CustomGraphQLExceptionHelper("Cursor inválido") from exc
+    expected = size if order is None else size + 1
+    if not isinstance(values, list) or len(values) != expected or not all(isinstance(value, str) for value in values):
+        raise CustomGraphQLExceptionHelper("Cursor inválido")
+    if order is None:
+        return values
+    if values[0] != order:
+        # Un cursor de `createdAt` aplicado a `sort: name` devolvería una página equivocada sin error
+        raise CustomGraphQLExceptionHelper("Cursor inválido: corresponde a otro orden")
+    return values[1:]
@@ -1,7 +1,16 @@
+import hashlib
+import sys
+from collections import OrderedDict
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
 PermissionInput = dict[str, Any] | str
+PermissionKey = tuple[str, str]
+CompiledPermissions = frozenset[PermissionKey]
+
+_COMPILED_CACHE_SIZE = 4096
+_compiled_by_identity: OrderedDict[int, tuple[Any, CompiledPermissions]] = OrderedDict()
 
 
 def normalize_permission(permission: PermissionInput) -> dict[str, str] | None:
@@ -45,8 +54,59 @@ def permission_set(permissions: Iterable[PermissionInput]) -> set[tuple[str, str
     }
 
 
-def has_permission(permissions: Iterable[PermissionInput], permission_type: str, action: str) -> bool:
-    required_permission = normalize_permission({"type": permission_type, "action": action})
+@lru_cache(maxsize=1024)
+def permission_key(permission_type: str, action: str) -> PermissionKey | None:
+    normalized = normalize_permission({"type": permission_type, "action": action})
+    if not normalized:
+        return None
+    return sys.intern(normalized["type"]), sys.intern(normalized["action"])
+
+
+def compile_permissions(
+    permissions: Iterable[PermissionInput] | CompiledPermissions, memoize: bool = True
+) -> CompiledPermissions:
+    """Compila permisos a un frozenset inmutable de llaves (module, action) internadas.
+
+    Las listas se memorizan por identidad: el principal cacheado conserva el mismo objeto entre requests, por lo que
+    la normalización ocurre una sola vez por principal. Usar ``memoize=False`` para listas efímeras.
+    """
+    if isinstance(permissions, frozenset):
+        return permissions
+    if not memoize or not isinstance(permissions, (list, tuple)):
+        return _compile(permissions)
+
+    entry = _compiled_by_identity.get(id(permissions))
+    if entry is not None and entry[0] is permissions:
+        _compiled_by_identity.move_to_end(id(permissions))
+        return entry[1]
+
+    compiled = _compile(permissions)
+    _compiled_by_identity[id(permissions)] = (permissions, compiled)
+    while len(_compiled_by_identity) > _COMPILED_CACHE_SIZE:
+        _compiled_by_identity.popitem(last=False)
+    return compiled
+
+
+def _compile(permissions: Iterable[PermissionInput]) -> CompiledPermissions:
+    keys = set()
+    for permission in permissions:
+        normalized = normalize_permission(permission)
+        if normalized is not None:
+            keys.add((sys.intern(normalized["type"]), sys.intern(normalized["action"])))
+    return frozenset(keys)
+
+
+def has_permission(
+    permissions: Iterable[PermissionInput] | CompiledPermissions, permission_type: str, action: str
+) -> bool:
+    required_permission = permission_key(permission_type, action)
     if not required_permission:
         return False
-    return (required_permission["type"], required_permission["action"]) in permission_set(permissions)
+    return required_permission in compile_permissions(permissions)
+
+
+@lru_cache(maxsize=1024)
+def permissions_fingerprint(permissions: CompiledPermissions) -> str:
+    """Huella estable entre procesos de un conjunto de permisos (el `hash` de Python se aleatoriza por proceso)."""
+    keys = ",".join(sorted(f"{permission_type}.{action}" for permission_type, action in permissions))
+    return hashlib.sha1(keys.encode()).hexdigest()[:16]
@@ -0,0 +1,24 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from server.utils.request_scope_utils import get_request_memo
+
+PRINCIPAL_MEMO_KEY = "principal_memo"
+
+PrincipalLoader = Callable[[], Awaitable[dict | None]]
+
+
+def get_principal_memo(scope: Any) -> dict[str, asyncio.Future]:
+    """Devuelve el memo de principals de la request: contexto GraphQL/WebSocket (dict) o `request.state` en REST."""
+    return get_request_memo(scope, PRINCIPAL_MEMO_KEY)
+
+
+async def resolve_principal_once(scope: Any, token: str, loader: PrincipalLoader) -> dict | None:
+    """Resuelve el usuario del token una sola vez por request, incluso con resolvers concurrentes."""
+    memo = get_principal_memo(scope)
+    pending = memo.get(token)
+    if pending is None:
+        pending = asyncio.ensure_future(loader())
+        memo[token] = pending
+    return await pending
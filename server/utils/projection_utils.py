@@ -0,0 +1,64 @@
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any, Optional
+
+from graphql import FieldNode, FragmentSpreadNode, GraphQLResolveInfo, InlineFragmentNode, SelectionSetNode
+from pydantic import BaseModel, Field, create_model
+
+
+def _collect_fields(selection_sets: Iterable[SelectionSetNode | None], fragments: dict) -> list[FieldNode]:
+    fields = []
+    pending = [selection_set for selection_set in selection_sets if selection_set is not None]
+    while pending:
+        selection_set = pending.pop()
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                fields.append(selection)
+            elif isinstance(selection, InlineFragmentNode):
+                pending.append(selection.selection_set)
+            elif isinstance(selection, FragmentSpreadNode) and selection.name.value in fragments:
+                pending.append(fragments[selection.name.value].selection_set)
+    return fields
+
+
+def requested_fields(info: GraphQLResolveInfo, *paths: tuple[str, ...]) -> frozenset[str]:
+    """Campos GraphQL pedidos bajo cada `path` del resultado (p.ej. ``("data",)`` y ``("edges", "node")``)."""
+    fragments = info.fragments or {}
+    names = set()
+    for path in paths or ((),):
+        fields = _collect_fields((node.selection_set for node in info.field_nodes), fragments)
+        for segment in path:
+            fields = _collect_fields(
+                (field.selection_set for field in fields if field.name.value == segment), fragments
+            )
+        names.update(field.name.value for field in fields if not field.name.value.startswith("__"))
+    return frozenset(names)
+
+
+def attribute_names(item_model: type[BaseModel], graphql_fields: Iterable[str]) -> frozenset[str]:
+    """Traduce nombres GraphQL (alias camelCase) a los nombres de atributo del DTO/ORM."""
+    graphql_fields = set(graphql_fields)
+    return frozenset(
+        name
+        for name, field in item_model.model_fields.items()
+        if name in graphql_fields or field.alias in graphql_fields
+    )
+
+
+def serialize_projection(item_model: type[BaseModel], resource: Any, attributes: frozenset[str], **dump_options):
+    """Serializa solo `attributes` de `resource` sin acceder a columnas diferidas del ORM."""
+    data = {name: getattr(resource, name) for name in attributes}
+    return partial_model(item_model, attributes).model_validate(data).model_dump(exclude_unset=True, **dump_options)
+
+
+@lru_cache(maxsize=256)
+def partial_model(item_model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    """Variante del DTO donde los campos no proyectados son opcionales; conserva alias y validadores."""
+    overrides: dict[str, Any] = {
+        name: (Optional[field.annotation], Field(default=None, alias=field.alias))
+        for name, field in item_model.model_fields.items()
+        if name not in fields
+    }
+    if not overrides:
+        return item_model
+    return create_model(f"{item_model.__name__}Partial", __base__=item_model, **overrides)
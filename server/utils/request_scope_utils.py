@@ -0,0 +1,18 @@
+from typing import Any
+
+
+def get_request_memo(scope: Any, key: str) -> dict:
+    """Devuelve un dict con vida de una request: contexto GraphQL/WebSocket (dict) o `request.state` en REST.
+
+    Sin un scope donde guardarlo se devuelve un dict nuevo, es decir, sin memoización.
+    """
+    if isinstance(scope, dict):
+        return scope.setdefault(key, {})
+    state = getattr(scope, "state", None)
+    if state is None:
+        return {}
+    memo = getattr(state, key, None)
+    if memo is None:
+        memo = {}
+        setattr(state, key, memo)
+    return memo
@@ -1,4 +1,5 @@
 import os
+from types import SimpleNamespace
 
 os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret")
 os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "test-refresh-secret")
@@ -9,3 +10,110 @@ os.environ.setdefault("MAIL_USERNAME", "test")
 os.environ.setdefault("MAIL_PASSWORD", "test")
 os.environ.setdefault("MAIL_DEFAULT_SENDER", "test@example.com")
 os.environ.setdefault("FRONTEND_URL", "http://localhost:3000")
+
+from contextlib import contextmanager  # noqa: E402
+from unittest.mock import AsyncMock  # noqa: E402
+
+import pytest  # noqa: E402
+
+from server.db import session as db_session  # noqa: E402
+from server.db.query_stats import record_statement, track_queries  # noqa: E402
+from server.helpers.authorization_cache_helper import AuthorizationCacheHelper  # noqa: E402
+
+
+class RecordingResult:
+    """Resultado vacío (o con las filas encoladas) con la API de `Result` que usan los repositorios."""
+
+    def __init__(self, rows=()):
+        self._rows = list(rows)
+        self.rowcount = len(self._rows)
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def unique(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def one_or_none(self):
+        return self.first()
+
+    scalar_one_or_none = one_or_none
+    scalar = one_or_none
+
+
+class RecordingSession:
+    """Sesión falsa que registra cada `execute` en el `QueryStats` activo, como lo hace el engine real."""
+
+    def __init__(self, results: list):
+        self._results = results
+
+    async def execute(self, statement, params=None):
+        result = self._results.pop(0) if self._results else RecordingResult()
+        record_statement(str(statement), result.rowcount)
+        return result
+
+    async def flush(self):
+        return None
+
+    async def commit(self):
+        return None
+
+    async def rollback(self):
+        return None
+
+    async def close(self):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return None
+
+
+@pytest.fixture
+def sql_session(monkeypatch):
+    """Reemplaza las sesiones de base de datos; las filas de `results` se devuelven en orden, una lista por query."""
+    results: list[RecordingResult] = []
+    monkeypatch.setattr(db_session.AsyncSessionLocal, "_session_factory", lambda: RecordingSession(results))
+    return SimpleNamespace(results=results, queue=lambda *rows: results.append(RecordingResult(rows)))
+
+
+@pytest.fixture
+def assert_max_queries():
+    """`with assert_max_queries(2): ...` falla si el bloque ejecuta más statements SQL y lista los ejecutados."""
+
+    @contextmanager
+    def check(limit: int):
+        with track_queries("test", capture_sql=True) as stats:
+            yield stats
+        executed = "\n".join(stats.sql)
+        assert stats.statements <= limit, f"{stats.statements} statements SQL (máximo {limit}):\n{executed}"
+
+    return check
+
+
+@pytest.fixture(autouse=True)
+def authorization_cache(monkeypatch):
+    """Cache de decisiones vacío y sin Redis en cada test: una decisión no se filtra al test siguiente."""
+    cache = AuthorizationCacheHelper()
+    cache.clear()
+    cache.local_hits = cache.redis_hits = cache.misses = 0
+    redis = SimpleNamespace(
+        hash_get=AsyncMock(return_value=None),
+        hash_set=AsyncMock(),
+        hash_delete=AsyncMock(),
+        delete_values=AsyncMock(),
+        publish_json=AsyncMock(),
+    )
+    monkeypatch.setattr(cache, "_redis", redis)
+    return cache
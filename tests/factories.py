@@ -2,6 +2,8 @@ from datetime import datetime, timezone
 from types import SimpleNamespace
 from uuid import UUID
 
+from sqlalchemy.dialects.postgresql import asyncpg
+
 ACTION_ID = UUID("55555555-5555-5555-5555-555555555555")
 MODULE_ID = UUID("66666666-6666-6666-6666-666666666666")
 PERMISSION_ID = UUID("77777777-7777-7777-7777-777777777777")
@@ -13,6 +15,11 @@ PROJECT_ROLE_ID = UUID("cccccccc-cccc-cccc-cccc-cccccccccccc")
 PROJECT_MEMBER_ID = UUID("dddddddd-dddd-dddd-dddd-dddddddddddd")
 
 
+def compiled(statement) -> str:
+    """SQL de una sentencia compilada con el dialecto de asyncpg que usa la app."""
+    return str(statement.compile(dialect=asyncpg.dialect()))
+
+
 def make_action(**overrides):
     data = {
         "id": ACTION_ID,
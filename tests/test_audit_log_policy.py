@@ -0,0 +1,172 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from server.helpers.audit_policy_helper import RECORD_ALL, AuditPolicyHelper
+from server.models.dto.audit_log_dto import AuditLogItemModel, AuditPolicyModel
+from server.services.audit_log_service import AuditLogService
+from tests.test_audit_log_sink import make_sink
+
+DEFAULT_POLICIES = [
+    {"status": "denied"},
+    {"action": "read", "status": "success", "aggregateWindowSeconds": 60},
+]
+STARTED_AT = datetime(2026, 9, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def make_policies(policies):
+    helper = AuditPolicyHelper.__wrapped__()
+    helper.policies = [AuditPolicyModel.model_validate(policy) for policy in policies]
+    return helper
+
+
+def make_log(**overrides):
+    return SimpleNamespace(
+        **{
+            "id": uuid4(),
+            "user_id": None,
+            "module": "tasks",
+            "action": "update",
+            "resource_type": None,
+            "resource_id": None,
+            "status": "success",
+            "metadata_json": {},
+            "created_at": STARTED_AT,
+            "count": 1,
+            "first_seen_at": None,
+            "last_seen_at": None,
+            **overrides,
+        }
+    )
+
+
+def make_service(sink, policies=DEFAULT_POLICIES):
+    service = AuditLogService.__wrapped__()
+    service._AuditLogService__repository = SimpleNamespace(
+        create=AsyncMock(return_value=make_log(action="read")), insert_many=sink._writer
+    )
+    service._AuditLogService__sink = sink
+    service._AuditLogService__policies = make_policies(policies)
+    return service
+
+
+def recording_writer():
+    rows = []
+
+    async def write(batch):
+        rows.extend(batch)
+        return len(batch)
+
+    return write, rows
+
+
+def decision(seconds, resource_id="1", reason="allowed_by_project_role"):
+    return {
+        "user_id": "user-1",
+        "module": "tasks",
+        "action": "read",
+        "status": "success",
+        "resource_id": resource_id,
+        "metadata_json": {"reason": reason},
+        "created_at": STARTED_AT + timedelta(seconds=seconds),
+    }
+
+
+def test_first_matching_policy_wins_and_unmatched_events_are_recorded():
+    policies = make_policies([{"module": "tasks", "status": "denied"}, {"action": "read", "sampleRate": 0.1}])
+
+    assert policies.match("tasks", "read", "denied").sample_rate == 1
+    assert policies.match("projects", "read", "success").sample_rate == 0.1
+    assert policies.match("projects", "update", "success") is RECORD_ALL
+
+
+@pytest.mark.asyncio
+async def test_identical_decisions_collapse_into_one_row_per_window(tmp_path):
+    write, rows = recording_writer()
+    sink = make_sink(tmp_path)
+    sink.start(write)
+
+    for seconds in range(3):
+        await sink.submit(decision(seconds), aggregate_window_seconds=60)
+    await sink.submit(decision(5, resource_id="2"), aggregate_window_seconds=60)
+    await sink.submit(decision(6, reason="allowed_by_admin_scope"), aggregate_window_seconds=60)
+    assert sink.stats()["aggregating"] == 3 and rows == []
+    await sink.stop()
+
+    assert [(row["resource_id"], row["count"]) for row in rows] == [("1", 3), ("2", 1), ("1", 1)]
+    assert (rows[0]["first_seen_at"], rows[0]["last_seen_at"]) == (STARTED_AT, STARTED_AT + timedelta(seconds=2))
+    assert rows[0]["created_at"] == STARTED_AT
+    assert sink.stats()["aggregated"] == 2
+
+
+@pytest.mark.asyncio
+async def test_closed_windows_are_flushed_and_later_decisions_open_a_new_one(tmp_path):
+    write, rows = recording_writer()
+    sink = make_sink(tmp_path, interval_ms=20)
+    sink.start(write)
+
+    await sink.submit(decision(0), aggregate_window_seconds=0.05)
+    await sink.submit(decision(1), aggregate_window_seconds=0.05)
+    await asyncio.sleep(0.12)
+    assert [row["count"] for row in rows] == [2]
+
+    await sink.submit(decision(2), aggregate_window_seconds=0.05)
+    await sink.stop()
+    assert [row["count"] for row in rows] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_default_policies_always_record_denials_and_aggregate_allowed_reads(tmp_path):
+    write, rows = recording_writer()
+    sink = make_sink(tmp_path)
+    sink.start(write)
+    service = make_service(sink)
+
+    for _ in range(3):
+        await service.record("user-1", "tasks", "read", "success", metadata={"reason": "allowed"})
+        await service.record("user-1", "tasks", "read", "denied", metadata={"reason": "missing_permission"})
+    await service.record("user-1", "tasks", "update", "success", metadata={"reason": "allowed"})
+    await sink.stop()
+
+    assert sorted((row["action"], row["status"], row.get("count", 1)) for row in rows) == [
+        ("read", "denied", 1),
+        ("read", "denied", 1),
+        ("read", "denied", 1),
+        ("read", "success", 3),
+        ("update", "success", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sampled_policies_keep_a_fraction_and_mark_the_rate(tmp_path):
+    write, rows = recording_writer()
+    sink = make_sink(tmp_path)
+    sink.start(write)
+    service = make_service(sink, [{"action": "read", "status": "success", "sampleRate": 0.25}])
+
+    with patch("server.helpers.audit_policy_helper.random.random", side_effect=[0.1, 0.9, 0.5, 0.2]):
+        for _ in range(4):
+            await service.record("user-1", "tasks", "read", "success", metadata={"reason": "allowed"})
+    await service.record("user-1", "tasks", "read", "success", strict=True)
+    await sink.stop()
+
+    assert [row["metadata_json"] for row in rows] == [{"reason": "allowed", "sampleRate": 0.25}] * 2
+    assert service._AuditLogService__policies.sampled_out == 2
+    service._AuditLogService__repository.create.assert_awaited_once()
+
+
+def test_audit_log_items_expose_the_aggregation_window():
+    single_item = AuditLogItemModel.model_validate(make_log()).model_dump(by_alias=True, mode="json")
+    aggregated = make_log(count=4, first_seen_at=STARTED_AT, last_seen_at=STARTED_AT + timedelta(seconds=30))
+    aggregated_item = AuditLogItemModel.model_validate(aggregated).model_dump(by_alias=True, mode="json")
+
+    assert (single_item["count"], single_item["firstSeenAt"], single_item["lastSeenAt"]) == (
+        1,
+        single_item["createdAt"],
+        single_item["createdAt"],
+    )
+    assert (aggregated_item["count"], aggregated_item["lastSeenAt"]) == (4, "2026-09-01T12:00:30Z")
@@ -1,4 +1,9 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
 
 from server.repositories.audit_log_repository import AuditLogRepository
 
@@ -37,3 +42,45 @@ async def test_audit_log_repository_create_uses_provided_session():
     assert session.added is result
     assert session.committed is True
     assert session.refreshed is result
+
+
+def fk_violation():
+    return IntegrityError("INSERT INTO audit_logs", {}, SimpleNamespace(sqlstate="23503"))
+
+
+@pytest.mark.asyncio
+async def test_insert_many_falls_back_to_single_rows_when_one_row_is_rejected():
+    deleted_user = uuid.uuid4()
+    inserted = []
+
+    async def insert_rows(params):
+        if any(row["user_id"] == deleted_user for row in params):
+            raise fk_violation()
+        if any(row.get("resource_id") == "invalid" for row in params):
+            raise DataError("INSERT INTO audit_logs", {}, SimpleNamespace(sqlstate="22001"))
+        inserted.extend(params)
+
+    repository = AuditLogRepository.__wrapped__()
+    repository._insert = insert_rows
+    rows = [
+        {"user_id": None, "module": "tasks", "action": "read", "status": "success", "resource_id": "1"},
+        {"user_id": deleted_user, "module": "tasks", "action": "read", "status": "denied", "metadata_json": {}},
+        {"user_id": None, "module": "tasks", "action": "read", "status": "success", "resource_id": "invalid"},
+    ]
+
+    assert await repository.insert_many(rows) == 2
+
+    assert [row["status"] for row in inserted] == ["success", "denied"]
+    assert inserted[1]["user_id"] is None
+    assert inserted[1]["metadata_json"] == {"deletedUserId": str(deleted_user)}
+
+
+@pytest.mark.asyncio
+async def test_insert_many_propagates_connection_errors_so_the_sink_spills_the_batch():
+    repository = AuditLogRepository.__wrapped__()
+    repository._insert = AsyncMock(side_effect=OperationalError("INSERT", {}, ConnectionError("db down")))
+
+    with pytest.raises(OperationalError):
+        await repository.insert_many([{"module": "tasks", "action": "read", "status": "success"}])
+
+    repository._insert.assert_awaited_once()
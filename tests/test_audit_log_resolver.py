@@ -24,7 +24,7 @@ async def test_audit_log_resolver_lists_logs_with_activity_read(monkeypatch):
     result = await resolver.resolve_audit_logs(None, make_info(), limit=25)
 
     assert result.data == [{"status": "success"}]
-    resolver._AuditLogResolver__service.list_logs.assert_awaited_once_with(limit=25)
+    resolver._AuditLogResolver__service.list_logs.assert_awaited_once_with(limit=25, since=None, until=None)
 
 
 @pytest.mark.asyncio
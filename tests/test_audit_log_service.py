@@ -117,4 +117,4 @@ async def test_audit_log_service_lists_logs():
     result = await service.list_logs(limit=10)
 
     assert result[0]["module"] == "tasks"
-    repository.find_all.assert_awaited_once_with(limit=10)
+    repository.find_all.assert_awaited_once_with(limit=10, since=None, until=None)
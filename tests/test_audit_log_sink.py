@@ -0,0 +1,231 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.enums.audit_overflow_policy_enum import AuditOverflowPolicy
+from server.helpers.audit_log_sink_helper import AuditLogSinkHelper
+from server.services.audit_log_service import AuditLogService
+
+
+def entry(number, status="success"):
+    return {"module": "tasks", "action": "read", "status": status, "resource_id": str(number)}
+
+
+def make_sink(tmp_path, max_size=100, batch_size=100, interval_ms=10_000, policy=AuditOverflowPolicy.DROP_ALLOWED):
+    sink = AuditLogSinkHelper.__wrapped__()
+    sink.max_size = max_size
+    sink.batch_size = batch_size
+    sink.flush_interval_seconds = interval_ms / 1000
+    sink.overflow_policy = policy
+    sink.spill_path = tmp_path / "audit_spill.jsonl"
+    return sink
+
+
+def recording_writer():
+    batches = []
+
+    async def write(rows):
+        batches.append([row["resource_id"] for row in rows])
+        return len(rows)
+
+    return write, batches
+
+
+@pytest.mark.asyncio
+async def test_flushes_in_batches_every_m_rows_or_n_ms(tmp_path):
+    write, batches = recording_writer()
+    sink = make_sink(tmp_path, batch_size=3, interval_ms=100)
+    sink.start(write)
+
+    for number in range(3):
+        await sink.submit(entry(number))
+    await asyncio.sleep(0.02)
+    assert batches == [["0", "1", "2"]]
+
+    await sink.submit(entry(3))
+    await asyncio.sleep(0.02)
+    assert batches == [["0", "1", "2"]]
+    await asyncio.sleep(0.15)
+    assert batches == [["0", "1", "2"], ["3"]]
+    await sink.stop()
+    assert sink.stats()["written"] == 4
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_what_is_still_queued(tmp_path):
+    write, batches = recording_writer()
+    sink = make_sink(tmp_path, batch_size=2)
+    sink.start(write)
+
+    for number in range(5):
+        await sink.submit(entry(number))
+    await sink.stop()
+
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+    assert not sink.running
+
+
+@pytest.mark.asyncio
+async def test_stop_during_a_slow_write_lets_the_batch_finish(tmp_path):
+    written = []
+
+    async def slow_write(rows):
+        await asyncio.sleep(0.05)
+        written.extend(row["resource_id"] for row in rows)
+
+    sink = make_sink(tmp_path, batch_size=2)
+    sink.start(slow_write)
+    for number in range(3):
+        await sink.submit(entry(number))
+    await asyncio.sleep(0.01)
+    await sink.stop()
+
+    assert written == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_an_externally_cancelled_write_puts_the_batch_back_in_the_queue(tmp_path):
+    async def hanging_write(rows):
+        await asyncio.sleep(1)
+
+    sink = make_sink(tmp_path, batch_size=2)
+    sink.start(hanging_write)
+    for number in range(2):
+        await sink.submit(entry(number))
+    await asyncio.sleep(0.01)
+
+    sink._task.cancel()
+    await asyncio.gather(sink._task, return_exceptions=True)
+
+    assert [queued["resource_id"] for queued in sink._buffer] == ["0", "1"]
+
+
+@pytest.mark.asyncio
+async def test_drop_allowed_keeps_denials_and_spills_when_only_denials_remain(tmp_path):
+    sink = make_sink(tmp_path, max_size=2)
+
+    await sink.submit(entry(1))
+    await sink.submit(entry(2, "denied"))
+    await sink.submit(entry(3, "denied"))
+    await sink.submit(entry(4))
+    await sink.submit(entry(5, "denied"))
+
+    assert [queued["resource_id"] for queued in sink._buffer] == ["2", "3"]
+    assert [json.loads(line)["resource_id"] for line in sink.spill_path.read_text().splitlines()] == ["5"]
+    assert sink.stats()["queued"] == 2
+    assert (sink.dropped, sink.spilled) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_block_policy_waits_for_the_flush_to_make_room(tmp_path):
+    write, batches = recording_writer()
+    sink = make_sink(tmp_path, max_size=1, policy=AuditOverflowPolicy.BLOCK)
+    sink.start(write)
+
+    await sink.submit(entry(1))
+    await asyncio.wait_for(sink.submit(entry(2)), timeout=1)
+    await sink.stop()
+
+    assert [row for batch in batches for row in batch] == ["1", "2"]
+    assert sink.blocked == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_spill_to_disk_and_are_replayed_on_start(tmp_path):
+    sink = make_sink(tmp_path, batch_size=10)
+    sink.start(AsyncMock(side_effect=ConnectionError("db down")))
+    await sink.submit({**entry(1, "denied"), "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc)})
+    await sink.stop()
+    assert sink.spilled == 1
+
+    write = AsyncMock()
+    restarted = make_sink(tmp_path)
+    restarted.start(write)
+    await asyncio.sleep(0.01)
+    await restarted.stop()
+
+    [rows] = write.await_args.args
+    assert rows[0]["resource_id"] == "1"
+    assert rows[0]["created_at"] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert not sink.spill_path.exists() and not sink.spill_path.with_suffix(".replay").exists()
+
+
+@pytest.mark.asyncio
+async def test_a_leftover_replay_file_is_replayed_together_with_the_new_spill(tmp_path):
+    sink = make_sink(tmp_path)
+    sink.spill_path.with_suffix(".replay").write_text(json.dumps(entry("interrupted")) + "\n")
+    sink.spill_path.write_text(json.dumps(entry("new")) + "\n")
+    write, batches = recording_writer()
+
+    sink.start(write)
+    await asyncio.sleep(0.01)
+    await sink.stop()
+
+    assert batches == [["interrupted", "new"]]
+    assert not sink.spill_path.exists() and not sink.spill_path.with_suffix(".replay").exists()
+
+    sink.spill_path.with_suffix(".replay").write_text(json.dumps(entry("only-replay")) + "\n")
+    sink.start(write)
+    await asyncio.sleep(0.01)
+    await sink.stop()
+    assert batches[-1] == ["only-replay"]
+
+
+@pytest.mark.asyncio
+async def test_truncated_spill_lines_are_set_aside_and_the_sink_keeps_flushing(tmp_path):
+    sink = make_sink(tmp_path)
+    sink.spill_path.with_suffix(".replay").write_text(json.dumps(entry("interrupted")) + '\n{"module": "ta')
+    sink.spill_path.write_text(json.dumps(entry("new")) + "\n" + '{"module": "tasks", "resour')
+    write, batches = recording_writer()
+
+    sink.start(write)
+    await asyncio.sleep(0.01)
+    assert sink.running
+    await sink.submit(entry("queued"))
+    await sink.stop()
+
+    assert batches == [["interrupted", "new"], ["queued"]]
+    rejected = sink.spill_path.with_suffix(".rejected").read_text().splitlines()
+    assert rejected == ['{"module": "ta', '{"module": "tasks", "resour']
+    assert sink.stats()["rejected"] == 2
+    assert not sink.spill_path.exists() and not sink.spill_path.with_suffix(".replay").exists()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_the_queue_even_if_the_task_already_failed(tmp_path):
+    async def failed_run():
+        raise RuntimeError("replay roto")
+
+    sink = make_sink(tmp_path)
+    write, batches = recording_writer()
+    sink._writer = write
+    sink._buffer.append(entry(1))
+    sink._task = asyncio.create_task(failed_run())
+    await asyncio.sleep(0)
+
+    await sink.stop()
+
+    assert batches == [["1"]] and not sink.running
+
+
+@pytest.mark.asyncio
+async def test_non_strict_records_go_to_the_running_sink_and_strict_ones_stay_synchronous(tmp_path):
+    sink = make_sink(tmp_path)
+    write, batches = recording_writer()
+    sink.start(write)
+    repository = SimpleNamespace(create=AsyncMock(side_effect=RuntimeError("db down")), insert_many=write)
+    service = AuditLogService.__wrapped__()
+    service._AuditLogService__repository = repository
+    service._AuditLogService__sink = sink
+
+    assert await service.record(None, "tasks", "read", "success", resource_id="queued") is None
+    with pytest.raises(RuntimeError):
+        await service.record(None, "tasks", "read", "denied", strict=True)
+    await sink.stop()
+
+    repository.create.assert_awaited_once()
+    assert batches == [["queued"]]
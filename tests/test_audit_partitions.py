@@ -0,0 +1,108 @@
+import importlib
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from server.models.orm.audit_log_orm import AuditLogORM
+from server.repositories.audit_log_repository import AuditLogRepository
+from server.repositories.audit_partitions import manage_partitions, partition_month, plan_partitions
+from server.services.audit_log_service import AuditLogService
+
+migration = importlib.import_module("server.migrations.versions.v017_partition_audit_logs_postgresql_20260925090000")
+
+
+class FakeConnection:
+    def __init__(self, partitions=(), scalars=()):
+        self.partitions = list(partitions)
+        self.scalars = list(scalars)
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(" ".join(str(statement).split()))
+        return SimpleNamespace(
+            scalar=lambda: self.scalars.pop(0),
+            scalars=lambda: SimpleNamespace(all=lambda: self.partitions),
+        )
+
+
+def test_plan_creates_upcoming_months_and_expires_past_the_retention():
+    existing = [date(2025, 9, 1), date(2025, 10, 1), date(2025, 11, 1), date(2026, 10, 1), date(2026, 11, 1)]
+
+    plan = plan_partitions(existing, date(2026, 10, 18), months_ahead=3, retention_months=12)
+
+    assert plan.create == [date(2026, 12, 1), date(2027, 1, 1)]
+    assert plan.expire == [date(2025, 9, 1)]
+    assert plan_partitions(existing, date(2026, 10, 18), months_ahead=0, retention_months=0).expire == []
+    assert partition_month("audit_logs_p2027_01") == date(2027, 1, 1)
+    assert partition_month("audit_logs_default") is None
+
+
+@pytest.mark.asyncio
+async def test_manage_partitions_moves_default_rows_before_attaching_and_detaches_expired_months():
+    conn = FakeConnection(partitions=["audit_logs_p2025_09", "audit_logs_p2026_10", "audit_logs_default"])
+
+    plan = await manage_partitions(conn, months_ahead=1, retention_months=12, drop=True, today=date(2026, 10, 18))
+
+    assert plan.create == [date(2026, 11, 1)] and plan.expire == [date(2025, 9, 1)]
+    create, move, attach, detach, drop = conn.statements[1:]
+    assert create.startswith("CREATE TABLE audit_logs_p2026_11 (LIKE audit_logs")
+    assert "DELETE FROM audit_logs_default" in move and "INSERT INTO audit_logs_p2026_11" in move
+    assert attach == (
+        "ALTER TABLE audit_logs ATTACH PARTITION audit_logs_p2026_11 "
+        "FOR VALUES FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')"
+    )
+    assert detach == "ALTER TABLE audit_logs DETACH PARTITION audit_logs_p2025_09"
+    assert drop == "DROP TABLE audit_logs_p2025_09"
+
+
+@pytest.mark.asyncio
+async def test_migration_copies_rows_into_monthly_partitions_from_the_oldest_log():
+    conn = FakeConnection(scalars=["r", datetime(2026, 8, 20, tzinfo=timezone.utc)])
+
+    await migration.upgrade(conn)
+
+    statements = conn.statements
+    partitions = [statement.split()[2] for statement in statements if "PARTITION OF audit_logs FOR VALUES" in statement]
+    current = datetime.now(timezone.utc)
+    assert partitions[0] == "audit_logs_p2026_08"
+    assert len(partitions) == (current.year - 2026) * 12 + current.month - 8 + 1 + migration.MONTHS_AHEAD
+    assert "PRIMARY KEY (id, created_at) ) PARTITION BY RANGE (created_at)" in statements[3]
+    assert statements.index("DROP TABLE audit_logs_unpartitioned") > statements.index(
+        next(statement for statement in statements if statement.startswith("INSERT INTO audit_logs"))
+    )
+
+
+@pytest.mark.asyncio
+async def test_migration_skips_an_already_partitioned_table():
+    conn = FakeConnection(scalars=["p"])
+
+    await migration.upgrade(conn)
+
+    assert len(conn.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_time_ranges_filter_on_the_partition_key():
+    session = SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: [])))
+    )
+    service = AuditLogService.__wrapped__()
+    service._AuditLogService__repository = SimpleNamespace(find_all=AsyncMock(return_value=[]))
+
+    await service.list_logs(limit=5, since="2026-09-01T00:00:00Z", until="2026-10-01T00:00:00Z")
+    await AuditLogRepository.__wrapped__().find_all(
+        limit=5, since=datetime(2026, 9, 1, tzinfo=timezone.utc), session=session
+    )
+
+    assert service._AuditLogService__repository.find_all.await_args.kwargs == {
+        "limit": 5,
+        "since": datetime(2026, 9, 1, tzinfo=timezone.utc),
+        "until": datetime(2026, 10, 1, tzinfo=timezone.utc),
+    }
+    sql = str(session.execute.await_args.args[0].compile(dialect=asyncpg.dialect()))
+    assert "WHERE audit_logs.created_at >= $1::TIMESTAMP WITH TIME ZONE ORDER BY audit_logs.created_at DESC" in sql
+    assert AuditLogORM.__table__.dialect_options["postgresql"]["partition_by"] == "RANGE (created_at)"
+    assert [column.name for column in AuditLogORM.__table__.primary_key] == ["id", "created_at"]
@@ -27,8 +27,10 @@ async def test_login_returns_user_and_tokens(monkeypatch):
     repository = SimpleNamespace(find_by_email=AsyncMock(return_value=make_user()))
     service = AuthService()
     service._AuthService__repository = repository
+    service._AuthService__password_hasher = SimpleNamespace(
+        verify=AsyncMock(side_effect=lambda plain, hashed: plain == "secret" and bool(hashed))
+    )
 
-    monkeypatch.setattr(auth_service_module, "verify_password", lambda plain, hashed: plain == "secret" and hashed)
     monkeypatch.setattr(auth_service_module, "create_token", lambda payload: f"access:{payload['id']}")
     monkeypatch.setattr(auth_service_module, "create_refresh_token", lambda payload: f"refresh:{payload['id']}")
 
@@ -42,12 +44,11 @@ async def test_login_returns_user_and_tokens(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_login_rejects_invalid_credentials(monkeypatch):
+async def test_login_rejects_invalid_credentials():
     repository = SimpleNamespace(find_by_email=AsyncMock(return_value=make_user()))
     service = AuthService()
     service._AuthService__repository = repository
-
-    monkeypatch.setattr(auth_service_module, "verify_password", lambda plain, hashed: False)
+    service._AuthService__password_hasher = SimpleNamespace(verify=AsyncMock(return_value=False))
 
     with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
         await service.login("ada@example.com", "wrong")
@@ -68,3 +69,34 @@ async def test_refresh_token_rejects_missing_user(monkeypatch):
 
     assert exc_info.value.message == "Usuario no encontrado"
     repository.find_by_id.assert_awaited_once_with(str(USER_ID))
+
+
+@pytest.mark.asyncio
+async def test_register_hashes_password_through_hasher(monkeypatch):
+    repository = SimpleNamespace(create=AsyncMock(return_value=make_user()))
+    service = AuthService()
+    service._AuthService__repository = repository
+    service._AuthService__password_hasher = SimpleNamespace(hash=AsyncMock(return_value="bcrypt-hash"))
+
+    monkeypatch.setattr(auth_service_module, "create_token", lambda payload: "access")
+    monkeypatch.setattr(auth_service_module, "create_refresh_token", lambda payload: "refresh")
+
+    await service.register({"email": "ada@example.com", "password": "Secret123!"})
+
+    repository.create.assert_awaited_once_with({"email": "ada@example.com", "password": "bcrypt-hash"})
+
+
+@pytest.mark.asyncio
+async def test_reset_password_stores_hashed_password(monkeypatch):
+    repository = SimpleNamespace(
+        find_by_email=AsyncMock(return_value=make_user()),
+        update=AsyncMock(return_value=make_user()),
+    )
+    service = AuthService()
+    service._AuthService__repository = repository
+    service._AuthService__password_hasher = SimpleNamespace(hash=AsyncMock(return_value="bcrypt-hash"))
+
+    monkeypatch.setattr(auth_service_module, "verify_token", lambda token: {"email": "ada@example.com"})
+
+    assert await service.reset_password("reset-token", "Secret123!") is True
+    repository.update.assert_awaited_once_with(str(USER_ID), {"password": "bcrypt-hash"})
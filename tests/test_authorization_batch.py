@@ -0,0 +1,162 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from server.repositories.crm_team_repository import pick_user_access
+from server.services.authorization_service import AuthorizationService
+from tests.factories import USER_ID, make_current_user
+from tests.test_authorization_cache import make_cache
+from tests.test_authorization_service import make_member
+
+PROJECT_A = UUID("91000000-0000-0000-0000-000000000001")
+PROJECT_B = UUID("91000000-0000-0000-0000-000000000002")
+PROJECT_C = UUID("91000000-0000-0000-0000-000000000003")
+ORG_A = UUID("10000000-0000-0000-0000-000000000001")
+ORG_B = UUID("10000000-0000-0000-0000-000000000002")
+TEAM_A = UUID("20000000-0000-0000-0000-000000000001")
+TEAM_B = UUID("20000000-0000-0000-0000-000000000002")
+OTHER_USER = "40000000-0000-0000-0000-000000000009"
+
+MEMBERS = {
+    PROJECT_A: make_member(["tasks.update", "tasks.assign"]),
+    PROJECT_B: make_member(["tasks.update"]),
+}
+MEMBERSHIPS = {
+    ORG_A: [
+        SimpleNamespace(scope="OWN", team_id=TEAM_A, user_id=USER_ID, role="member"),
+        SimpleNamespace(scope="TEAM", team_id=TEAM_B, user_id=USER_ID, role="lead"),
+    ],
+}
+
+
+def make_service():
+    service = AuthorizationService.__wrapped__()
+    service._AuthorizationService__decision_cache = make_cache()
+    service._AuthorizationService__audit_log_service = SimpleNamespace(record=AsyncMock())
+
+    async def find_by_project_and_user(project_id, user_id):
+        return MEMBERS.get(project_id)
+
+    async def find_user_access(organization_id, user_id, team_id=None):
+        members = MEMBERSHIPS.get(organization_id, [])
+        return pick_user_access([member for member in members if not team_id or member.team_id == team_id])
+
+    service._AuthorizationService__project_member_repository = SimpleNamespace(
+        find_by_project_and_user=AsyncMock(side_effect=find_by_project_and_user),
+        find_by_projects_and_user=AsyncMock(return_value=MEMBERS),
+    )
+    service._AuthorizationService__crm_team_repository = SimpleNamespace(
+        find_user_access=AsyncMock(side_effect=find_user_access),
+        find_user_memberships=AsyncMock(return_value=MEMBERSHIPS),
+    )
+    return service
+
+
+def task(project_id, assignee_id):
+    return {"projectId": project_id, "assigneeId": assignee_id}
+
+
+def lead(organization_id, team_id, owner_id):
+    return {"organizationId": organization_id, "teamId": team_id, "ownerId": owner_id}
+
+
+TASKS = [
+    task(PROJECT_A, OTHER_USER),
+    task(PROJECT_B, str(USER_ID)),
+    task(PROJECT_B, OTHER_USER),
+    task(PROJECT_C, str(USER_ID)),
+    task(PROJECT_B, str(USER_ID)),
+    task("not-a-uuid", str(USER_ID)),
+]
+LEADS = [
+    lead(ORG_A, TEAM_A, str(USER_ID)),
+    lead(ORG_A, TEAM_A, OTHER_USER),
+    lead(ORG_A, TEAM_B, OTHER_USER),
+    lead(ORG_A, None, str(USER_ID)),
+    lead(ORG_B, TEAM_A, str(USER_ID)),
+    lead(ORG_A, TEAM_B, OTHER_USER),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("module", "resources", "permissions"),
+    [("tasks", TASKS, ["tasks.update"]), ("leads", LEADS, ["leads.update"]), ("leads", LEADS, [])],
+)
+async def test_batch_decisions_match_the_per_item_path(module, resources, permissions):
+    user = make_current_user(id=str(USER_ID), permissions=permissions)
+    per_item = [await make_service().authorize(user, module, "update", resource=item) for item in resources]
+
+    service = make_service()
+    batch = await service.authorize_many(user, module, "update", resources)
+
+    assert batch == per_item
+
+
+@pytest.mark.asyncio
+async def test_batch_loads_each_membership_type_once_and_audits_each_scope_once():
+    service = make_service()
+    projects = service._AuthorizationService__project_member_repository
+    teams = service._AuthorizationService__crm_team_repository
+    user = make_current_user(id=str(USER_ID), permissions=["tasks.update", "leads.update"])
+
+    task_decisions = await service.authorize_many(user, "tasks", "update", TASKS)
+    lead_decisions = await service.authorize_many(user, "leads", "update", LEADS)
+
+    assert [result.allowed for result in task_decisions] == [True, True, False, False, True, False]
+    assert [result.reason for result in lead_decisions] == [
+        "allowed_by_own_scope",
+        "resource_outside_scope",
+        "allowed_by_team_scope",
+        "resource_outside_scope",
+        "missing_context_membership",
+        "allowed_by_team_scope",
+    ]
+    projects.find_by_projects_and_user.assert_awaited_once()
+    assert set(projects.find_by_projects_and_user.await_args.args[0]) == {
+        str(PROJECT_A),
+        str(PROJECT_B),
+        str(PROJECT_C),
+        "not-a-uuid",
+    }
+    teams.find_user_memberships.assert_awaited_once()
+    projects.find_by_project_and_user.assert_not_awaited()
+    teams.find_user_access.assert_not_awaited()
+    assert service._AuthorizationService__audit_log_service.record.await_count == 5 + 5
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_membership_queries_for_cached_or_admin_decisions():
+    service = make_service()
+    projects = service._AuthorizationService__project_member_repository
+    user = make_current_user(id=str(USER_ID), permissions=["tasks.update"])
+    admin = make_current_user(id=str(USER_ID), permissions=["tasks.update", "roles.read"])
+
+    await service.authorize_many(user, "tasks", "update", TASKS)
+    await service.authorize_many(user, "tasks", "update", TASKS)
+    decisions = await service.authorize_many(admin, "tasks", "update", TASKS)
+    unauthenticated = await service.authorize_many(None, "tasks", "update", TASKS[:2])
+
+    assert projects.find_by_projects_and_user.await_count == 1
+    assert {result.reason for result in decisions} == {"allowed_by_admin_scope"}
+    assert [result.reason for result in unauthenticated] == ["unauthenticated", "unauthenticated"]
+
+
+@pytest.mark.asyncio
+async def test_batch_audit_rows_list_every_resource_of_the_scope():
+    service = make_service()
+    user = make_current_user(id=str(USER_ID), permissions=["tasks.update"])
+    tasks = [{"id": str(index), **task(PROJECT_B, OTHER_USER)} for index in range(3)]
+
+    await service.authorize_many(user, "tasks", "update", tasks)
+
+    record = service._AuthorizationService__audit_log_service.record
+    record.assert_awaited_once()
+    assert record.await_args.kwargs["resource_id"] is None
+    assert record.await_args.kwargs["metadata"] == {
+        "reason": "task_ownership_required",
+        "count": 3,
+        "resourceIds": ["0", "1", "2"],
+    }
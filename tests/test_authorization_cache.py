@@ -0,0 +1,201 @@
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from server.db.unit_of_work import UnitOfWorkSessionFactory
+from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.authorization_cache_helper import AUTHORIZATION_INVALIDATION_CHANNEL, AuthorizationCacheHelper
+from server.repositories.project_member_repository import ProjectMemberRepository
+from server.services.authorization_service import AuthorizationService
+from tests.factories import PROJECT_ID, USER_ID, make_current_user, make_task
+from tests.test_authorization_service import make_member
+
+ORGANIZATION_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+MEMBER_ID = UUID("77777777-7777-7777-7777-777777777777")
+
+
+def make_cache(stored=None):
+    cache = AuthorizationCacheHelper.__wrapped__()
+    cache._redis = SimpleNamespace(
+        hash_get=AsyncMock(return_value=stored),
+        hash_set=AsyncMock(),
+        hash_delete=AsyncMock(),
+        delete_values=AsyncMock(),
+        publish_json=AsyncMock(),
+    )
+    return cache
+
+
+def make_service(member=None, access=None):
+    service = AuthorizationService.__wrapped__()
+    service._AuthorizationService__decision_cache = make_cache()
+    service._AuthorizationService__audit_log_service = SimpleNamespace(record=AsyncMock())
+    service._AuthorizationService__project_member_repository = SimpleNamespace(
+        find_by_project_and_user=AsyncMock(return_value=member)
+    )
+    service._AuthorizationService__crm_team_repository = SimpleNamespace(
+        find_user_access=AsyncMock(return_value=access)
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_project_decisions_are_evaluated_once_per_scope():
+    service = make_service(member=make_member(["tasks.read", "tasks.update"]))
+    repository = service._AuthorizationService__project_member_repository
+    user = make_current_user(id=str(USER_ID), permissions=["tasks.read", "tasks.update"])
+
+    for _ in range(3):
+        assert (await service.authorize(user, "tasks", "read", context={"project_id": PROJECT_ID})).allowed
+    own_task = await service.authorize(user, "tasks", "update", resource=make_task(assignee_id=str(USER_ID)))
+    other_task = await service.authorize(user, "tasks", "update", resource=make_task(assignee_id="another-user"))
+
+    assert (own_task.allowed, other_task.allowed) == (True, False)
+    assert other_task.status_code == HTTPErrorCode.FORBIDDEN
+    # Una consulta por alcance distinto: la lectura del proyecto y cada asignado
+    assert repository.find_by_project_and_user.await_count == 3
+    assert service._AuthorizationService__decision_cache.stats()["localHits"] == 2
+    assert service._AuthorizationService__audit_log_service.record.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_a_different_permission_set_does_not_reuse_decisions():
+    service = make_service(member=make_member(["projects.read"]))
+    repository = service._AuthorizationService__project_member_repository
+    context = {"project_id": PROJECT_ID}
+
+    for permissions in (["projects.read"], ["projects.read", "tasks.read"], ["projects.read"]):
+        user = make_current_user(id=str(USER_ID), permissions=permissions)
+        await service.authorize(user, "projects", "read", context=context)
+
+    assert repository.find_by_project_and_user.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_access_and_authorize_or_raise_consult_the_cache():
+    access = {"scope": "TEAM", "team_id": TEAM_ID, "user_id": str(USER_ID), "role": "member"}
+    service = make_service(access=access)
+    repository = service._AuthorizationService__crm_team_repository
+    user = make_current_user(id=str(USER_ID), permissions=["leads.read"])
+    lead = {"organizationId": ORGANIZATION_ID, "teamId": TEAM_ID, "ownerId": "someone-else"}
+
+    assert await service.resolve_access(user, ORGANIZATION_ID) == access
+    assert await service.resolve_access(user, ORGANIZATION_ID) == access
+    await service.authorize_or_raise(user, "leads", "read", resource=lead)
+    await service.authorize_or_raise(user, "leads", "read", resource=lead)
+
+    assert repository.find_user_access.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_decisions_are_shared_through_redis():
+    decision = {"allowed": False, "reason": "missing_project_membership", "statusCode": "FORBIDDEN"}
+    stored = json.dumps({"expiresAt": time.time() + 60, "value": decision})
+    service = make_service(member=make_member(["projects.read"]))
+    cache = service._AuthorizationService__decision_cache
+    cache._redis.hash_get.return_value = stored
+    user = make_current_user(id=str(USER_ID), permissions=["projects.read"])
+
+    result = await service.authorize(user, "projects", "read", context={"project_id": PROJECT_ID})
+
+    assert (result.allowed, result.reason, result.status_code) == (
+        False,
+        "missing_project_membership",
+        HTTPErrorCode.FORBIDDEN,
+    )
+    service._AuthorizationService__project_member_repository.find_by_project_and_user.assert_not_awaited()
+    assert cache._redis.hash_get.await_args.args[0] == f"authz:{USER_ID}"
+    assert cache.stats() == {"size": 1, "localHits": 0, "redisHits": 1, "misses": 0, "hitRatio": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_expired_redis_fields_are_ignored_and_deleted_even_if_the_hash_is_alive():
+    cache = make_cache(json.dumps({"expiresAt": time.time() - 1, "value": {"allowed": True}}))
+
+    assert await cache.get(USER_ID, "a") is None
+
+    cache._redis.hash_delete.assert_awaited_once_with(f"authz:{USER_ID}", "a")
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_clears_only_that_user_and_notifies_workers():
+    cache = make_cache()
+    await cache.set(USER_ID, "a", {"allowed": True})
+    await cache.set("another-user", "a", {"allowed": True})
+    key, field, stored = cache._redis.hash_set.await_args.args
+    assert (key, field, json.loads(stored)["value"]) == ("authz:another-user", "a", {"allowed": True})
+    assert cache._redis.hash_set.await_args.kwargs == {"ttl_seconds": 300}
+
+    await cache.invalidate([USER_ID, None])
+
+    assert await cache.get(USER_ID, "a") is None
+    assert await cache.get("another-user", "a") == {"allowed": True}
+    cache._redis.delete_values.assert_awaited_once_with(f"authz:{USER_ID}")
+    cache._redis.publish_json.assert_awaited_once_with(AUTHORIZATION_INVALIDATION_CHANNEL, {"userIds": [str(USER_ID)]})
+
+
+@pytest.mark.asyncio
+async def test_local_eviction_uses_the_per_user_index_and_keeps_it_in_sync_with_the_lru():
+    cache = make_cache()
+    cache.max_size = 3
+    for field in ("a", "b", "c"):
+        await cache.set(USER_ID, field, {"allowed": True})
+    await cache.set("another-user", "a", {"allowed": True})
+
+    assert cache._user_keys[str(USER_ID)] == {(str(USER_ID), "b"), (str(USER_ID), "c")}
+
+    cache.evict_local([str(USER_ID), "unknown-user"])
+
+    assert list(cache._entries) == [("another-user", "a")]
+    assert cache._user_keys == {"another-user": {("another-user", "a")}}
+
+
+@pytest.mark.asyncio
+async def test_project_membership_changes_invalidate_the_member(monkeypatch):
+    cache = SimpleNamespace(invalidate=AsyncMock())
+    monkeypatch.setattr("server.repositories.project_member_repository.AuthorizationCacheHelper", lambda: cache)
+    member = SimpleNamespace(id=MEMBER_ID, user_id=USER_ID, project_role_id=None)
+    session = SimpleNamespace(
+        execute=AsyncMock(
+            side_effect=[
+                SimpleNamespace(scalar_one_or_none=lambda: member),
+                SimpleNamespace(scalar_one_or_none=lambda: USER_ID),
+            ]
+        ),
+        commit=AsyncMock(),
+        refresh=AsyncMock(),
+        flush=AsyncMock(),
+    )
+    repository = ProjectMemberRepository.__wrapped__()
+
+    await repository.update_role(MEMBER_ID, UUID("88888888-8888-8888-8888-888888888888"), session=session)
+    assert await repository.delete(MEMBER_ID, session=session) is True
+
+    assert [call.args for call in cache.invalidate.await_args_list] == [([USER_ID],), ([USER_ID],)]
+
+
+@pytest.mark.asyncio
+async def test_membership_invalidation_waits_for_the_unit_of_work_commit(monkeypatch):
+    cache = SimpleNamespace(invalidate=AsyncMock())
+    monkeypatch.setattr("server.repositories.project_member_repository.AuthorizationCacheHelper", lambda: cache)
+    session = SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(scalar_one_or_none=lambda: USER_ID)),
+        flush=AsyncMock(),
+        commit=AsyncMock(),
+        close=AsyncMock(),
+    )
+    repository = ProjectMemberRepository.__wrapped__()
+
+    async with UnitOfWorkSessionFactory(lambda: session).unit_of_work() as uow:
+        uow._session = session
+        assert await repository.delete(MEMBER_ID, session=session) is True
+        cache.invalidate.assert_not_awaited()
+
+    session.commit.assert_awaited_once()
+    cache.invalidate.assert_awaited_once_with([USER_ID])
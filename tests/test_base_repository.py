@@ -5,6 +5,8 @@ from uuid import UUID
 import pytest
 
 from server.repositories.base_repository import BaseRepository, parse_uuid
+from server.repositories.company_repository import CompanyRepository
+from tests.factories import compiled
 
 ENTITY_ID = UUID("50000000-0000-0000-0000-000000000001")
 
@@ -32,17 +34,49 @@ def fake_session(result=None):
     )
 
 
+def returning_session(result=None):
+    return SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(scalars=lambda: SimpleNamespace(one_or_none=lambda: result)))
+    )
+
+
 @pytest.mark.asyncio
-async def test_base_repository_create_uses_shared_session_without_committing_it():
-    repository = EntityRepository()
-    session = fake_session()
+async def test_base_repository_create_is_a_single_insert_returning():
+    repository = CompanyRepository.__wrapped__()
+    company = SimpleNamespace(id=ENTITY_ID)
+    session = returning_session(company)
 
-    entity = await repository.create({"name": "shared"}, session=session)
+    result = await repository.create({"name": "Acme", "organization_id": ENTITY_ID}, session=session)
 
-    assert entity.name == "shared"
-    session.add.assert_called_once_with(entity)
-    session.flush.assert_awaited_once()
-    session.refresh.assert_awaited_once_with(entity)
+    assert result is company
+    session.execute.assert_awaited_once()
+    statement = compiled(session.execute.await_args.args[0])
+    assert statement.startswith("INSERT INTO crm_companies")
+    assert "RETURNING crm_companies.id" in statement
+
+
+@pytest.mark.asyncio
+async def test_base_repository_update_is_a_single_update_returning_without_none_values():
+    repository = CompanyRepository.__wrapped__()
+    session = returning_session(SimpleNamespace(id=ENTITY_ID))
+
+    await repository.update(str(ENTITY_ID), {"name": "Acme 2", "website": None, "unknown": 1}, session=session)
+
+    session.execute.assert_awaited_once()
+    statement = compiled(session.execute.await_args.args[0])
+    assert statement.startswith("UPDATE crm_companies SET name=$1::VARCHAR, updated_at=")
+    assert "website" not in statement.split("WHERE")[0]
+    assert "WHERE crm_companies.id = $3::UUID RETURNING" in statement
+
+
+@pytest.mark.asyncio
+async def test_base_repository_update_keeps_none_when_missing():
+    repository = CompanyRepository.__wrapped__()
+    session = returning_session(None)
+
+    assert await repository.update(str(ENTITY_ID), {"name": "Acme"}, session=session) is None
+    assert await repository.update("not-a-uuid", {"name": "Acme"}, session=session) is None
+    session.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -59,3 +93,38 @@ async def test_base_repository_find_by_id_rejects_invalid_uuid_without_querying(
 def test_parse_uuid_accepts_uuid_and_string():
     assert parse_uuid(ENTITY_ID) == ENTITY_ID
     assert parse_uuid(str(ENTITY_ID)) == ENTITY_ID
+
+
+@pytest.mark.asyncio
+async def test_base_repository_find_by_ids_uses_single_any_query_and_keeps_order():
+    repository = CompanyRepository.__wrapped__()
+    second_id = UUID("50000000-0000-0000-0000-000000000002")
+    rows = [SimpleNamespace(id=second_id), SimpleNamespace(id=ENTITY_ID)]
+    session = SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows)))
+    )
+
+    result = await repository.find_by_ids([str(ENTITY_ID), "not-a-uuid", second_id, ENTITY_ID], session=session)
+
+    assert result == [rows[1], None, rows[0], rows[1]]
+    session.execute.assert_awaited_once()
+    statement = compiled(session.execute.await_args.args[0])
+    assert "crm_companies.id = ANY ($1::UUID[])" in statement
+
+
+@pytest.mark.asyncio
+async def test_base_repository_find_by_ids_skips_query_without_valid_ids():
+    repository = EntityRepository()
+    session = fake_session()
+
+    assert await repository.find_by_ids(["bad", None], session=session) == [None, None]
+    session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_base_repository_loader_is_scoped_to_request_context():
+    repository = EntityRepository()
+    context = {}
+
+    assert repository.loader(context) is repository.loader(context)
+    assert repository.loader(context) is not repository.loader({})
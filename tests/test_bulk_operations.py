@@ -0,0 +1,219 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from server.api import crud_router
+from server.decorators import require_token_decorator
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.company_dto import CreateCompanyModel, UpdateCompanyModel
+from server.repositories.company_repository import CompanyRepository
+from server.schema.companies.resolver import CompanyResolver
+from server.services.authorization_service import AuthorizationResult, AuthorizationService
+from server.services.company_service import CompanyService
+from tests.factories import compiled, make_current_user
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+FIRST_ID = UUID("50000000-0000-0000-0000-000000000001")
+SECOND_ID = UUID("50000000-0000-0000-0000-000000000002")
+
+
+def scalar_session(*results):
+    session = SimpleNamespace(
+        execute=AsyncMock(
+            side_effect=[
+                SimpleNamespace(scalars=lambda rows=rows: SimpleNamespace(all=lambda: rows)) for rows in results
+            ]
+        )
+    )
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_many_is_one_insert_returning_in_input_order():
+    rows = [SimpleNamespace(id=FIRST_ID), SimpleNamespace(id=SECOND_ID)]
+    session = scalar_session(rows)
+
+    result = await CompanyRepository.__wrapped__().create_many(
+        [{"name": "A", "organization_id": ORG_ID}, {"name": "B", "organization_id": ORG_ID}], session=session
+    )
+
+    assert result == rows
+    session.execute.assert_awaited_once()
+    statement, params = session.execute.await_args.args
+    assert compiled(statement).startswith("INSERT INTO crm_companies")
+    assert [param["name"] for param in params] == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_update_many_groups_by_columns_and_keeps_input_order():
+    first = SimpleNamespace(id=FIRST_ID)
+    second = SimpleNamespace(id=SECOND_ID)
+    session = scalar_session([second, first])
+
+    result = await CompanyRepository.__wrapped__().update_many(
+        [(SECOND_ID, {"name": "B", "phone": None}), (str(FIRST_ID), {"name": "A"}), ("missing", {"name": "C"})],
+        session=session,
+    )
+
+    assert result == [second, first, None]
+    session.execute.assert_awaited_once()
+    statement = compiled(session.execute.await_args.args[0])
+    assert "UPDATE crm_companies SET name=bulk_values.name, updated_at=" in statement
+    assert "FROM (VALUES ($2::UUID, $3::VARCHAR), ($4::UUID, $5::VARCHAR)) AS bulk_values (id, name)" in statement
+    assert "RETURNING crm_companies.id" in statement
+
+
+@pytest.mark.asyncio
+async def test_delete_many_uses_any_and_returns_deleted_ids():
+    session = scalar_session([FIRST_ID])
+
+    deleted = await CompanyRepository.__wrapped__().delete_many([FIRST_ID, str(FIRST_ID), "bad"], session=session)
+
+    assert deleted == [FIRST_ID]
+    statement = compiled(session.execute.await_args.args[0])
+    assert "WHERE crm_companies.id = ANY ($1::UUID[]) RETURNING crm_companies.id" in statement
+
+
+@pytest.mark.asyncio
+async def test_service_bulk_operations_are_all_or_nothing(monkeypatch):
+    service = CompanyService.__wrapped__()
+    service.repository = SimpleNamespace(
+        update_many=AsyncMock(return_value=[None]), delete_many=AsyncMock(return_value=[FIRST_ID])
+    )
+    service.counter_repository = SimpleNamespace(snapshot=AsyncMock(return_value=[SimpleNamespace(id=FIRST_ID)]))
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        await service.update_many([UpdateCompanyModel(id=FIRST_ID, name="A")])
+    assert exc_info.value.status_code == 404
+
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        await service.delete_many([FIRST_ID, SECOND_ID])
+
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        await service.delete_many([])
+
+    monkeypatch.setattr("server.services.base_service.settings.BULK_MAX_ITEMS", 1)
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        service.check_bulk_size([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_authorize_scopes_evaluates_each_distinct_scope_once():
+    authorization = AuthorizationService.__wrapped__()
+    authorization._cached_evaluate = AsyncMock(return_value=AuthorizationResult(True, "allowed_by_team_scope"))
+    authorization._AuthorizationService__audit_log_service = SimpleNamespace(record=AsyncMock())
+    resources = [
+        {"id": "1", "organizationId": ORG_ID, "teamId": TEAM_ID, "ownerId": USER_ID},
+        {"id": "2", "organizationId": ORG_ID, "teamId": TEAM_ID, "ownerId": USER_ID},
+        {"id": "3", "organizationId": ORG_ID, "teamId": None, "ownerId": USER_ID},
+    ]
+
+    evaluated = await authorization.authorize_scopes_or_raise({"id": USER_ID}, "companies", "update", resources)
+    by_project = await authorization.authorize_scopes_or_raise(
+        {"id": USER_ID}, "tasks", "create", contexts=[{"project_id": "p1"}, {"project_id": "p1"}, {"project_id": "p2"}]
+    )
+
+    assert evaluated == 2
+    assert by_project == 2
+    assert authorization._cached_evaluate.await_count == 4
+    records = [call.kwargs for call in authorization._AuthorizationService__audit_log_service.record.await_args_list]
+    assert [(record["resource_id"], record["metadata"]) for record in records] == [
+        (None, {"reason": "allowed_by_team_scope", "count": 2, "resourceIds": ["1", "2"]}),
+        (None, {"reason": "allowed_by_team_scope", "count": 1, "resourceIds": ["3"]}),
+        (None, {"reason": "allowed_by_team_scope", "count": 1, "resourceIds": ["p1"]}),
+        (None, {"reason": "allowed_by_team_scope", "count": 1, "resourceIds": ["p2"]}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_authorize_scopes_raises_after_auditing_a_denied_scope():
+    authorization = AuthorizationService.__wrapped__()
+    authorization._cached_evaluate = AsyncMock(return_value=AuthorizationResult(False, "resource_outside_scope"))
+    authorization._AuthorizationService__audit_log_service = SimpleNamespace(record=AsyncMock())
+    resources = [{"id": str(index), "organizationId": ORG_ID, "ownerId": USER_ID} for index in range(1000)]
+
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        await authorization.authorize_scopes_or_raise({"id": USER_ID}, "companies", "delete", resources)
+
+    record = authorization._AuthorizationService__audit_log_service.record.await_args.kwargs
+    assert (record["resource_id"], record["status"], record["metadata"]["count"]) == (None, "denied", 1000)
+    assert record["metadata"]["resourceIds"] == [str(index) for index in range(1000)]
+
+
+@pytest.mark.asyncio
+async def test_company_resolver_bulk_create_resolves_access_once_per_organization(monkeypatch):
+    user = make_current_user(id=USER_ID, permissions=["companies.create"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    resolver = CompanyResolver()
+    resolver.service = SimpleNamespace(
+        check_bulk_size=MagicMock(), create_many=AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+    )
+    resolver.authorization = SimpleNamespace(
+        resolve_access=AsyncMock(return_value={"scope": "TEAM", "team_id": TEAM_ID}),
+        authorize_scopes_or_raise=AsyncMock(),
+    )
+    info = SimpleNamespace(
+        context={"request": SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={})}
+    )
+
+    result = await resolver.mutation._resolvers["createCompanies"](
+        None, info, [{"organizationId": ORG_ID, "name": "A"}, {"organizationId": ORG_ID, "name": "B"}]
+    )
+
+    assert len(result.data) == 2
+    resolver.authorization.resolve_access.assert_awaited_once()
+    resources = resolver.authorization.authorize_scopes_or_raise.await_args.args[3]
+    assert {resource["teamId"] for resource in resources} == {TEAM_ID}
+    assert {resource["ownerId"] for resource in resources} == {USER_ID}
+    payloads = resolver.service.create_many.await_args.args[0]
+    assert [payload.name for payload in payloads] == ["A", "B"]
+
+
+@pytest.mark.asyncio
+async def test_scoped_crud_router_bulk_route_checks_permissions_and_applies_all_operations(monkeypatch):
+    service = SimpleNamespace(
+        check_bulk_size=MagicMock(),
+        create_many=AsyncMock(return_value=[{"id": "new"}]),
+        get_many=AsyncMock(return_value=[{"id": str(FIRST_ID), "organizationId": ORG_ID}]),
+        update_many=AsyncMock(return_value=[{"id": str(FIRST_ID)}]),
+        delete_many=AsyncMock(return_value=[str(FIRST_ID)]),
+        raise_not_found=MagicMock(),
+    )
+    authorization = SimpleNamespace(
+        resolve_access=AsyncMock(return_value={"scope": "ORGANIZATION", "team_id": None}),
+        authorize_scopes_or_raise=AsyncMock(),
+    )
+    monkeypatch.setattr(crud_router, "AuthorizationService", lambda: authorization)
+    router = crud_router.build_scoped_crud_router("companies", service, CreateCompanyModel, UpdateCompanyModel)
+    route = next(route for route in router.routes if route.path == "/companies/bulk")
+    body_model = route.body_field.type_
+    payload = body_model(
+        create=[{"organizationId": ORG_ID, "name": "A"}],
+        update=[{"id": str(FIRST_ID), "name": "B"}],
+        delete=[str(FIRST_ID)],
+    )
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        await route.endpoint(payload, user=make_current_user(id=USER_ID, permissions=["companies.create"]))
+    assert exc_info.value.status_code == 403
+
+    user = make_current_user(id=USER_ID, permissions=["companies.create", "companies.update", "companies.delete"])
+    response = await route.endpoint(payload, user=user)
+
+    assert response["data"] == {
+        "created": [{"id": "new"}],
+        "updated": [{"id": str(FIRST_ID)}],
+        "deleted": [str(FIRST_ID)],
+    }
+    assert [call.args[2] for call in authorization.authorize_scopes_or_raise.await_args_list] == [
+        "create",
+        "update",
+        "delete",
+    ]
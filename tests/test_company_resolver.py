@@ -2,6 +2,7 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
+from graphql import parse
 
 from server.decorators import require_token_decorator
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
@@ -71,3 +72,35 @@ async def test_company_resolver_rejects_missing_token():
         )
 
     assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_company_resolver_list_returns_connection(monkeypatch):
+    user = make_current_user(id=USER_ID, permissions=["companies.read"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    connection = {
+        "nodes": [{"id": "company-1"}],
+        "edges": [{"cursor": "c1", "node": {"id": "company-1"}}],
+        "pageInfo": {"hasNextPage": True, "hasPreviousPage": False, "startCursor": "c1", "endCursor": "c1"},
+    }
+    access = {"scope": "ORGANIZATION", "team_id": None}
+    resolver = CompanyResolver()
+    resolver.service = SimpleNamespace(get_page=AsyncMock(return_value=connection))
+    resolver.authorization = SimpleNamespace(resolve_access=AsyncMock(return_value=access))
+
+    list_info = info(["companies.read"])
+    document = parse("{ companies(organizationId: 1) { data { id name } edges { node { createdAt } } } }")
+    list_info.field_nodes = document.definitions[0].selection_set.selections
+    list_info.fragments = {}
+
+    result = await resolver.query._resolvers["companies"](None, list_info, ORG_ID, first=1)
+
+    assert result.data == [{"id": "company-1"}]
+    assert result.edges == connection["edges"]
+    assert result.pageInfo["endCursor"] == "c1"
+    resolver.service.get_page.assert_awaited_once_with(
+        ORG_ID, access, first=1, after=None, fields=frozenset({"id", "name", "createdAt"}), list_query=None
+    )
@@ -0,0 +1,144 @@
+from contextlib import asynccontextmanager
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from server.models.dto.company_dto import CreateCompanyModel, UpdateCompanyModel
+from server.repositories.crm_counter_repository import NO_SCOPE, CRMCounterRepository
+from server.services import crm_resource_service
+from server.services.company_service import CompanyService
+from server.services.opportunity_service import OpportunityService
+from tests.factories import compiled
+
+ORG_ID = UUID("10000000-0000-0000-0000-000000000001")
+TEAM_ID = UUID("20000000-0000-0000-0000-000000000001")
+USER_ID = UUID("40000000-0000-0000-0000-000000000001")
+RESOURCE_ID = UUID("50000000-0000-0000-0000-000000000001")
+
+
+def opportunity(stage, value, owner_id=USER_ID):
+    return SimpleNamespace(
+        id=RESOURCE_ID, organization_id=ORG_ID, team_id=None, owner_id=owner_id, stage=stage, value=Decimal(value)
+    )
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = SimpleNamespace(commit=AsyncMock())
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    monkeypatch.setattr(crm_resource_service, "AsyncSessionLocal", session_factory)
+    return session
+
+
+def counter_repository(snapshot=(), cascaded=None):
+    repository = CRMCounterRepository()
+    repository.snapshot = AsyncMock(return_value=list(snapshot))
+    repository.cascaded_activity_deltas = AsyncMock(return_value=cascaded or {})
+    repository.apply = AsyncMock()
+    return repository
+
+
+def test_deltas_move_an_opportunity_between_stage_counters():
+    deltas = CRMCounterRepository().deltas(
+        "opportunities", removed=[opportunity("proposal", "100")], added=[opportunity("won", "120")]
+    )
+
+    assert deltas == {
+        (ORG_ID, NO_SCOPE, USER_ID, "opportunities", "proposal"): (-1, Decimal("-100")),
+        (ORG_ID, NO_SCOPE, USER_ID, "opportunities", "won"): (1, Decimal("120")),
+    }
+
+
+@pytest.mark.asyncio
+async def test_apply_is_one_upsert_and_skips_unchanged_counters():
+    repository = CRMCounterRepository()
+    session = SimpleNamespace(execute=AsyncMock())
+    unchanged = repository.deltas("companies", removed=[opportunity("won", "0")], added=[opportunity("won", "0")])
+
+    await repository.apply(unchanged, session)
+    session.execute.assert_not_awaited()
+
+    await repository.apply(repository.deltas("companies", added=[opportunity("won", "0")]), session)
+    statement = compiled(session.execute.await_args.args[0])
+    assert statement.startswith("INSERT INTO crm_counters")
+    assert "ON CONFLICT (organization_id, team_id, owner_id, entity, stage) DO UPDATE" in statement
+    assert "total = (crm_counters.total + excluded.total)" in statement
+
+
+def test_rebuild_statement_recounts_every_entity_in_one_insert_select():
+    statement = compiled(CRMCounterRepository().rebuild_statement(ORG_ID))
+
+    assert statement.startswith("INSERT INTO crm_counters")
+    assert statement.count("UNION ALL") == 4
+    assert statement.count(".organization_id = ") == 5
+    assert "GROUP BY crm_opportunities.organization_id" in statement
+
+
+@pytest.mark.asyncio
+async def test_create_counts_the_resource_in_the_same_session(session):
+    service = CompanyService.__wrapped__()
+    created = SimpleNamespace(
+        id=RESOURCE_ID, organization_id=ORG_ID, team_id=TEAM_ID, owner_id=None, name="Acme", created_at=None
+    )
+    service.repository = SimpleNamespace(create=AsyncMock(return_value=created))
+    service.counter_repository = counter_repository()
+    service.serialize = lambda resource: {"id": str(resource.id)}
+
+    await service.create(CreateCompanyModel(organization_id=ORG_ID, name="Acme"))
+
+    service.counter_repository.apply.assert_awaited_once_with(
+        {(ORG_ID, TEAM_ID, NO_SCOPE, "companies", ""): (1, Decimal(0))}, session
+    )
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_without_counted_fields_does_not_read_the_previous_row(session):
+    service = CompanyService.__wrapped__()
+    service.repository = SimpleNamespace(update=AsyncMock(return_value=SimpleNamespace(id=RESOURCE_ID)))
+    service.counter_repository = counter_repository()
+    service.serialize = lambda resource: {"id": str(resource.id)}
+
+    await service.update(UpdateCompanyModel(id=RESOURCE_ID, name="Renamed"))
+
+    service.counter_repository.snapshot.assert_awaited_once_with("companies", [], session)
+    service.counter_repository.apply.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_close_moves_the_opportunity_to_its_closed_stage(session):
+    service = OpportunityService.__wrapped__()
+    service.repository = SimpleNamespace(update=AsyncMock(return_value=opportunity("won", "100")))
+    service.counter_repository = counter_repository(snapshot=[opportunity("proposal", "100")])
+    service.serialize = lambda resource: {"stage": resource.stage}
+
+    assert await service.close(RESOURCE_ID, "won") == {"stage": "won"}
+
+    service.counter_repository.snapshot.assert_awaited_once_with("opportunities", [RESOURCE_ID], session)
+    deltas = service.counter_repository.apply.await_args.args[0]
+    assert deltas[(ORG_ID, NO_SCOPE, USER_ID, "opportunities", "proposal")] == (-1, Decimal("-100"))
+    assert deltas[(ORG_ID, NO_SCOPE, USER_ID, "opportunities", "won")] == (1, Decimal("100"))
+
+
+@pytest.mark.asyncio
+async def test_delete_discounts_the_resource_and_its_cascaded_activities(session):
+    service = CompanyService.__wrapped__()
+    service.repository = SimpleNamespace(delete_many=AsyncMock(return_value=[RESOURCE_ID]))
+    activities_key = (ORG_ID, TEAM_ID, USER_ID, "activities", "")
+    service.counter_repository = counter_repository(
+        snapshot=[opportunity("", "0")], cascaded={activities_key: (-3, Decimal(0))}
+    )
+
+    assert await service.delete(RESOURCE_ID) is True
+
+    service.counter_repository.apply.assert_awaited_once_with(
+        {activities_key: (-3, Decimal(0)), (ORG_ID, NO_SCOPE, USER_ID, "companies", ""): (-1, Decimal(0))}, session
+    )
+    session.commit.assert_awaited_once()
@@ -0,0 +1,65 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.repositories.crm_dashboard_repository import CRMDashboardRepository
+from tests.factories import compiled
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_summary_sums_counter_rows_with_the_same_shape():
+    rows = [
+        SimpleNamespace(entity="companies", total=3, pipeline=None),
+        SimpleNamespace(entity="opportunities", total=4, pipeline=Decimal("1500.00")),
+    ]
+    session = SimpleNamespace(execute=AsyncMock(return_value=SimpleNamespace(all=lambda: rows)))
+
+    result = await CRMDashboardRepository().summarize(ORG_ID, {"scope": "ORGANIZATION"}, session=session)
+
+    session.execute.assert_awaited_once()
+    assert compiled(session.execute.await_args.args[0]).startswith("SELECT crm_counters.entity")
+    assert result == {
+        "companies": 3,
+        "contacts": 0,
+        "leads": 0,
+        "opportunities": 4,
+        "activities": 0,
+        "pipelineValue": "1500.00",
+    }
+
+
+@pytest.mark.parametrize(
+    ("access", "predicate"),
+    [
+        ({"scope": "OWN", "user_id": USER_ID}, "crm_counters.owner_id = "),
+        ({"scope": "TEAM", "team_id": TEAM_ID}, "crm_counters.team_id = "),
+    ],
+)
+def test_dashboard_counters_statement_applies_scope(access, predicate):
+    statement = compiled(CRMDashboardRepository().counters_statement(ORG_ID, access))
+
+    assert predicate in statement
+    assert "GROUP BY crm_counters.entity" in statement
+
+
+@pytest.mark.parametrize(
+    ("access", "predicate", "occurrences"),
+    [
+        ({"scope": "OWN", "user_id": USER_ID}, ".owner_id = ", 5),
+        ({"scope": "TEAM", "team_id": TEAM_ID}, ".team_id = ", 5),
+        ({"scope": "ORGANIZATION"}, ".team_id = ", 0),
+    ],
+)
+def test_dashboard_summary_applies_scope_inside_every_subquery(access, predicate, occurrences):
+    statement = compiled(CRMDashboardRepository().summary_statement(ORG_ID, access))
+
+    assert statement.startswith("WITH opportunity_totals AS")
+    assert statement.count(".organization_id = ") == 5
+    assert statement.count(predicate) == occurrences
+    assert "FILTER (WHERE (crm_opportunities.stage NOT IN" in statement
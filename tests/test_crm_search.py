@@ -0,0 +1,110 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from server.decorators import require_token_decorator
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.repositories.crm_search_repository import CRMSearchRepository
+from server.schema.crm_search.resolver import CRMSearchResolver
+from server.services.crm_search_service import CRMSearchService
+from tests.factories import compiled, make_current_user
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+RESULT_ID = UUID("50000000-0000-0000-0000-000000000001")
+
+
+def test_search_statement_unions_each_type_inside_the_caller_scope():
+    statement = compiled(
+        CRMSearchRepository().search_statement(
+            ORG_ID, {"scope": "TEAM", "team_id": TEAM_ID}, "acme", ["companies", "contacts", "leads"]
+        )
+    )
+
+    assert statement.count("UNION ALL") == 2
+    assert statement.count(".team_id = ") == 3
+    assert "crm_contacts.search_vector @@ websearch_to_tsquery('simple'" in statement
+    assert "crm_leads.search_text % " in statement
+    assert "ORDER BY results.rank DESC, results.id DESC \n LIMIT $" in statement
+
+
+def test_short_queries_only_use_the_text_search_vector():
+    statement = compiled(CRMSearchRepository().search_statement(ORG_ID, {"scope": "ORGANIZATION"}, "ac", ["leads"]))
+
+    assert "search_vector @@" in statement
+    assert "similarity(" not in statement
+    assert " LIKE " not in statement
+
+
+@pytest.mark.asyncio
+async def test_search_pages_by_rank_and_id_and_escapes_like_wildcards():
+    repository = CRMSearchRepository()
+    rows = [
+        {"type": "companies", "id": RESULT_ID, "title": "Acme 100%", "subtitle": None, "rank": 0.25},
+        {"type": "leads", "id": UUID(int=1), "title": "Acme", "subtitle": "web", "rank": 0.1},
+    ]
+    session = SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(mappings=lambda: SimpleNamespace(all=lambda: rows)))
+    )
+
+    page = await repository.search(ORG_ID, {"scope": "ORGANIZATION"}, "100%", ["companies"], first=1, session=session)
+
+    assert [item["id"] for item in page.items] == [RESULT_ID]
+    assert page.has_next_page is True
+    statement = session.execute.await_args.args[0].compile(dialect=asyncpg.dialect())
+    assert "%100\\%%" in statement.params.values()
+
+    following = compiled(
+        repository.search_statement(ORG_ID, {"scope": "ORGANIZATION"}, "acme", ["companies"], after=page.cursors[0])
+    )
+    assert "WHERE (results.rank, results.id) < (" in following
+
+
+def test_search_rejects_malformed_cursor():
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        CRMSearchRepository().search_statement(ORG_ID, {"scope": "ORGANIZATION"}, "acme", ["leads"], after="bad")
+
+
+def test_searchable_types_follow_read_permissions():
+    service = CRMSearchService.__wrapped__()
+    user = make_current_user(id=USER_ID, permissions=["companies.read", "leads.read"])
+
+    assert service.searchable_types(user) == ["companies", "leads"]
+    assert service.searchable_types(user, ["LEADS"]) == ["leads"]
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        service.searchable_types(user, ["contacts"])
+    assert exc_info.value.status_code == 403
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        service.searchable_types(user, ["opportunities"])
+
+
+@pytest.mark.asyncio
+async def test_search_crm_resolver_resolves_access_and_returns_connection(monkeypatch):
+    user = make_current_user(id=USER_ID, permissions=["contacts.read"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    resolver = CRMSearchResolver()
+    access = {"scope": "OWN", "user_id": USER_ID}
+    resolver.authorization = SimpleNamespace(resolve_access=AsyncMock(return_value=access))
+    connection = {"nodes": [{"id": "1"}], "edges": [{"cursor": "c", "node": {"id": "1"}}], "pageInfo": {}}
+    resolver.service = CRMSearchService.__wrapped__()
+    resolver.service.repository = SimpleNamespace(
+        models=CRMSearchRepository.models,
+        search=AsyncMock(return_value=SimpleNamespace(to_connection=lambda serialize: connection)),
+    )
+    info = SimpleNamespace(
+        context={"request": SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={})}
+    )
+
+    result = await resolver.query._resolvers["searchCrm"](None, info, organizationId=ORG_ID, query=" ana ")
+
+    assert result.data == [{"id": "1"}]
+    resolver.service.repository.search.assert_awaited_once_with(
+        ORG_ID, access, "ana", ["contacts"], first=None, after=None
+    )
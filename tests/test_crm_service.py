@@ -31,16 +31,18 @@ def resource(**values):
 
 
 @pytest.mark.asyncio
-async def test_create_company_delegates_and_serializes():
+async def test_create_company_delegates_and_serializes(monkeypatch):
     service = CompanyService()
-    repository = SimpleNamespace(create=AsyncMock(return_value=resource()))
+    repository = SimpleNamespace(create=AsyncMock(return_value=resource(team_id=None, owner_id=None)))
     service.repository = repository
+    monkeypatch.setattr(service.counter_repository, "apply", AsyncMock())
     payload = CreateCompanyModel(organizationId=ORG_ID, name="Acme")
 
     result = await service.create(payload)
 
     assert result["name"] == "Acme"
     repository.create.assert_awaited_once()
+    service.counter_repository.apply.assert_awaited_once()
 
 
 @pytest.mark.asyncio
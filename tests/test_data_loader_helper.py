@@ -0,0 +1,74 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.helpers.data_loader_helper import DataLoader, get_data_loader
+
+
+def make_loader(**kwargs):
+    batch = AsyncMock(side_effect=lambda keys: [f"value:{key}" for key in keys])
+    return DataLoader(batch, **kwargs), batch
+
+
+@pytest.mark.asyncio
+async def test_loads_in_same_tick_are_batched_and_deduplicated():
+    loader, batch = make_loader()
+
+    results = await asyncio.gather(loader.load("a"), loader.load("b"), loader.load("a"))
+
+    assert results == ["value:a", "value:b", "value:a"]
+    batch.assert_awaited_once_with(["a", "b"])
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_for_the_loader_lifetime():
+    loader, batch = make_loader()
+
+    assert await loader.load("a") == "value:a"
+    assert await loader.load_many(["a", "b"]) == ["value:a", "value:b"]
+
+    assert batch.await_count == 2
+    assert batch.await_args_list[1].args == (["b"],)
+
+
+@pytest.mark.asyncio
+async def test_prime_and_clear_control_cached_values():
+    loader, batch = make_loader()
+    loader.prime("a", "primed")
+
+    assert await loader.load("a") == "primed"
+    loader.clear("a")
+    assert await loader.load("a") == "value:a"
+    batch.assert_awaited_once_with(["a"])
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches():
+    loader, batch = make_loader(max_batch_size=2)
+
+    await loader.load_many(["a", "b", "c"])
+
+    assert [call.args[0] for call in batch.await_args_list] == [["a", "b"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reject_all_keys_and_are_not_cached():
+    batch = AsyncMock(side_effect=[RuntimeError("db down"), ["ok"]])
+    loader = DataLoader(batch)
+
+    with pytest.raises(RuntimeError):
+        await loader.load("a")
+
+    assert await loader.load("a") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_get_data_loader_reuses_loader_per_scope_and_name():
+    scope = {}
+    batch = AsyncMock(return_value=[])
+
+    loader = get_data_loader(scope, "companies", batch)
+
+    assert get_data_loader(scope, "companies", batch) is loader
+    assert get_data_loader(scope, "contacts", batch) is not loader
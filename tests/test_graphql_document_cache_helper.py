@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from ariadne import QueryType, graphql, make_executable_schema
+from graphql import GraphQLError
+
+from server.decorators import require_token_decorator
+from server.helpers.graphql_document_cache_helper import GraphQLDocumentCacheHelper
+from server.schema import schema as app_schema
+from tests.factories import make_current_user
+
+type_defs = """
+type Query {
+  hello(name: String): String!
+}
+"""
+query = QueryType()
+
+
+@query.field("hello")
+def resolve_hello(*_, name="world"):
+    return f"Hello {name}"
+
+
+schema = make_executable_schema(type_defs, query)
+
+
+def make_cache(max_size=8):
+    return GraphQLDocumentCacheHelper.__wrapped__(max_size=max_size)
+
+
+def test_document_cache_reuses_parsed_document_and_counts_hits():
+    cache = make_cache()
+
+    first = cache.get(schema, "{ hello }")
+    second = cache.get(schema, "{ hello }")
+
+    assert second is first
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_document_cache_keeps_validation_errors_with_the_document():
+    cache = make_cache()
+
+    entry = cache.get(schema, "{ missingField }")
+    cache.get(schema, "{ missingField }")
+
+    assert len(entry.errors) == 1
+    assert "missingField" in entry.errors[0].message
+    assert cache.stats()["hits"] == 1
+
+
+def test_document_cache_evicts_least_recently_used_entry():
+    cache = make_cache(max_size=2)
+
+    cache.get(schema, "{ a: hello }")
+    cache.get(schema, "{ b: hello }")
+    cache.get(schema, "{ a: hello }")
+    cache.get(schema, "{ c: hello }")
+    cache.get(schema, "{ b: hello }")
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 4
+
+
+def test_document_cache_key_depends_on_schema_version():
+    cache = make_cache()
+    other_schema = make_executable_schema("type Query { hello: String! }", query)
+
+    assert cache.cache_key(schema, "{ hello }") != cache.cache_key(other_schema, "{ hello }")
+
+
+def test_document_cache_does_not_store_syntax_errors():
+    cache = make_cache()
+
+    with pytest.raises(GraphQLError):
+        cache.get(schema, "{ hello ")
+
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_document_cache_plugs_into_ariadne_parser_and_validator():
+    cache = make_cache()
+    data = {"query": 'query Greet { hello(name: "Ada") }'}
+
+    for _ in range(3):
+        success, result = await graphql(
+            schema,
+            data,
+            query_parser=cache.query_parser(schema),
+            query_validator=cache.query_validator,
+        )
+        assert success is True
+        assert result == {"data": {"hello": "Hello Ada"}}
+
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_document_cache_returns_cached_validation_errors_through_ariadne():
+    cache = make_cache()
+
+    success, result = await graphql(
+        schema,
+        {"query": "{ missingField }"},
+        query_parser=cache.query_parser(schema),
+        query_validator=cache.query_validator,
+    )
+
+    assert success is False
+    assert "missingField" in result["errors"][0]["message"]
+
+
+def test_document_cache_reports_operation_type():
+    cache = make_cache()
+    document = "query A { hello } mutation B { hello }"
+
+    assert cache.operation_type(schema, "{ hello }", None).value == "query"
+    assert cache.operation_type(schema, document, "B").value == "mutation"
+    assert cache.operation_type(schema, document, None) is None
+    assert cache.operation_type(schema, "{ hello", None) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_query_exposes_the_document_cache_counters(monkeypatch):
+    user = make_current_user(permissions=["activity.read", "roles.read"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    for name, value in {"hits": 3, "misses": 1, "evictions": 2}.items():
+        monkeypatch.setattr(GraphQLDocumentCacheHelper(), name, value)
+    request = SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={})
+
+    success, result = await graphql(
+        app_schema,
+        {"query": "{ cacheStats { data { graphqlDocuments { hits misses evictions hitRatio } } } }"},
+        context_value={"request": request},
+    )
+
+    assert success, result
+    assert result["data"]["cacheStats"]["data"]["graphqlDocuments"] == {
+        "hits": 3,
+        "misses": 1,
+        "evictions": 2,
+        "hitRatio": 0.75,
+    }
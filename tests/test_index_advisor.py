@@ -0,0 +1,76 @@
+import json
+
+from server.repositories.index_advisor import Explain, PlanFinding, hot_statements, plan_report
+from tests.factories import compiled
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+PROJECT_ID = "60000000-0000-0000-0000-000000000001"
+
+
+def test_plan_report_flags_large_sequential_scans_and_sorts():
+    explain_output = [
+        {
+            "Plan": {
+                "Node Type": "Limit",
+                "Shared Hit Blocks": 12,
+                "Shared Read Blocks": 3,
+                "Plans": [
+                    {
+                        "Node Type": "Sort",
+                        "Sort Key": ["crm_companies.created_at DESC", "crm_companies.id DESC"],
+                        "Sort Method": "top-N heapsort",
+                        "Sort Space Used": 30,
+                        "Plans": [
+                            {
+                                "Node Type": "Seq Scan",
+                                "Relation Name": "crm_companies",
+                                "Actual Rows": 900,
+                                "Rows Removed by Filter": 9100,
+                                "Filter": "(organization_id = '...'::uuid)",
+                            }
+                        ],
+                    },
+                    {"Node Type": "Seq Scan", "Relation Name": "crm_teams", "Actual Rows": 4},
+                ],
+            },
+            "Execution Time": 4.5,
+        }
+    ]
+
+    report = plan_report("companies.page[ORGANIZATION]", json.dumps(explain_output))
+
+    assert report.execution_ms == 4.5
+    assert (report.shared_hit_blocks, report.shared_read_blocks) == (12, 3)
+    assert report.findings == [
+        PlanFinding("Sort", None, "clave crm_companies.created_at DESC, crm_companies.id DESC, top-N heapsort (30 kB)"),
+        PlanFinding("Seq Scan", "crm_companies", "10000 filas leídas, filtro (organization_id = '...'::uuid)"),
+    ]
+
+
+def test_hot_statements_are_the_repository_page_queries():
+    statements = hot_statements(
+        {"organization_id": ORG_ID, "team_id": TEAM_ID, "owner_id": USER_ID, "project_id": PROJECT_ID}
+    )
+
+    expected = {"companies.page[OWN]", "activities.page[TEAM]", "crm_dashboard[ORGANIZATION]", "tasks.page[project]"}
+    assert expected <= set(statements)
+    team_page = compiled(statements["opportunities.page[TEAM]"])
+    assert "crm_opportunities.team_id = " in team_page
+    assert team_page.endswith(
+        "ORDER BY crm_opportunities.created_at DESC, crm_opportunities.id DESC \n LIMIT $3::INTEGER"
+    )
+
+
+def test_hot_statements_without_crm_data_still_cover_global_lists():
+    assert set(hot_statements({})) == {"tasks.page", "projects.page", "users.page"}
+
+
+def test_explain_wraps_the_statement_with_its_parameters():
+    statement = hot_statements({"project_id": PROJECT_ID})["tasks.page[project]"]
+
+    sql = compiled(Explain(statement))
+
+    assert sql.startswith("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT")
+    assert "tasks.project_id = $1::UUID" in sql
@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.api import dependencies
+from server.api.v1 import tasks
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.list_query_dto import ListQueryModel
+from server.repositories.company_repository import CompanyRepository
+from server.repositories.lead_repository import LeadRepository
+from server.repositories.opportunity_repository import OpportunityRepository
+from server.repositories.task_repository import TaskRepository
+from server.utils.pagination_utils import encode_cursor
+from tests.factories import compiled
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+PROJECT_ID = "60000000-0000-0000-0000-000000000001"
+
+
+def test_equality_filters_use_an_index_with_the_column_before_the_keyset():
+    repository = CompanyRepository()
+    query = ListQueryModel.from_input({"status": {"in": ["active", "lead"]}}, None)
+
+    result = repository.compile_list_query(query, ("organization_id",), ("owner_id",))
+    statement = compiled(repository.page_statement(repository._scoped_statement(ORG_ID, {"scope": "ORGANIZATION"})))
+
+    assert result.index == ("organization_id", "status", "created_at", "id")
+    assert result.keyset_columns == ("created_at", "id") and result.descending
+    assert "crm_companies.status IN" in compiled(repository.model.__table__.select().where(*result.predicates))
+    assert "ORDER BY crm_companies.created_at DESC, crm_companies.id DESC" in statement
+
+
+def test_range_filter_defaults_the_sort_to_its_column_and_pages_by_it():
+    repository = OpportunityRepository()
+    query = ListQueryModel.from_input({"value": {"gte": "1000.50"}}, None)
+    compiled_query = repository.compile_list_query(query, ("organization_id",))
+    after = encode_cursor(("1500.00", "50000000-0000-0000-0000-000000000001"), "value,id:desc")
+
+    stmt = repository._scoped_statement(ORG_ID, {"scope": "OWN", "user_id": USER_ID}).where(*compiled_query.predicates)
+    statement = compiled(repository.page_statement(stmt, 5, after, None, compiled_query))
+
+    assert compiled_query.keyset_columns == ("value", "id")
+    assert "crm_opportunities.value >= $" in statement
+    assert "(crm_opportunities.value, crm_opportunities.id) < ($" in statement
+    assert "ORDER BY crm_opportunities.value DESC, crm_opportunities.id DESC" in statement
+
+
+def test_scope_columns_may_stay_as_residual_filters():
+    query = ListQueryModel.from_input(None, {"field": "score", "direction": "asc"})
+
+    result = LeadRepository().compile_list_query(query, ("organization_id",), ("team_id",))
+
+    assert result.index == ("organization_id", "score", "id")
+    assert result.keyset_columns == ("score", "id") and not result.descending
+
+
+@pytest.mark.parametrize(
+    ("filters", "sort", "message"),
+    [
+        ({"name": {"eq": "Acme"}}, None, "No se puede filtrar por name"),
+        (None, {"field": "industry"}, "No se puede ordenar por industry"),
+        ({"createdAt": {"gte": "2026-01-01T00:00:00"}}, {"field": "name"}, "requiere ordenar por ese campo"),
+        ({"status": {"eq": "active"}}, {"field": "name"}, "Ningún índice soporta"),
+        ({"ownerId": {"isNull": False}}, None, "El rango sobre ownerId"),
+        ({"ownerId": {"eq": "not-a-uuid"}}, None, "Valor inválido"),
+    ],
+)
+def test_compiler_refuses_unknown_fields_unindexed_combinations_and_bad_values(filters, sort, message):
+    query = ListQueryModel.from_input(filters, sort)
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        CompanyRepository().compile_list_query(query, ("organization_id",))
+
+    assert message in exc_info.value.message
+
+
+def test_task_filters_require_a_project_to_use_their_index():
+    repository = TaskRepository()
+    query = ListQueryModel.from_input({"status": {"eq": "todo"}}, None)
+
+    result = repository._compile(PROJECT_ID, query)
+    statement = compiled(repository.apply_list_query(repository._list_statement(PROJECT_ID), result))
+
+    assert result.index == ("project_id", "status", "created_at", "id")
+    assert "tasks.status = $" in statement
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        repository._compile(None, query)
+
+
+@pytest.mark.asyncio
+async def test_find_page_applies_filters_and_the_compiled_keyset():
+    repository = CompanyRepository.__wrapped__()
+    repository.paginate = AsyncMock(return_value="page")
+    query = ListQueryModel.from_input({"teamId": {"eq": TEAM_ID}}, {"field": "createdAt", "direction": "ASC"})
+
+    page = await repository.find_page(ORG_ID, {"scope": "ORGANIZATION"}, first=2, list_query=query)
+
+    stmt, first, after, session, columns, keyset = repository.paginate.await_args.args
+    assert page == "page"
+    assert "crm_companies.team_id = $" in compiled(stmt)
+    assert (first, after, keyset.keyset_columns, keyset.descending) == (2, None, ("created_at", "id"), False)
+
+
+def test_rest_list_query_params_parse_json_filters_and_sort_prefix():
+    query = dependencies.list_query_params('{"status": {"eq": "active"}}', "-name")
+
+    assert query.filter["status"].eq == "active"
+    assert (query.sort.field, query.sort.direction) == ("name", "DESC")
+    assert dependencies.list_query_params(None, "createdAt").sort.direction == "ASC"
+    assert dependencies.list_query_params() is None
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        dependencies.list_query_params('{"status": {"like": "a"}}')
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        dependencies.list_query_params("[1]")
+
+
+@pytest.mark.asyncio
+async def test_task_rest_list_forwards_the_list_query(monkeypatch):
+    service = SimpleNamespace(get_all=AsyncMock(return_value=[]))
+    monkeypatch.setattr(tasks, "service", service)
+    query = ListQueryModel.from_input({"status": {"eq": "done"}}, None)
+
+    await tasks.list_tasks(None, query, {"role": {"permissions": []}})
+
+    service.get_all.assert_awaited_once_with(None, query)
@@ -0,0 +1,126 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from graphql import GraphQLError
+from sqlalchemy.exc import DBAPIError
+
+from server.api.dependencies import request_unit_of_work
+from server.db import operation_deadline as deadline_module
+from server.db.operation_deadline import operation_deadline, operation_timeout_ms, remaining_ms
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.utils.custom_error_formatter_utils import custom_format_error
+from tests.test_unit_of_work import make_factory
+
+
+@pytest.fixture
+def timeouts(monkeypatch):
+    monkeypatch.setattr(deadline_module.settings, "OPERATION_TIMEOUT_MS", 1000)
+    monkeypatch.setattr(
+        deadline_module.settings, "OPERATION_TIMEOUTS", {"graphql companies": 20, "GET /items/{item_id}": 20}
+    )
+
+
+def test_each_operation_uses_its_own_budget_or_the_default(timeouts):
+    assert operation_timeout_ms("graphql companies") == 20
+    assert operation_timeout_ms("graphql tasks") == 1000
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_the_operation_and_releases_the_session(timeouts):
+    factory, log, sessions = make_factory()
+    cancelled = asyncio.Event()
+
+    async def slow_resolver():
+        async with factory():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        async with factory.unit_of_work(read_only=True):
+            async with operation_deadline("graphql companies"):
+                await asyncio.gather(slow_resolver(), slow_resolver())
+
+    assert (exc_info.value.code, exc_info.value.status_code) == ("OPERATION_TIMEOUT", 504)
+    assert exc_info.value.details == {"operation": "graphql companies", "timeoutMs": 20}
+    assert cancelled.is_set()
+    assert log[-2:] == [("rollback",), ("close",)] and sessions[0].closed
+    assert remaining_ms() is None
+
+
+@pytest.mark.asyncio
+async def test_session_inherits_the_remaining_budget_as_statement_timeout(timeouts):
+    factory, log, _ = make_factory()
+
+    async with factory.unit_of_work(read_only=True):
+        async with operation_deadline("graphql tasks"):
+            async with factory():
+                pass
+
+    assert log[0] == ("execute", "SET TRANSACTION READ ONLY")
+    timeout_ms = int(log[1][1].removeprefix("SET LOCAL statement_timeout = "))
+    assert 900 < timeout_ms <= 1000
+
+
+@pytest.mark.asyncio
+async def test_disabled_deadline_sets_no_statement_timeout(monkeypatch):
+    monkeypatch.setattr(deadline_module.settings, "OPERATION_TIMEOUT_MS", 0)
+    monkeypatch.setattr(deadline_module.settings, "OPERATION_TIMEOUTS", {})
+    factory, log, _ = make_factory()
+
+    async with factory.unit_of_work():
+        async with operation_deadline("graphql tasks"):
+            async with factory():
+                pass
+
+    assert not any("statement_timeout" in entry[-1] for entry in log)
+
+
+def test_postgres_statement_timeout_is_reported_as_operation_timeout():
+    error = DBAPIError("SELECT 1", {}, SimpleNamespace(sqlstate="57014"))
+
+    formatted = custom_format_error(GraphQLError("canceling statement", original_error=error))
+
+    assert formatted["extensions"]["code"] == "OPERATION_TIMEOUT"
+    other = custom_format_error(GraphQLError("x", original_error=DBAPIError("SELECT 1", {}, Exception("boom"))))
+    assert other["extensions"]["code"] == "INTERNAL_ERROR"
+
+
+def test_rest_routes_run_under_their_own_deadline(timeouts, monkeypatch):
+    factory, log, _ = make_factory()
+    monkeypatch.setattr("server.api.dependencies.unit_of_work", factory.unit_of_work)
+    router = APIRouter(dependencies=[Depends(request_unit_of_work)])
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: str):
+        async with factory():
+            await asyncio.sleep(1)
+        return {}
+
+    @router.get("/items")
+    async def list_items():
+        async with factory():
+            pass
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+
+    @app.exception_handler(CustomGraphQLExceptionHelper)
+    async def handler(_request, exc: CustomGraphQLExceptionHelper):
+        return JSONResponse(status_code=exc.status_code, content={"code": exc.code, "details": exc.details})
+
+    client = TestClient(app)
+    slow = client.get("/items/1")
+    assert slow.status_code == 504
+    assert slow.json()["code"] == "OPERATION_TIMEOUT"
+    assert slow.json()["details"] == {"operation": "GET /items/{item_id}", "timeoutMs": 20}
+    assert log[-2:] == [("rollback",), ("close",)]
+
+    assert client.get("/items").status_code == 200
@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.list_query_dto import ListQueryModel
+from server.repositories.company_repository import CompanyRepository
+from server.repositories.opportunity_repository import OpportunityRepository
+from server.repositories.role_repository import RoleRepository
+from server.repositories.user_repository import UserRepository
+from server.utils.pagination_utils import Page, decode_cursor, encode_cursor, page_size
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+ROW_ID = UUID("60000000-0000-0000-0000-000000000001")
+
+
+def fake_session(rows):
+    return SimpleNamespace(
+        execute=AsyncMock(return_value=SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows)))
+    )
+
+
+def compiled(session) -> str:
+    statement = session.execute.await_args.args[0]
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    cursor = encode_cursor([CREATED_AT, ROW_ID])
+
+    assert decode_cursor(cursor, 2) == [CREATED_AT.isoformat(), str(ROW_ID)]
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        decode_cursor("not-a-cursor", 2)
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        decode_cursor(cursor, 3)
+
+
+def test_page_size_applies_default_and_bounds():
+    assert page_size(None) == 50
+    assert page_size(10) == 10
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        page_size(0)
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        page_size(10_000)
+
+
+def test_page_to_connection_builds_edges_and_page_info():
+    page = Page(items=[1, 2], cursors=["a", "b"], has_next_page=True)
+
+    connection = page.to_connection(lambda item: {"id": item})
+
+    assert connection["nodes"] == [{"id": 1}, {"id": 2}]
+    assert connection["edges"][1] == {"cursor": "b", "node": {"id": 2}}
+    assert connection["pageInfo"] == {
+        "hasNextPage": True,
+        "hasPreviousPage": False,
+        "startCursor": "a",
+        "endCursor": "b",
+    }
+
+
+@pytest.mark.asyncio
+async def test_paginate_uses_keyset_predicate_instead_of_offset():
+    repository = CompanyRepository.__wrapped__()
+    rows = [SimpleNamespace(id=ROW_ID, created_at=CREATED_AT), SimpleNamespace(id=ROW_ID, created_at=CREATED_AT)]
+    session = fake_session(rows)
+    after = encode_cursor([CREATED_AT, ROW_ID], "created_at,id:desc")
+
+    page = await repository.find_page(
+        "10000000-0000-0000-0000-000000000001", {"scope": "ORGANIZATION"}, first=1, after=after, session=session
+    )
+
+    sql = compiled(session)
+    assert "(crm_companies.created_at, crm_companies.id) < (" in sql
+    assert "ORDER BY crm_companies.created_at DESC, crm_companies.id DESC" in sql
+    assert "LIMIT 2" in sql
+    assert "OFFSET" not in sql
+    assert page.items == rows[:1]
+    assert page.has_next_page is True
+    assert page.has_previous_page is True
+    assert decode_cursor(page.cursors[0], 2, "created_at,id:desc") == [CREATED_AT.isoformat(), str(ROW_ID)]
+
+
+@pytest.mark.asyncio
+async def test_role_pagination_uses_name_keyset_ascending():
+    repository = RoleRepository.__wrapped__()
+    session = fake_session([SimpleNamespace(id=ROW_ID, name="admin")])
+
+    page = await repository.find_page(first=5, after=encode_cursor(["a", ROW_ID], "name,id:asc"), session=session)
+
+    sql = compiled(session)
+    assert "(roles.name, roles.id) > (" in sql
+    assert "ORDER BY roles.name ASC, roles.id ASC" in sql
+    assert page.has_next_page is False
+
+
+@pytest.mark.asyncio
+async def test_user_pagination_keeps_the_name_order_of_the_full_list():
+    repository = UserRepository.__wrapped__()
+    session = fake_session([SimpleNamespace(id=ROW_ID, name="Ana")])
+
+    page = await repository.find_page(first=5, session=session)
+
+    assert "ORDER BY users.name ASC, users.id ASC" in compiled(session)
+    assert decode_cursor(page.cursors[0], 2, "name,id:asc") == ["Ana", str(ROW_ID)]
+
+
+@pytest.mark.asyncio
+async def test_paginate_rejects_cursor_with_invalid_values():
+    repository = CompanyRepository.__wrapped__()
+
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        await repository.paginate(
+            repository._scoped_statement(ROW_ID, {"scope": "ORGANIZATION"}),
+            after=encode_cursor(["yesterday", "nope"], "created_at,id:desc"),
+            session=fake_session([]),
+        )
+
+
+@pytest.mark.asyncio
+async def test_paginate_rejects_a_cursor_from_another_sort_or_with_a_non_numeric_value():
+    repository = OpportunityRepository.__wrapped__()
+    value_sort = repository.compile_list_query(
+        ListQueryModel.from_input(None, {"field": "value"}), ("organization_id",)
+    )
+    created_at_cursor = encode_cursor([CREATED_AT, ROW_ID], "created_at,id:desc")
+    statement = repository._scoped_statement(ROW_ID, {"scope": "ORGANIZATION"})
+
+    with pytest.raises(CustomGraphQLExceptionHelper, match="otro orden"):
+        await repository.paginate(statement, after=created_at_cursor, keyset=value_sort, session=fake_session([]))
+    with pytest.raises(CustomGraphQLExceptionHelper, match="Cursor inválido"):
+        await repository.paginate(
+            statement,
+            after=encode_cursor([CREATED_AT, ROW_ID], "value,id:desc"),
+            keyset=value_sort,
+            session=fake_session([]),
+        )
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from ariadne import graphql
+
+from server.decorators import require_token_decorator
+from server.enums.http_error_code_enum import HTTPErrorCode
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.password_hasher_helper import PasswordHasherHelper
+from server.schema import schema
+from tests.factories import make_current_user
+
+
+def make_hasher(**kwargs):
+    return PasswordHasherHelper.__wrapped__(rounds=4, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_run_in_executor():
+    hasher = make_hasher(max_workers=1, max_queue=1)
+
+    hashed = await hasher.hash("Secret123!")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("Secret123!", hashed) is True
+    assert await hasher.verify("Wrong123!", hashed) is False
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["pending"] == 0
+    assert stats["avgHashSeconds"] > 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_saturated():
+    hasher = make_hasher(max_workers=1, max_queue=0)
+    release = threading.Event()
+    blocked = asyncio.ensure_future(hasher._run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        await hasher.hash("Secret123!")
+
+    assert exc_info.value.code == HTTPErrorCode.SERVICE_UNAVAILABLE.code_name
+    release.set()
+    await blocked
+    assert hasher.stats()["rejected"] == 1
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_query_exposes_the_hasher_saturation(monkeypatch):
+    user = make_current_user(permissions=["activity.read", "roles.read"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    for name, value in {"pending": 2, "rejected": 5, "max_queue_wait_seconds": 0.25}.items():
+        monkeypatch.setattr(PasswordHasherHelper(), name, value)
+    request = SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={})
+
+    success, result = await graphql(
+        schema,
+        {"query": "{ cacheStats { data { passwordHasher { pending rejected maxQueueWaitSeconds } } } }"},
+        context_value={"request": request},
+    )
+
+    assert success, result
+    assert result["data"]["cacheStats"]["data"]["passwordHasher"] == {
+        "pending": 2,
+        "rejected": 5,
+        "maxQueueWaitSeconds": 0.25,
+    }
@@ -1,4 +1,5 @@
 from server.utils.permission_utils import (
+    compile_permissions,
     has_permission,
     normalize_permission,
     permission_set,
@@ -46,3 +47,26 @@ def test_permission_set_normalizes_mixed_permission_inputs():
 def test_has_permission_matches_case_and_whitespace_insensitively():
     assert has_permission([{"type": " Users ", "action": " Read "}], "users", "read") is True
     assert has_permission(["tasks.update"], "tasks", "delete") is False
+
+
+def test_compile_permissions_returns_frozenset_of_normalized_keys():
+    compiled = compile_permissions([{"type": "Users", "action": "READ"}, "tasks.Update", "invalid"])
+
+    assert compiled == frozenset({("users", "read"), ("tasks", "update")})
+    assert compile_permissions(compiled) is compiled
+
+
+def test_compile_permissions_memoizes_same_list_by_identity():
+    permissions = [{"type": "users", "action": "read"}]
+
+    assert compile_permissions(permissions) is compile_permissions(permissions)
+    assert compile_permissions(list(permissions)) == compile_permissions(permissions)
+    assert compile_permissions(permissions, memoize=False) is not compile_permissions(permissions)
+
+
+def test_has_permission_accepts_compiled_permissions():
+    compiled = compile_permissions(["users.read"])
+
+    assert has_permission(compiled, " Users ", "READ") is True
+    assert has_permission(compiled, "users", "delete") is False
+    assert has_permission(compiled, "", "read") is False
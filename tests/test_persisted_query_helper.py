@@ -0,0 +1,103 @@
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server import _parse_graphql_query_params
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.persisted_query_helper import (
+    PERSISTED_QUERY_NOT_FOUND,
+    PersistedQueryHelper,
+    PersistedQueryNotFoundError,
+)
+
+QUERY = "{ hello }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+def make_helper(stored=None, max_size=8):
+    helper = PersistedQueryHelper.__wrapped__(max_size=max_size)
+    helper._redis = SimpleNamespace(get_value=AsyncMock(return_value=stored), set_value=AsyncMock())
+    return helper
+
+
+def persisted(sha256_hash=QUERY_HASH, **data):
+    return {**data, "extensions": {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}}
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_passes_through_regular_requests():
+    helper = make_helper()
+    data = {"query": QUERY}
+
+    assert await helper.resolve(data) is data
+    helper._redis.get_value.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_hash_only_miss_asks_for_full_text():
+    helper = make_helper()
+
+    with pytest.raises(PersistedQueryNotFoundError) as exc_info:
+        await helper.resolve(persisted())
+
+    assert exc_info.value.code == PERSISTED_QUERY_NOT_FOUND
+    helper._redis.get_value.assert_awaited_once_with(f"apq:{QUERY_HASH}")
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_registers_text_and_serves_hash_only_requests_from_memory():
+    helper = make_helper()
+
+    await helper.resolve(persisted(query=QUERY))
+    resolved = await helper.resolve(persisted(operationName="Hello"))
+
+    assert resolved["query"] == QUERY
+    assert resolved["operationName"] == "Hello"
+    helper._redis.set_value.assert_awaited_once()
+    helper._redis.get_value.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_falls_back_to_redis_store():
+    helper = make_helper(stored=QUERY)
+
+    resolved = await helper.resolve(persisted())
+
+    assert resolved["query"] == QUERY
+    assert await helper.lookup(QUERY_HASH) == QUERY
+    helper._redis.get_value.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_rejects_hash_mismatch():
+    helper = make_helper()
+
+    with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+        await helper.resolve(persisted(sha256_hash="0" * 64, query=QUERY))
+
+    assert exc_info.value.message == "provided sha does not match query"
+    helper._redis.set_value.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_treats_redis_failures_as_miss():
+    helper = make_helper()
+    helper._redis.get_value.side_effect = ConnectionError("redis down")
+
+    with pytest.raises(PersistedQueryNotFoundError):
+        await helper.resolve(persisted())
+
+
+def test_graphql_get_params_decode_json_variables_and_extensions():
+    data = _parse_graphql_query_params(
+        {"query": QUERY, "variables": '{"id": "1"}', "extensions": '{"persistedQuery": {"version": 1}}'}
+    )
+
+    assert data == {"query": QUERY, "variables": {"id": "1"}, "extensions": {"persistedQuery": {"version": 1}}}
+
+
+def test_graphql_get_params_reject_invalid_json():
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        _parse_graphql_query_params({"extensions": "{not-json"})
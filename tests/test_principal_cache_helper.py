@@ -0,0 +1,96 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from server.helpers.principal_cache_helper import PRINCIPAL_INVALIDATION_CHANNEL, PrincipalCacheHelper
+from server.repositories.role_repository import RoleRepository
+
+USER_ID = "40000000-0000-0000-0000-000000000001"
+ROLE_ID = UUID("88888888-8888-8888-8888-888888888888")
+PRINCIPAL = {"id": USER_ID, "role": {"permissions": [{"type": "users", "action": "read"}]}}
+
+
+def make_cache(stored=None):
+    cache = PrincipalCacheHelper.__wrapped__()
+    cache._redis = SimpleNamespace(
+        get_value=AsyncMock(return_value=stored),
+        set_value=AsyncMock(),
+        delete_values=AsyncMock(),
+        publish_json=AsyncMock(),
+    )
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_serves_local_hits_without_redis():
+    cache = make_cache()
+
+    await cache.set(USER_ID, PRINCIPAL)
+
+    assert await cache.get(USER_ID) == PRINCIPAL
+    cache._redis.get_value.assert_not_awaited()
+    assert cache.stats()["localHits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_falls_back_to_redis_and_promotes_to_local():
+    cache = make_cache(stored=json.dumps(PRINCIPAL))
+
+    assert await cache.get(USER_ID) == PRINCIPAL
+    assert await cache.get(USER_ID) == PRINCIPAL
+
+    cache._redis.get_value.assert_awaited_once_with(f"principal:{USER_ID}")
+    assert cache.stats() == {"size": 1, "localHits": 1, "redisHits": 1, "misses": 0, "hitRatio": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_expires_local_entries(monkeypatch):
+    cache = make_cache()
+    cache.local_ttl_seconds = 10
+    now = [100.0]
+    monkeypatch.setattr("server.helpers.two_tier_cache_helper.time.monotonic", lambda: now[0])
+
+    await cache.set(USER_ID, PRINCIPAL)
+    now[0] = 111.0
+
+    assert await cache.get(USER_ID) is None
+    assert cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidation_clears_both_levels_and_notifies_workers():
+    cache = make_cache()
+    await cache.set(USER_ID, PRINCIPAL)
+
+    await cache.invalidate([USER_ID, None])
+
+    assert cache.stats()["size"] == 0
+    cache._redis.delete_values.assert_awaited_once_with(f"principal:{USER_ID}")
+    cache._redis.publish_json.assert_awaited_once_with(PRINCIPAL_INVALIDATION_CHANNEL, {"userIds": [USER_ID]})
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_tolerates_redis_failures():
+    cache = make_cache()
+    cache._redis.get_value.side_effect = ConnectionError("redis down")
+
+    assert await cache.get(USER_ID) is None
+
+
+@pytest.mark.asyncio
+async def test_role_permission_changes_invalidate_principals_of_role_members(monkeypatch):
+    role = SimpleNamespace(id=ROLE_ID, permissions=[])
+    scalar_result = SimpleNamespace(scalar_one_or_none=lambda: role)
+    session = SimpleNamespace(execute=AsyncMock(return_value=scalar_result), commit=AsyncMock(), refresh=AsyncMock())
+    user_repository = SimpleNamespace(find_ids_by_role=AsyncMock(return_value=[USER_ID]))
+    principal_cache = SimpleNamespace(invalidate=AsyncMock())
+    monkeypatch.setattr("server.repositories.role_repository.UserRepository", lambda: user_repository)
+    monkeypatch.setattr("server.repositories.role_repository.PrincipalCacheHelper", lambda: principal_cache)
+
+    await RoleRepository().remove_permissions(ROLE_ID, [], session=session)
+
+    user_repository.find_ids_by_role.assert_awaited_once_with(ROLE_ID)
+    principal_cache.invalidate.assert_awaited_once_with([USER_ID])
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server import _build_ws_auth_context
+from server.api import dependencies
+from server.api.dependencies import get_current_user
+from server.utils.principal_utils import get_principal_memo, resolve_principal_once
+
+
+@pytest.mark.asyncio
+async def test_resolve_principal_once_memoizes_by_token_in_graphql_context():
+    context = {}
+    loader = AsyncMock(return_value={"id": "user-1"})
+
+    first = await resolve_principal_once(context, "token", loader)
+    second = await resolve_principal_once(context, "token", loader)
+
+    assert first == second == {"id": "user-1"}
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_principal_once_does_not_share_different_tokens():
+    context = {}
+    loader = AsyncMock(side_effect=[{"id": "user-1"}, {"id": "user-2"}])
+
+    assert await resolve_principal_once(context, "token-1", loader) == {"id": "user-1"}
+    assert await resolve_principal_once(context, "token-2", loader) == {"id": "user-2"}
+
+
+def test_principal_memo_lives_in_request_state_for_rest():
+    request = SimpleNamespace(state=SimpleNamespace())
+
+    assert get_principal_memo(request) is get_principal_memo(request)
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reuses_request_memo(monkeypatch):
+    user_service = SimpleNamespace(get_user=AsyncMock(return_value={"id": "user-1"}))
+    monkeypatch.setattr(dependencies, "verify_token", lambda token: {"id": "user-1"})
+    monkeypatch.setattr(dependencies, "UserService", lambda: user_service)
+    request = SimpleNamespace(headers={"authorization": "Bearer token"}, cookies={}, state=SimpleNamespace())
+
+    await get_current_user(request)
+    await get_current_user(request)
+
+    user_service.get_user.assert_awaited_once_with("user-1")
+
+
+@pytest.mark.asyncio
+async def test_ws_auth_context_seeds_principal_memo(monkeypatch):
+    from server.services import user_service as user_service_module
+    from server.utils import auth_utils
+
+    user_service = SimpleNamespace(get_user=AsyncMock(return_value={"id": "user-1"}))
+    monkeypatch.setattr(auth_utils, "verify_token", lambda token: {"id": "user-1"})
+    monkeypatch.setattr(user_service_module, "UserService", lambda: user_service)
+    websocket = SimpleNamespace(headers={})
+
+    context = await _build_ws_auth_context(websocket, {"authorization": "Bearer ws-token"})
+    memoized = await resolve_principal_once(context, "ws-token", AsyncMock())
+
+    assert context["current_user"] == {"id": "user-1"}
+    assert memoized == {"id": "user-1"}
+    user_service.get_user.assert_awaited_once_with("user-1")
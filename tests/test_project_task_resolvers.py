@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock
 import pytest
 
 from server.decorators import require_token_decorator
+from server.enums.http_error_code_enum import HTTPErrorCode
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.schema.projects.resolver import ProjectResolver
 from server.schema.tasks.resolver import TaskResolver
@@ -76,3 +77,26 @@ async def test_task_resolver_rejects_missing_permission(monkeypatch):
         await resolver.resolve_complete_task(None, make_info(["tasks.read"]), str(TASK_ID))
 
     assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_task_resolver_create_checks_the_project_scope_like_the_bulk_create(monkeypatch):
+    user = make_current_user(permissions=["tasks.create"])
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": "user-1"})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    resolver = TaskResolver()
+    resolver._TaskResolver__service = SimpleNamespace(create=AsyncMock())
+    denied = CustomGraphQLExceptionHelper("Permiso denegado", HTTPErrorCode.FORBIDDEN)
+    resolver._TaskResolver__authorization = SimpleNamespace(authorize_or_raise=AsyncMock(side_effect=denied))
+
+    with pytest.raises(CustomGraphQLExceptionHelper):
+        await resolver.resolve_create_task(
+            None, make_info(["tasks.create"]), {"projectId": str(PROJECT_ID), "title": "Plan"}
+        )
+
+    resolver._TaskResolver__authorization.authorize_or_raise.assert_awaited_once_with(
+        user, "tasks", "create", context={"project_id": str(PROJECT_ID)}
+    )
+    resolver._TaskResolver__service.create.assert_not_awaited()
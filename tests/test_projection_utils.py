@@ -0,0 +1,88 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+from graphql import parse
+
+from server.models.dto.company_dto import CompanyItemModel
+from server.repositories.company_repository import CompanyRepository
+from server.repositories.user_repository import UserRepository
+from server.utils.projection_utils import attribute_names, requested_fields, serialize_projection
+
+COMPANY_ID = UUID("70000000-0000-0000-0000-000000000001")
+
+
+def info_for(query: str):
+    document = parse(query)
+    operation = document.definitions[0]
+    fragments = {definition.name.value: definition for definition in document.definitions[1:]}
+    return SimpleNamespace(field_nodes=operation.selection_set.selections, fragments=fragments)
+
+
+def test_requested_fields_follows_paths_fragments_and_skips_typename():
+    info = info_for(
+        """
+        {
+          companies {
+            data { id ...CompanyFields }
+            edges { node { ... on Company { createdAt } } }
+            pageInfo { endCursor }
+          }
+        }
+        fragment CompanyFields on Company { name __typename }
+        """
+    )
+
+    assert requested_fields(info, ("data",), ("edges", "node")) == frozenset({"id", "name", "createdAt"})
+    assert requested_fields(info) == frozenset({"data", "edges", "pageInfo"})
+
+
+def test_attribute_names_maps_graphql_aliases_to_model_attributes():
+    assert attribute_names(CompanyItemModel, {"id", "archivedAt", "name", "unknown"}) == frozenset(
+        {"id", "archived_at", "name"}
+    )
+
+
+def test_serialize_projection_only_reads_projected_attributes():
+    class Row:
+        id = COMPANY_ID
+        name = "Acme"
+
+        @property
+        def address(self):
+            raise AssertionError("columna diferida leída")
+
+    result = serialize_projection(CompanyItemModel, Row(), frozenset({"id", "name"}), by_alias=True, mode="json")
+
+    assert result == {"id": str(COMPANY_ID), "name": "Acme"}
+
+
+def test_projection_options_load_only_requested_columns():
+    repository = CompanyRepository.__wrapped__()
+    stmt = repository._scoped_statement(COMPANY_ID, {"scope": "ORGANIZATION"}).options(
+        *repository.projection_options({"name"})
+    )
+
+    sql = str(stmt.compile())
+    selected = sql.split("FROM")[0]
+    assert "crm_companies.name" in selected
+    assert "crm_companies.created_at" in selected
+    assert "crm_companies.address" not in selected
+    assert "crm_companies.description" not in selected
+
+
+def test_projection_options_skip_relationship_eager_loads_unless_requested():
+    repository = UserRepository.__wrapped__()
+
+    assert len(repository.projection_options({"name"})) == 1
+    assert len(repository.projection_options({"name", "role"})) == 1 + len(repository.load_options)
+
+
+def test_projection_serialization_keeps_datetimes_json_ready():
+    row = SimpleNamespace(id=COMPANY_ID, created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+    result = serialize_projection(
+        CompanyItemModel, row, frozenset({"id", "created_at"}), by_alias=True, mode="json", exclude_none=True
+    )
+
+    assert result == {"id": str(COMPANY_ID), "createdAt": "2026-01-01T00:00:00Z"}
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from graphql import parse
+
+from server.db.query_stats import current_query_stats, instrument_engine, record_statement, track_queries
+from server.decorators import require_token_decorator
+from server.middlewares import query_stats_middleware
+from server.repositories.company_repository import CompanyRepository
+from server.schema.companies.resolver import CompanyResolver
+from server.schema.tasks.resolver import TaskResolver
+from server.services.authorization_service import AuthorizationService
+from server.services.company_service import CompanyService
+from tests.factories import make_current_user
+
+ORG_ID = "10000000-0000-0000-0000-000000000001"
+TEAM_ID = "20000000-0000-0000-0000-000000000001"
+USER_ID = "40000000-0000-0000-0000-000000000001"
+
+
+def graphql_info(document: str, permissions):
+    return SimpleNamespace(
+        context={
+            "request": SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={}),
+            "test_permissions": permissions,
+        },
+        field_nodes=parse(document).definitions[0].selection_set.selections,
+        fragments={},
+    )
+
+
+def login_as(monkeypatch, permissions):
+    user = make_current_user(id=USER_ID, permissions=permissions)
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    return user
+
+
+def test_track_queries_accumulates_statements_rows_and_time_only_inside_the_block():
+    record_statement("SELECT 0", 5, 1.0)
+
+    with track_queries("graphql tasks", capture_sql=True) as stats:
+        record_statement("SELECT 1", 3, 1.5)
+        record_statement("UPDATE tasks", -1, 0.5)
+        assert current_query_stats() is stats
+
+    assert current_query_stats() is None
+    assert stats.to_dict() == {"label": "graphql tasks", "statements": 2, "rows": 3, "elapsedMs": 2.0}
+    assert stats.sql == ["SELECT 1", "UPDATE tasks"]
+    assert stats.server_timing() == 'db;dur=2.000;desc="2 statements, 3 rows"'
+
+
+def test_instrument_engine_records_each_cursor_execute(monkeypatch):
+    listeners = {}
+    monkeypatch.setattr(
+        "server.db.query_stats.event.listens_for",
+        lambda target, name: lambda handler: listeners.setdefault(name, handler),
+    )
+    instrument_engine(SimpleNamespace(sync_engine=object()))
+    connection = SimpleNamespace(info={})
+
+    with track_queries("GET /api/v1/tasks") as stats:
+        listeners["before_cursor_execute"](connection, None, "SELECT 1", {}, None, False)
+        listeners["after_cursor_execute"](connection, SimpleNamespace(rowcount=4), "SELECT 1", {}, None, False)
+
+    assert (stats.statements, stats.rows) == (1, 4)
+    assert connection.info["query_started_at"] == []
+
+
+@pytest.mark.asyncio
+async def test_task_list_budget_is_a_single_query(monkeypatch, sql_session, assert_max_queries):
+    login_as(monkeypatch, ["tasks.read"])
+    resolve_tasks = TaskResolver().query._resolvers["tasks"]
+
+    with assert_max_queries(1) as stats:
+        result = await resolve_tasks(None, graphql_info("{ tasks { data { id title } } }", ["tasks.read"]), first=5)
+
+    assert result.data == []
+    assert "FROM tasks" in stats.sql[0]
+
+
+@pytest.mark.asyncio
+async def test_crm_list_budget_is_access_lookup_plus_page(monkeypatch, sql_session, assert_max_queries):
+    login_as(monkeypatch, ["companies.read"])
+    sql_session.queue(SimpleNamespace(scope="TEAM", team_id=TEAM_ID, user_id=USER_ID, role="member"))
+    resolver = CompanyResolver()
+    resolver.service = CompanyService.__wrapped__()
+    resolver.service.repository = CompanyRepository.__wrapped__()
+    resolver.authorization = AuthorizationService.__wrapped__()
+    resolve_companies = resolver.query._resolvers["companies"]
+    info = graphql_info("{ companies(organizationId: 1) { data { id name } } }", ["companies.read"])
+
+    with assert_max_queries(2) as stats:
+        result = await resolve_companies(None, info, ORG_ID, filter={"status": {"eq": "active"}})
+
+    assert result.data == []
+    assert "crm_team_members" in stats.sql[0]
+    assert "crm_companies.team_id = " in stats.sql[1] and "crm_companies.status = " in stats.sql[1]
+
+
+@pytest.mark.asyncio
+async def test_assert_max_queries_reports_the_executed_statements(assert_max_queries):
+    with pytest.raises(AssertionError, match="2 statements SQL \\(máximo 1\\)"):
+        with assert_max_queries(1):
+            record_statement("SELECT 1")
+            record_statement("SELECT 2")
+
+
+def test_budget_warning_only_when_the_operation_exceeds_it(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(query_stats_middleware.settings, "SQL_QUERY_BUDGET_WARNING", 2)
+    monkeypatch.setattr(query_stats_middleware.LoggerHelper, "warning", warnings.append)
+
+    with track_queries("graphql companies") as stats:
+        record_statement("SELECT 1")
+        record_statement("SELECT 2")
+    query_stats_middleware.report_query_stats(stats)
+    record = SimpleNamespace(**{**stats.__dict__, "statements": 3})
+    query_stats_middleware.report_query_stats(record)
+
+    assert warnings == ["SQL graphql companies: 3 statements, 0 filas, 0.0 ms (presupuesto 2)"]
@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
@@ -69,3 +70,25 @@ async def test_require_token_rejects_payload_without_user_id(monkeypatch):
 
     assert exc_info.value.status_code == 401
     assert exc_info.value.message == "Token inválido"
+
+
+@pytest.mark.asyncio
+async def test_require_token_resolves_principal_once_per_operation(monkeypatch):
+    user = {"id": "user-1", "role": {"permissions": []}}
+    user_service = SimpleNamespace(get_user=AsyncMock(return_value=user))
+    verify_calls = []
+
+    def fake_verify_token(token):
+        verify_calls.append(token)
+        return {"id": "user-1"}
+
+    monkeypatch.setattr(require_token_decorator, "verify_token", fake_verify_token)
+    monkeypatch.setattr(require_token_decorator, "UserService", lambda: user_service)
+
+    info = make_info(headers={"authorization": "Bearer access-token"})
+    target = ResolverTarget()
+    results = await asyncio.gather(*(target.protected(None, info) for _ in range(5)))
+
+    assert results == [user] * 5
+    assert verify_calls == ["access-token"]
+    user_service.get_user.assert_awaited_once_with("user-1")
@@ -4,9 +4,11 @@ from unittest.mock import AsyncMock
 import pytest
 
 from server import create_app
+from server.api import crud_router
 from server.api.dependencies import get_current_user, require_rest_permission
 from server.api.v1 import projects
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.models.dto.company_dto import CreateCompanyModel, UpdateCompanyModel
 
 
 def user_with(*permissions):
@@ -61,3 +63,25 @@ async def test_rest_project_list_delegates_to_existing_service(monkeypatch):
 
     assert response["data"] == [{"id": "project-1"}]
     service.get_all.assert_awaited_once_with(False)
+
+
+@pytest.mark.asyncio
+async def test_scoped_crud_router_lists_with_limit_and_cursor(monkeypatch):
+    connection = {
+        "nodes": [{"id": "company-1"}],
+        "edges": [{"cursor": "c1", "node": {"id": "company-1"}}],
+        "pageInfo": {"hasNextPage": False, "hasPreviousPage": True, "startCursor": "c1", "endCursor": "c1"},
+    }
+    service = SimpleNamespace(get_page=AsyncMock(return_value=connection))
+    access = {"scope": "ORGANIZATION", "team_id": None}
+    monkeypatch.setattr(
+        crud_router, "AuthorizationService", lambda: SimpleNamespace(resolve_access=AsyncMock(return_value=access))
+    )
+    router = crud_router.build_scoped_crud_router("companies", service, CreateCompanyModel, UpdateCompanyModel)
+    list_resources = next(route.endpoint for route in router.routes if route.path == "/companies")
+
+    response = await list_resources("org-1", limit=10, cursor="c0", list_query=None, user=user_with("companies.read"))
+
+    assert response["data"] == [{"id": "company-1"}]
+    assert response["pageInfo"]["endCursor"] == "c1"
+    service.get_page.assert_awaited_once_with("org-1", access, first=10, after="c0", list_query=None)
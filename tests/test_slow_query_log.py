@@ -0,0 +1,106 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from server.db.query_stats import track_queries
+from server.decorators import require_token_decorator
+from server.helpers import slow_query_log_helper
+from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
+from server.helpers.slow_query_log_helper import SlowQueryLogHelper, redact_parameters
+from server.schema.slow_queries.resolver import SlowQueryResolver
+from tests.factories import make_current_user
+
+PLAN = [{"Plan": {"Node Type": "Seq Scan", "Relation Name": "tasks"}}]
+
+
+def make_log(threshold_ms=100, sample_rate=1.0):
+    log = SlowQueryLogHelper.__wrapped__()
+    log.threshold_ms = threshold_ms
+    log.explain_sample_rate = sample_rate
+    log._redis = SimpleNamespace(push_capped=AsyncMock(), list_range=AsyncMock(return_value=[]))
+    return log
+
+
+def test_parameters_keep_their_shape_but_not_their_values():
+    parameters = ("secret@example.com", 42, None, True, ["a", 1.5])
+
+    assert redact_parameters(parameters) == ["<str>", "<int>", None, True, ["<str>", "<float>"]]
+    assert redact_parameters({"email": "secret@example.com"}) == {"email": "<str>"}
+
+
+def test_statements_under_the_threshold_are_ignored_and_slow_ones_log_their_operation(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(slow_query_log_helper.LoggerHelper, "warning", warnings.append)
+    log = make_log()
+
+    log.observe("SELECT 1", (), 99.0)
+    with track_queries("graphql companies"):
+        log.observe("SELECT * FROM crm_companies WHERE email = $1", ("a@b.c",), 250.0)
+
+    [entry] = list(log._entries)
+    assert (entry["operation"], entry["durationMs"], entry["parameters"]) == ("graphql companies", 250.0, ["<str>"])
+    assert "a@b.c" not in warnings[0] and "250.0 ms" in warnings[0]
+
+
+@pytest.mark.asyncio
+async def test_sampled_slow_statements_capture_their_plan_in_a_separate_task():
+    log = make_log()
+    log._engine = object()
+    calls = []
+
+    async def explain(statement, parameters):
+        calls.append((statement, parameters))
+        # Lo que se ejecute durante la captura no vuelve a registrarse como consulta lenta
+        log.observe("EXPLAIN (FORMAT JSON) SELECT 1", (), 500.0)
+        return PLAN
+
+    log.explain = explain
+    log.observe("SELECT * FROM tasks WHERE status = $1", ("todo",), 300.0)
+    log.observe("BEGIN", (), 300.0)
+    await asyncio.gather(*log._pending)
+
+    assert calls == [("SELECT * FROM tasks WHERE status = $1", ("todo",))]
+    plans = {entry["statement"]: entry["plan"] for entry in log._entries}
+    assert plans == {"SELECT * FROM tasks WHERE status = $1": PLAN, "BEGIN": None}
+    assert log._redis.push_capped.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_recent_reads_the_shared_buffer_and_falls_back_to_the_local_one():
+    log = make_log()
+    log._redis.list_range.return_value = ['{"id": "1", "statement": "SELECT 1"}']
+
+    assert await log.recent(5) == [{"id": "1", "statement": "SELECT 1"}]
+    log._redis.list_range.assert_awaited_once_with("slow_queries", 0, 4)
+
+    log._entries.appendleft({"id": "local"})
+    log._redis.list_range.side_effect = ConnectionError("redis caído")
+    assert await log.recent(5) == [{"id": "local"}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("permissions", "allowed"),
+    [(["activity.read"], False), (["roles.read"], False), (["activity.read", "roles.read"], True)],
+)
+async def test_slow_queries_query_is_admin_only(monkeypatch, permissions, allowed):
+    user = make_current_user(permissions=permissions)
+    monkeypatch.setattr(require_token_decorator, "verify_token", lambda token: {"id": user["id"]})
+    monkeypatch.setattr(
+        require_token_decorator, "UserService", lambda: SimpleNamespace(get_user=AsyncMock(return_value=user))
+    )
+    resolver = SlowQueryResolver()
+    resolver._SlowQueryResolver__slow_queries = SimpleNamespace(recent=AsyncMock(return_value=[{"id": "1"}]))
+    info = SimpleNamespace(
+        context={"request": SimpleNamespace(headers={"authorization": "Bearer test-token"}, cookies={})}
+    )
+
+    if not allowed:
+        with pytest.raises(CustomGraphQLExceptionHelper) as exc_info:
+            await resolver.query._resolvers["slowQueries"](None, info, limit=10)
+        assert exc_info.value.status_code == 403
+        return
+    result = await resolver.query._resolvers["slowQueries"](None, info, limit=10)
+    assert result.data == [{"id": "1"}]
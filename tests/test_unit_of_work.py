@@ -0,0 +1,204 @@
+import asyncio
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from server.api.dependencies import request_unit_of_work
+from server.db.unit_of_work import UnitOfWorkSessionFactory, after_commit, current_unit_of_work
+
+
+class FakeSession:
+    def __init__(self, log):
+        self.log = log
+        self.closed = False
+
+    async def execute(self, statement):
+        self.log.append(("execute", str(statement)))
+
+    async def flush(self):
+        self.log.append(("flush",))
+
+    async def commit(self):
+        self.log.append(("commit",))
+
+    async def rollback(self):
+        self.log.append(("rollback",))
+
+    async def close(self):
+        self.closed = True
+        self.log.append(("close",))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        await self.close()
+
+
+def make_factory():
+    log, sessions = [], []
+
+    def session_factory():
+        session = FakeSession(log)
+        sessions.append(session)
+        return session
+
+    return UnitOfWorkSessionFactory(session_factory), log, sessions
+
+
+@pytest.mark.asyncio
+async def test_outside_unit_of_work_returns_a_regular_session():
+    factory, _, sessions = make_factory()
+
+    async with factory() as session:
+        assert session is sessions[0]
+
+    assert sessions[0].closed is True
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_shares_one_session_and_commits_once():
+    factory, log, sessions = make_factory()
+
+    async with factory.unit_of_work() as uow:
+        async with factory() as first:
+            await first.commit()
+            await first.close()
+        async with factory() as second:
+            await second.commit()
+
+    assert len(sessions) == 1
+    assert first._session is second._session
+    assert log == [("flush",), ("flush",), ("commit",), ("close",)]
+    assert uow.committed is True
+
+
+@pytest.mark.asyncio
+async def test_read_only_unit_of_work_sets_transaction_and_rolls_back():
+    factory, log, _ = make_factory()
+
+    async with factory.unit_of_work(read_only=True) as uow:
+        async with factory() as session:
+            await session.execute("SELECT 1")
+
+    assert log[0] == ("execute", "SET TRANSACTION READ ONLY")
+    assert log[-2:] == [("rollback",), ("close",)]
+    assert uow.committed is False
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_without_database_access_opens_no_session():
+    factory, _, sessions = make_factory()
+
+    async with factory.unit_of_work():
+        pass
+
+    assert sessions == []
+
+
+@pytest.mark.asyncio
+async def test_errors_roll_back_the_whole_operation():
+    factory, log, _ = make_factory()
+
+    with pytest.raises(RuntimeError):
+        async with factory.unit_of_work():
+            async with factory() as session:
+                await session.commit()
+            async with factory():
+                raise RuntimeError("flush fallido")
+
+    assert ("commit",) not in log
+    assert log[-2:] == [("rollback",), ("close",)]
+
+    log.clear()
+    async with factory.unit_of_work() as uow:
+        async with factory():
+            pass
+        uow.mark_rollback()
+
+    assert log == [("rollback",), ("close",)]
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_run_once_the_transaction_is_committed():
+    factory, log, _ = make_factory()
+
+    async def invalidate():
+        log.append(("invalidate",))
+
+    async with factory.unit_of_work():
+        async with factory() as session:
+            await session.commit()
+            await after_commit(invalidate)
+        assert ("invalidate",) not in log
+
+    assert log == [("flush",), ("commit",), ("close",), ("invalidate",)]
+
+    log.clear()
+    with pytest.raises(RuntimeError):
+        async with factory.unit_of_work():
+            async with factory():
+                await after_commit(invalidate)
+            raise RuntimeError("operación fallida")
+    await after_commit(invalidate)
+
+    # Tras el rollback se descarta; sin unit of work corre en el acto
+    assert log == [("rollback",), ("close",), ("invalidate",)]
+
+
+@pytest.mark.asyncio
+async def test_independent_session_bypasses_the_unit_of_work():
+    factory, log, sessions = make_factory()
+
+    async with factory.unit_of_work():
+        async with factory.independent() as session:
+            await session.commit()
+
+    assert len(sessions) == 1
+    assert log == [("commit",), ("close",)]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_take_turns_on_the_shared_session():
+    factory, _, _ = make_factory()
+    active, overlaps = [], []
+
+    async def resolver():
+        async with factory():
+            active.append(1)
+            overlaps.append(len(active))
+            await asyncio.sleep(0)
+            async with factory():
+                pass
+            active.pop()
+
+    async with factory.unit_of_work():
+        await asyncio.gather(*(resolver() for _ in range(5)))
+
+    assert max(overlaps) == 1
+
+
+def test_rest_dependency_opens_read_only_unit_of_work_for_get_only():
+    seen = {}
+    router = APIRouter(dependencies=[Depends(request_unit_of_work)])
+
+    @router.get("/items")
+    async def list_items():
+        seen["GET"] = current_unit_of_work().read_only
+        return {}
+
+    @router.post("/items")
+    async def create_item():
+        seen["POST"] = current_unit_of_work().read_only
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+
+    client.get("/items")
+    client.post("/items")
+
+    assert seen == {"GET": True, "POST": False}
+    assert current_unit_of_work() is None
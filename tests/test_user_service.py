@@ -4,6 +4,7 @@ from uuid import UUID
 
 import pytest
 
+from server.db.unit_of_work import UnitOfWorkSessionFactory
 from server.helpers.custom_graphql_exception_helper import CustomGraphQLExceptionHelper
 from server.services.user_service import UserService
 
@@ -42,6 +43,7 @@ async def test_update_user_validates_role_updates_and_publishes_payload():
     service._UserService__role_service = role_service
     service._UserService__redis = redis
     service._UserService__event_publisher = publisher
+    service._UserService__principal_cache = SimpleNamespace(invalidate=AsyncMock())
 
     result = await service.update_user(str(USER_ID), {"name": "Grace B.", "role_id": str(ROLE_ID)})
 
@@ -49,10 +51,12 @@ async def test_update_user_validates_role_updates_and_publishes_payload():
     assert result["role"]["id"] == str(ROLE_ID)
     role_service.get_role.assert_awaited_once_with(str(ROLE_ID))
     repository.update.assert_awaited_once_with(str(USER_ID), {"name": "Grace B.", "role_id": str(ROLE_ID)})
+    repository.find_by_id.assert_not_awaited()
     publisher.notify.assert_awaited_once()
     event = publisher.notify.await_args.args[0]
     assert event.user_id == str(USER_ID)
     assert event.payload == result
+    service._UserService__principal_cache.invalidate.assert_awaited_once_with([str(USER_ID)])
 
 
 @pytest.mark.asyncio
@@ -69,3 +73,71 @@ async def test_update_user_rejects_missing_role_before_updating():
 
     assert exc_info.value.message == "Role not found"
     repository.update.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_serves_cached_principal_without_querying():
+    repository = SimpleNamespace(aggregate_user_with_role_permissions=AsyncMock())
+    principal_cache = SimpleNamespace(get=AsyncMock(return_value={"id": str(USER_ID)}), set=AsyncMock())
+
+    service = UserService()
+    service._UserService__repository = repository
+    service._UserService__principal_cache = principal_cache
+
+    assert await service.get_user(str(USER_ID)) == {"id": str(USER_ID)}
+    repository.aggregate_user_with_role_permissions.assert_not_called()
+    principal_cache.set.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_loads_and_caches_principal_on_miss():
+    principal = {"id": str(USER_ID), "role": {"permissions": [{"type": "users", "action": "read"}]}}
+    repository = SimpleNamespace(aggregate_user_with_role_permissions=AsyncMock(return_value=principal))
+    principal_cache = SimpleNamespace(get=AsyncMock(return_value=None), set=AsyncMock())
+
+    service = UserService()
+    service._UserService__repository = repository
+    service._UserService__principal_cache = principal_cache
+
+    assert await service.get_user(str(USER_ID)) == principal
+    repository.aggregate_user_with_role_permissions.assert_awaited_once_with(str(USER_ID))
+    principal_cache.set.assert_awaited_once_with(str(USER_ID), principal)
+
+
+@pytest.mark.asyncio
+async def test_delete_user_invalidates_cached_principal():
+    repository = SimpleNamespace(delete=AsyncMock(return_value=True))
+    principal_cache = SimpleNamespace(invalidate=AsyncMock())
+    crm_counters = SimpleNamespace(release_owner=AsyncMock())
+
+    service = UserService()
+    service._UserService__repository = repository
+    service._UserService__principal_cache = principal_cache
+    service._UserService__crm_counters = crm_counters
+
+    assert await service.delete_user(str(USER_ID)) is True
+    principal_cache.invalidate.assert_awaited_once_with([str(USER_ID)])
+    crm_counters.release_owner.assert_awaited_once_with(str(USER_ID))
+
+
+@pytest.mark.asyncio
+async def test_update_user_inside_a_unit_of_work_invalidates_and_publishes_after_commit():
+    publisher = SimpleNamespace(notify=AsyncMock())
+    principal_cache = SimpleNamespace(invalidate=AsyncMock())
+    session = SimpleNamespace(commit=AsyncMock(), close=AsyncMock())
+
+    service = UserService()
+    service._UserService__repository = SimpleNamespace(update=AsyncMock(return_value=make_user()))
+    service._UserService__event_publisher = publisher
+    service._UserService__principal_cache = principal_cache
+
+    factory = UnitOfWorkSessionFactory(lambda: session)
+    async with factory.unit_of_work() as uow:
+        uow._session = session
+        await service.update_user(str(USER_ID), {"name": "Grace B."})
+        principal_cache.invalidate.assert_not_awaited()
+        publisher.notify.assert_not_awaited()
+
+    session.commit.assert_awaited_once()
+    principal_cache.invalidate.assert_awaited_once_with([str(USER_ID)])
+    publisher.notify.assert_awaited_once()